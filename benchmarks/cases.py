@@ -0,0 +1,227 @@
+"""
+Benchmark cases.
+
+Every case is a function decorated with `case`, which prepares its data
+and returns a callable timed by the runner. Data is generated from fixed
+seeds, so results of different runs are comparable.
+"""
+import datetime
+import random
+
+from paramap import fields, registry
+from paramap.types import IntegerType, MapObject, StringType
+
+CASES = {}
+
+
+def case(name, number=1000):
+    """Registers benchmark case
+
+    Args:
+        name (str): unique case name
+        number (int, optional): calls of the returned callable
+                                in a single measurement
+    """
+    def decorator(function):
+        CASES[name] = (function, number)
+        return function
+
+    return decorator
+
+
+def flat_schema(width, name='FlatMap', offset=0):
+    """
+    Returns MapObject class with width scalar fields of mixed types
+    """
+    kinds = (fields.String, fields.Integer, fields.Float, fields.Bool)
+
+    return type(name, (MapObject,), {
+        f'field_{index}': kinds[index % len(kinds)](
+            param=f'PARAM_{index + offset}',
+            required=index % 2 == 0,
+        )
+        for index in range(width)
+    })
+
+
+def flat_parameters(width, seed=0):
+    """
+    Returns parameters for `flat_schema` of the same width
+    """
+    rng = random.Random(seed)
+
+    return {
+        f'PARAM_{index}': str(rng.randint(0, 1000))
+        for index in range(width)
+    }
+
+
+@case('construction.flat_20')
+def construction_flat():
+    schema = flat_schema(20)
+    parameters = flat_parameters(20)
+
+    return lambda: schema(parameters)
+
+
+@case('construction.flat_20_map_many', number=10)
+def construction_flat_many():
+    schema = flat_schema(20)
+    rows = [flat_parameters(20, seed) for seed in range(100)]
+
+    return lambda: schema.map_many(rows)
+
+
+@case('construction.nested_chain_10')
+def construction_nested_chain():
+    schema = flat_schema(5, 'Level0')
+
+    for depth in range(1, 10):
+        schema = type(f'Level{depth}', (MapObject,), {
+            'value': fields.Integer(param=f'PARAM_{depth}'),
+            'child': fields.Nested(schema),
+        })
+
+    parameters = flat_parameters(10)
+
+    return lambda: schema(parameters)
+
+
+@case('fields.list_integers_1000', number=100)
+def list_integers():
+    field = fields.List(IntegerType)
+    values = [str(value) for value in range(1000)]
+
+    return lambda: field.resolve(values)
+
+
+@case('fields.list_integers_1000_compact', number=100)
+def list_integers_compact():
+    field = fields.List(IntegerType, compact=True)
+    values = list(range(1000))
+
+    return lambda: field.resolve(values)
+
+
+@case('fields.list_nested_100', number=100)
+def list_nested():
+    item = flat_schema(5, 'Item')
+    schema = type('ListMap', (MapObject,), {
+        'items': fields.List(item, param='ITEMS'),
+    })
+    parameters = {
+        'ITEMS': [flat_parameters(5, seed) for seed in range(100)],
+    }
+
+    return lambda: schema(parameters)
+
+
+@case('fields.map_1000', number=100)
+def map_field():
+    codes = {f'CODE_{index}': f'Name {index}' for index in range(50)}
+    field = fields.Map(StringType, map=codes)
+    rng = random.Random(0)
+    values = [f'CODE_{rng.randint(0, 60)}' for _ in range(1000)]
+
+    return lambda: [field.resolve(value) for value in values]
+
+
+@case('fields.map_1000_frozen', number=100)
+def map_field_frozen():
+    codes = {f'CODE_{index}': f'Name {index}' for index in range(50)}
+    field = fields.Map(StringType, map=codes, frozen=True)
+    rng = random.Random(0)
+    values = [f'CODE_{rng.randint(0, 60)}' for _ in range(1000)]
+
+    return lambda: field.resolve_column(values)
+
+
+@case('fields.date_1000', number=100)
+def date_field():
+    field = fields.Date(format='%Y-%m-%d %H:%M:%S')
+    start = datetime.datetime(2020, 1, 1)
+    rng = random.Random(0)
+    values = [
+        start + datetime.timedelta(hours=rng.randint(0, 24 * 30))
+        for _ in range(1000)
+    ]
+
+    return lambda: [field.resolve(value) for value in values]
+
+
+def serialization_instance():
+    schema = flat_schema(20)
+    parameters = flat_parameters(20)
+
+    # every third parameter is missing, to have some None values
+    for index in range(0, 20, 3):
+        parameters.pop(f'PARAM_{index}')
+
+    return schema(parameters)
+
+
+@case('serialization.to_dict')
+def to_dict():
+    instance = serialization_instance()
+
+    return lambda: instance.to_dict()
+
+
+@case('serialization.to_dict_keep_none')
+def to_dict_keep_none():
+    instance = serialization_instance()
+
+    return lambda: instance.to_dict(skip_none=False)
+
+
+@case('serialization.to_json')
+def to_json():
+    instance = serialization_instance()
+
+    return lambda: instance.to_json()
+
+
+@case('parameters.mapobject')
+def mapobject_parameters():
+    instance = flat_schema(20)()
+
+    return lambda: instance.parameters
+
+
+def registry_schemas(count):
+    return [
+        flat_schema(10, f'Schema{index}', offset=index)
+        for index in range(count)
+    ]
+
+
+def registry_register(count):
+    schemas = registry_schemas(count)
+
+    def run():
+        local_registry = registry.Registry()
+
+        for schema in schemas:
+            local_registry.register(schema)
+
+        return local_registry
+
+    return run
+
+
+def registry_parameters(count):
+    local_registry = registry.Registry()
+
+    for schema in registry_schemas(count):
+        local_registry.register(schema)
+
+    return lambda: local_registry.parameters
+
+
+for count, number in ((10, 100), (100, 10), (1000, 1)):
+    case(f'registry.register_{count}', number=number)(
+        lambda count=count: registry_register(count)
+    )
+    case(f'registry.parameters_{count}', number=1000)(
+        lambda count=count: registry_parameters(count)
+    )
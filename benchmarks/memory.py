@@ -0,0 +1,210 @@
+"""
+Measures memory footprint of MapObject instances with tracemalloc.
+
+Usage:
+    python -m benchmarks.memory [module:Schema -p parameters.json] [-n 1000]
+
+Without a schema, a sample schema using all field kinds is measured.
+Schemas given by import path are measured with parameters from a JSON
+file.
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+
+from paramap import fields
+from paramap.mapping import load_schema
+from paramap.types import IntegerType, MapObject, StringType
+
+KINDS = ('scalar', 'list', 'nested', 'map')
+
+
+def field_kind(field_plan):
+    """
+    Returns kind of field used in reports: scalar, list, nested or map
+    """
+    if field_plan.many:
+        return 'list'
+
+    if field_plan.nested:
+        return 'nested'
+
+    if isinstance(field_plan.field, fields.Map):
+        return 'map'
+
+    return 'scalar'
+
+
+def footprint(schema, parameters, count=1000):
+    """Measures bytes per instance, broken down by fields
+
+    Creates count instances, then deletes values of each field from
+    all of them. Memory freed by deleting values of a field is the
+    memory owned by that field, values shared with parameters are not
+    counted. What's left is the instance itself.
+
+    Args:
+        schema (MapObject): measured class
+        parameters (dict): parameters of created instances
+        count (int, optional): number of created instances
+
+    Returns:
+        dict: bytes per instance in total, for every field, for every
+              field kind and for the instance itself
+    """
+    field_plans = list(schema._plan)
+    instances = [None] * count
+
+    tracemalloc.start()
+
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+
+        for index in range(count):
+            instance = schema(parameters)
+
+            for field_plan in field_plans:
+                # resolves values of lazy fields
+                getattr(instance, field_plan.name)
+
+            instances[index] = instance
+
+        total = tracemalloc.get_traced_memory()[0] - start
+        by_field = {}
+
+        for field_plan in field_plans:
+            before = tracemalloc.get_traced_memory()[0]
+
+            for instance in instances:
+                delattr(instance, field_plan.name)
+
+            by_field[field_plan.name] = {
+                'kind': field_kind(field_plan),
+                'bytes': round(
+                    (before - tracemalloc.get_traced_memory()[0]) / count, 1
+                ),
+            }
+    finally:
+        tracemalloc.stop()
+
+    by_kind = dict.fromkeys(KINDS, 0)
+
+    for field in by_field.values():
+        kind = field['kind']
+        by_kind[kind] = round(by_kind[kind] + field['bytes'], 1)
+
+    return {
+        'total': round(total / count, 1),
+        'instance': round(total / count - sum(by_kind.values()), 1),
+        'by_kind': by_kind,
+        'by_field': by_field,
+    }
+
+
+def peak(function):
+    """
+    Returns peak memory in bytes allocated while calling function
+    """
+    # starting tracemalloc resets the peak, reset_peak needs Python 3.9
+    tracemalloc.start()
+
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        result = function()
+        peak_memory = tracemalloc.get_traced_memory()[1] - start
+        del result
+    finally:
+        tracemalloc.stop()
+
+    return peak_memory
+
+
+def batch_peaks(schema, parameters, count=1000):
+    """Measures peak memory of batch construction and `to_dict`
+
+    Args:
+        schema (MapObject): measured class
+        parameters (dict): parameters of created instances
+        count (int, optional): number of created instances
+
+    Returns:
+        dict: peak bytes of `map_many` and of casting its results
+              with `to_dict`
+    """
+    rows = [parameters] * count
+    instances = schema.map_many(rows)
+
+    return {
+        'count': count,
+        'map_many': peak(lambda: schema.map_many(rows)),
+        'to_dict': peak(
+            lambda: [instance.to_dict() for instance in instances]
+        ),
+    }
+
+
+def report(schema, parameters, count=1000):
+    """
+    Returns footprint and batch peaks of schema, see `footprint`
+    and `batch_peaks`
+    """
+    return {
+        'schema': f'{schema.__module__}:{schema.__qualname__}',
+        'footprint': footprint(schema, parameters, count),
+        'peaks': batch_peaks(schema, parameters, count),
+    }
+
+
+class SampleItem(MapObject):
+    id = fields.Integer(param='ID')
+    name = fields.String(param='NAME')
+
+
+class SampleMap(MapObject):
+    id = fields.Integer(param='ID')
+    name = fields.String(param='NAME')
+    score = fields.Float(param='SCORE')
+    status = fields.Map(StringType, param='STATUS', map={
+        'A': 'active',
+        'I': 'inactive',
+    })
+    values = fields.List(IntegerType, param='VALUES')
+    item = fields.Nested(SampleItem)
+    items = fields.List(SampleItem, param='ITEMS')
+
+
+SAMPLE_PARAMETERS = {
+    'ID': '1',
+    'NAME': 'name',
+    'SCORE': '0.5',
+    'STATUS': 'A',
+    'VALUES': [str(value) for value in range(100)],
+    'ITEMS': [{'ID': str(value), 'NAME': 'item'} for value in range(10)],
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='paramap memory footprint')
+    parser.add_argument('schema', nargs='?', help='module:Qualname')
+    parser.add_argument('-p', '--parameters', help='JSON parameters file')
+    parser.add_argument('-n', '--count', type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    if args.schema and not args.parameters:
+        parser.error('parameters file is required to measure a schema')
+
+    schema = load_schema(args.schema) if args.schema else SampleMap
+    parameters = SAMPLE_PARAMETERS
+
+    if args.parameters:
+        with open(args.parameters) as fileobj:
+            parameters = json.load(fileobj)
+
+    print(json.dumps(report(schema, parameters, args.count), indent=2))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Runs benchmarks and compares results.
+
+Usage:
+    python -m benchmarks.run [-o results.json] [-k name_part]
+    python -m benchmarks.run compare baseline.json results.json [-t 0.1]
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+from benchmarks.cases import CASES
+
+
+def measure(setup, number, repeat=5):
+    """Measures a case
+
+    Args:
+        setup (callable): case function returning the timed callable
+        number (int): calls in a single measurement
+        repeat (int, optional): number of measurements
+
+    Returns:
+        dict: best and median time of a single call in seconds
+    """
+    timer = timeit.Timer(setup())
+    timings = sorted(
+        timing / number for timing in timer.repeat(repeat, number)
+    )
+
+    return {
+        'best': timings[0],
+        'median': timings[len(timings) // 2],
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def run(selected=None, repeat=5):
+    """Runs benchmark cases
+
+    Args:
+        selected (str, optional): run only cases with names containing it
+        repeat (int, optional): number of measurements of each case
+
+    Returns:
+        dict: results with environment information, cases that raised
+              have an error instead of timings
+    """
+    results = {}
+
+    for name, (setup, number) in CASES.items():
+        if selected and selected not in name:
+            continue
+
+        try:
+            results[name] = measure(setup, number, repeat)
+        except Exception as error:
+            # cases using features missing in the measured version
+            # are recorded, so other cases still run
+            results[name] = {'error': f'{type(error).__name__}: {error}'}
+            print(f'{name:45} {"skipped":>15}  {results[name]["error"]}',
+                  file=sys.stderr)
+            continue
+
+        print(f'{name:45} {results[name]["best"] * 1e6:12.2f} us',
+              file=sys.stderr)
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold=0.1):
+    """Compares best times of two benchmark runs
+
+    Args:
+        baseline (dict): results of the reference run
+        current (dict): results of the compared run
+        threshold (float, optional): relative slowdown considered
+                                     a regression
+
+    Returns:
+        list: (name, baseline time, current time, ratio, regression)
+              tuples for cases present in both runs, times and ratio
+              are None for cases that failed in either run
+    """
+    rows = []
+
+    for name, result in current['results'].items():
+        reference = baseline['results'].get(name)
+
+        if reference is None:
+            continue
+
+        if 'error' in reference or 'error' in result:
+            rows.append((name, None, None, None, False))
+            continue
+
+        ratio = result['best'] / reference['best']
+        rows.append((
+            name, reference['best'], result['best'], ratio,
+            ratio > 1 + threshold,
+        ))
+
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='paramap benchmarks')
+    commands = parser.add_subparsers(dest='command')
+
+    parser.add_argument('-o', '--output', help='write results to file')
+    parser.add_argument('-k', '--select', help='run matching cases only')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+
+    compare_parser = commands.add_parser(
+        'compare', help='compare two result files'
+    )
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument(
+        '-t', '--threshold', type=float, default=0.1,
+        help='relative slowdown reported as regression, default 0.1',
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'compare':
+        with open(args.baseline) as baseline, open(args.current) as current:
+            rows = compare(
+                json.load(baseline), json.load(current), args.threshold
+            )
+
+        for name, before, after, ratio, regression in rows:
+            if ratio is None:
+                print(f'{name:45} {"skipped":>15}')
+                continue
+
+            print(
+                f'{name:45} {before * 1e6:12.2f} us {after * 1e6:12.2f} us '
+                f'{ratio:6.2f}x{"  REGRESSION" if regression else ""}'
+            )
+
+        return 1 if any(row[-1] for row in rows) else 0
+
+    output = json.dumps(run(args.select, args.repeat), indent=2)
+
+    if args.output:
+        with open(args.output, 'w') as fileobj:
+            fileobj.write(output + '\n')
+    else:
+        print(output)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,23 @@
 from paramap import *
+from paramap.mapping import stream, map_parallel
+from paramap.encoders import dump_jsonl
+from paramap.compiler import depends
+from paramap.inspection import explain, profile
 
 __all__ = [
     'types',
     'fields',
     'base',
     'registry',
+    'mapping',
+    'encoders',
+    'cache',
+    'instrumentation',
+    'inspection',
+    'stream',
+    'map_parallel',
+    'dump_jsonl',
+    'depends',
+    'explain',
+    'profile',
 ]
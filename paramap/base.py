@@ -1,10 +1,78 @@
 import warnings
 
+from . import instrumentation
+from .compiler import ConstructionPlan, FieldPlan, find_resolver
+
+
+def make_converter(type_instance, default=None):
+    """Builds a converter resolving values with type instance
+
+    Converter resolves values the same way a field with the given type
+    and default does. Values that already have the exact target type of
+    the type class skip casting.
+
+    Args:
+        type_instance (BaseType): type to convert values with
+        default (any, optional): value used instead of None
+
+    Returns:
+        callable: converter(value)
+    """
+    type_class = type(type_instance)
+
+    if type_class.resolve is not BaseType.resolve:
+        convert = type_instance.resolve
+        target = None
+    else:
+        convert = type_instance.clean
+        # fast path is only safe when clean comes from the class
+        # that declares the target type
+        owner = next(
+            klass for klass in type_class.__mro__ if 'clean' in klass.__dict__
+        )
+        target = owner.__dict__.get('target_type')
+
+        if owner is BaseType:
+
+            def converter(value):
+                return default if value is None else value
+
+            return converter
+
+    if target is None:
+
+        def converter(value):
+            if value is None:
+                return default
+
+            value = convert(value)
+
+            return default if value is None else value
+
+        return converter
+
+    def converter(value):
+        if value is None:
+            return default
+
+        # exact type check, eg. bool values are instances of int
+        if type(value) is target:
+            return value
+
+        value = convert(value)
+
+        return default if value is None else value
+
+    return converter
+
 
 class BaseType(object):
     """
     Represents base type class that resolves values with identity.
     """
+    # type of cleaned values, values of this exact type are valid
+    target_type = None
+
     def clean(self, value):
         """
         All values are valid by default
@@ -17,11 +85,70 @@ class BaseType(object):
         """
         return self.clean(value)
 
+    async def aresolve(self, value):
+        """
+        Resolves value asynchronously, same as resolve by default
+        """
+        return self.resolve(value)
+
+    def clean_column(self, values):
+        """Cleans a column of values at once
+
+        Args:
+            values (iterable): values to clean
+
+        Returns:
+            tuple(list, list): cleaned values and error mask, values that
+                               failed to clean are replaced with None and
+                               flagged with True in the mask. Mask is None
+                               when all values are valid.
+        """
+        clean = self.clean
+        cleaned = []
+        errors = None
+
+        for index, value in enumerate(values):
+            try:
+                cleaned.append(clean(value))
+            except (ValueError, TypeError):
+                if errors is None:
+                    errors = [False] * index
+
+                cleaned.append(None)
+                errors.append(True)
+                continue
+
+            if errors is not None:
+                errors.append(False)
+
+        return cleaned, errors
+
+    def resolve_column(self, values):
+        """Resolves a column of literal values
+
+        Args:
+            values (iterable): values to resolve
+
+        Returns:
+            list: resolved values
+        """
+        resolve = self.resolve
+        return [resolve(value) for value in values]
+
+    def get_converter(self):
+        """
+        Returns a callable resolving values the same way resolve does
+        """
+        return self.resolve
+
 
 class BaseField(BaseType):
     """
     Base class for fields
     """
+    # True for fields resolving to lists of values
+    many = False
+
     def __init__(self, type_class, param=None, default=None, required=False,
                  verbose_name=None, description=None):
         self.type_class = type_class
@@ -37,37 +164,153 @@ class BaseField(BaseType):
                 f'kwargs on {self.__class__.__name__} field.'
             )
 
+    @property
+    def type_instance(self):
+        """
+        Returns cached instance of field type class
+        """
+        cached = self.__dict__.get('_type_instance')
+
+        if cached is None or type(cached) is not self.type_class:
+            cached = self.type_class()
+            self._type_instance = cached
+
+        return cached
+
     def clean(self, value):
-        return self.type_class().clean(value)
+        return self.type_instance.clean(value)
 
     def resolve(self, value):
         if value is None:
             return self.default
 
-        resolve_with = self.type_class().resolve(value)
+        resolve_with = self.type_instance.resolve(value)
 
         if resolve_with is None:
             return self.default
 
+        if type(self).clean is BaseField.clean:
+            # value has already been cleaned by the type
+            return resolve_with
+
         return super(BaseField, self).resolve(resolve_with)
 
+    def get_converter(self):
+        """Returns cached converter resolving field values
+
+        Fields that customize resolving or cleaning use their
+        resolve method as the converter.
+
+        Returns:
+            callable: converter(value)
+        """
+        converter = self.__dict__.get('_converter')
+
+        if converter is None:
+            converter = self.build_converter()
+            self._converter = converter
+
+        return converter
+
+    def uses_default_resolution(self, base=None):
+        """Tells whether field resolves values with default methods
+
+        Specialized converters and column resolution only apply to
+        fields that do not customize `resolve` or `clean`.
+
+        Args:
+            base (type, optional): class whose `resolve` is the default,
+                                   defaults to BaseField
+
+        Returns:
+            bool
+        """
+        return (
+            type(self).resolve is (base or BaseField).resolve
+            and type(self).clean is BaseField.clean
+        )
+
+    def build_converter(self):
+        """
+        Builds converter for the field, see `get_converter`
+        """
+        if not self.uses_default_resolution():
+            return self.resolve
+
+        return make_converter(self.type_instance, self.default)
+
 
 class DeclarativeFieldsMetaclass(type):
     """
-    Collects declared fields in .base_fields attribute.
+    Collects declared fields in .base_fields attribute and compiles
+    a construction plan for them in ._plan attribute.
+
+    Accepts class options as class keyword arguments, options are
+    inherited by subclasses and stored in ._options attribute:
+
+    - slots (bool): generate __slots__ for fields, so instances
+      don't carry per-object __dict__. Defaults to False.
+    - lazy (bool): resolve fields on first access instead of in
+      __init__, resolved values are cached on the instance. Can not be
+      combined with slots. Defaults to False.
+    - cache_size (int): cache up to cache_size instances created from
+      parameters, see `MapObject.construction_cache`. Defaults to None,
+      which disables the cache.
+    - cache_ttl (float): seconds after which cached instances expire.
+      Defaults to None, cached instances don't expire.
+    - cache_copy (bool): return shallow copies of cached instances
+      instead of shared ones. Defaults to True.
+    - updatable (bool): keep a reference to parameters on instances,
+      so they can be updated with `MapObject.update`. Defaults to False.
+
+    Example:
+        ::
+
+            class Person(MapObject, slots=True):
+                first_name = String(param='FIRST_NAME')
     """
+    class_options = (
+        'slots', 'lazy', 'cache_size', 'cache_ttl', 'cache_copy',
+        'updatable',
+    )
 
-    def __new__(mcs, name, bases, attrs):
+    def __new__(mcs, name, bases, attrs, **kwargs):
         # Collect fields from current class and remove them from attrs.
         attrs['base_fields'] = {
             key: attrs.pop(key) for key, value in list(attrs.items())
             if isinstance(value, BaseType)
         }
 
+        options = {}
+
+        for base in reversed(bases):
+            options.update(getattr(base, '_options', {}))
+
+        options.update({
+            key: kwargs.pop(key) for key in list(kwargs)
+            if key in mcs.class_options
+        })
+        attrs['_options'] = options
+
+        if options.get('slots') and options.get('lazy'):
+            raise TypeError(
+                f'{name}: lazy classes cache field values in instance '
+                '__dict__ and can not use slots.'
+            )
+
+        if options.get('slots') and '__slots__' not in attrs:
+            attrs['__slots__'] = mcs.field_slots(bases, attrs)
+
+        if options.get('cache_size') and not issubclass(
+            mcs, CachedFieldsMetaclass
+        ):
+            # only classes with cache pay for the custom __call__
+            mcs = CachedFieldsMetaclass
+
         new_class = super(
             DeclarativeFieldsMetaclass,
             mcs
-        ).__new__(mcs, name, bases, attrs)
+        ).__new__(mcs, name, bases, attrs, **kwargs)
 
         # Walk through the MRO.
         base_fields = {}
@@ -82,5 +325,89 @@ class DeclarativeFieldsMetaclass(type):
                     base_fields.pop(attr)
 
         new_class.base_fields = base_fields
+        new_class._plan = mcs.build_plan(new_class)
+
+        if options.get('lazy'):
+            for attr, descriptor in new_class._plan.descriptors().items():
+                setattr(new_class, attr, descriptor)
+
+        if instrumentation.enabled:
+            instrumentation.instrument(new_class)
 
         return new_class
+
+    @staticmethod
+    def field_slots(bases, attrs):
+        """Returns __slots__ for fields of a class that is being created
+
+        Args:
+            bases (tuple): base classes
+            attrs (dict): class attributes with collected base_fields
+
+        Returns:
+            tuple: names of fields without a slot in base classes
+        """
+        names = {}
+
+        for base in reversed(bases):
+            names.update(getattr(base, 'base_fields', {}))
+
+        names.update(attrs['base_fields'])
+
+        if attrs['_options'].get('updatable'):
+            # parameters kept for `MapObject.update`
+            names['_parameters'] = None
+
+        existing = set()
+
+        for base in bases:
+            for klass in base.__mro__:
+                slots = klass.__dict__.get('__slots__', ())
+                existing.update((slots,) if isinstance(slots, str) else slots)
+
+        return tuple(
+            name for name in names
+            if name not in existing and name not in attrs
+        )
+
+    def build_plan(cls):
+        """Builds construction plan for class fields
+
+        Resolver lookup and nested field detection are done once here,
+        instead of on every instance initialization.
+
+        Returns:
+            ConstructionPlan: plan with generated init function
+        """
+        return ConstructionPlan([
+            FieldPlan(
+                name,
+                field,
+                nested=isinstance(
+                    getattr(field, 'type_class', None),
+                    DeclarativeFieldsMetaclass
+                ),
+                resolver=find_resolver(cls, name),
+            )
+            for name, field in cls.base_fields.items()
+        ],
+            qualname=cls.__qualname__,
+            lazy=bool(cls._options.get('lazy')),
+            updatable=bool(cls._options.get('updatable')),
+        )
+
+
+class CachedFieldsMetaclass(DeclarativeFieldsMetaclass):
+    """
+    Metaclass of classes with construction cache, creates instances
+    through the cache when they are created from parameters only.
+    """
+    def __call__(cls, parameters=None, **kwargs):
+        cache = cls.construction_cache()
+
+        if cache is None or kwargs:
+            return super(CachedFieldsMetaclass, cls).__call__(
+                parameters, **kwargs
+            )
+
+        return cache.get(parameters)
@@ -0,0 +1,182 @@
+import threading
+import time
+from collections import OrderedDict
+
+from .compiler import assign, compile_function
+
+
+def instance_copier(cls):
+    """Returns function making shallow copies of class instances
+
+    Copies share field values with the original, including nested
+    objects, but can have their own fields set or updated.
+
+    Args:
+        cls (type): class of copied instances
+
+    Returns:
+        callable: copy(instance)
+    """
+    slots = []
+
+    for klass in reversed(cls.__mro__):
+        names = klass.__dict__.get('__slots__', ())
+        names = (names,) if isinstance(names, str) else names
+        slots.extend(
+            name for name in names if name not in ('__dict__', '__weakref__')
+        )
+
+    namespace = {'new': object.__new__, 'cls': cls}
+    lines = [
+        'def copy(instance):',
+        '    result = new(cls)',
+    ]
+
+    if slots:
+        lines.append('    try:')
+        lines.extend(
+            '        ' + assign('result', name, f'instance.{name}')
+            for name in slots
+        )
+        lines.append('    except AttributeError:')
+        # some slots are not set, copy the ones that are
+        lines.append('        copy_set_slots(result, instance)')
+
+    if '__dict__' in dir(cls):
+        lines.append('    result.__dict__.update(instance.__dict__)')
+
+    lines.append('    return result')
+
+    def copy_set_slots(result, instance):
+        for name in slots:
+            try:
+                setattr(result, name, getattr(instance, name))
+            except AttributeError:
+                pass
+
+    namespace['copy_set_slots'] = copy_set_slots
+    copy = compile_function('copy', lines, namespace, cls.__qualname__)
+
+    return copy
+
+
+class ConstructionCache:
+    """
+    LRU cache of instances keyed with values of consumed parameters.
+
+    Keys are built from values of `names` parameters and their types,
+    so eg. `1` and `True` are cached separately. When `names` is None,
+    the whole parameters dictionary is used as the key. Parameters with
+    unhashable values are not cached.
+
+    Args:
+        create (callable): create(parameters) making new instances
+        names (iterable, optional): names of consumed parameters
+        maxsize (int, optional): maximum number of cached instances
+        ttl (float, optional): seconds after which instances expire,
+                               None means they never do
+        copy (callable, optional): copy(instance) applied to cached
+                                   instances before returning them
+    """
+    def __init__(self, create, names=None, maxsize=128, ttl=None, copy=None):
+        self.create = create
+        self.names = None if names is None else tuple(names)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.copy = copy
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, parameters):
+        """
+        Returns cache key for parameters
+        """
+        if self.names is None:
+            return frozenset(
+                (name, type(value), value)
+                for name, value in parameters.items()
+            )
+
+        values = tuple(map(parameters.get, self.names))
+        return values, tuple(map(type, values))
+
+    def get(self, parameters):
+        """Returns instance for parameters, creating it on a cache miss
+
+        Args:
+            parameters (dict): instance parameters
+
+        Returns:
+            object: cached instance or its copy, new instance on a miss
+        """
+        parameters = parameters or {}
+
+        try:
+            key = self.key(parameters)
+            entry = self.lookup(key)
+        except TypeError:
+            # unhashable parameter values
+            return self.create(parameters)
+
+        if entry is None:
+            self.misses += 1
+            entry = self.create(parameters)
+            self.store(key, entry)
+        else:
+            self.hits += 1
+
+        if self.copy is None:
+            return entry
+
+        # cached instance is never handed out, so it can't be modified
+        return self.copy(entry)
+
+    def lookup(self, key):
+        """
+        Returns cached instance for key, or None
+        """
+        entries = self._entries
+
+        with self._lock:
+            entry = entries.get(key)
+
+            if entry is None:
+                return None
+
+            instance, expires = entry
+
+            if expires is not None and expires <= time.monotonic():
+                del entries[key]
+                return None
+
+            entries.move_to_end(key)
+
+        return instance
+
+    def store(self, key, instance):
+        """
+        Caches instance, evicting least recently used ones over maxsize
+        """
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        entries = self._entries
+
+        with self._lock:
+            entries[key] = (instance, expires)
+            entries.move_to_end(key)
+
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all cached instances and resets statistics
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,909 @@
+import inspect
+import itertools
+import json
+import keyword
+import linecache
+import types
+
+
+class Missing:
+    """
+    Sentinel marking values that were not computed
+    """
+    def __repr__(self):
+        return 'MISSING'
+
+
+MISSING = Missing()
+
+# types of values copied as they are by generated serializers
+SCALARS = frozenset((str, int, float, bool, type(None)))
+
+_counter = itertools.count()
+
+
+def compile_function(name, lines, namespace, qualname=None):
+    """Compiles function source and returns the function object
+
+    Generated source is registered in linecache, so tracebacks and
+    debuggers can display it like regular code.
+
+    Args:
+        name (str): name of the function defined by the source
+        lines (list): source code lines
+        namespace (dict): globals available to the function body
+        qualname (str, optional): qualified name used for the filename
+
+    Returns:
+        function: compiled function
+    """
+    source = '\n'.join(lines) + '\n'
+    filename = '<paramap generated {} {}-{}>'.format(
+        name, qualname or '', next(_counter)
+    )
+
+    exec(compile(source, filename, 'exec'), namespace)
+
+    linecache.cache[filename] = (
+        len(source), None, source.splitlines(True), filename
+    )
+
+    function = namespace[name]
+
+    if qualname:
+        function.__qualname__ = f'{qualname}.{name}'
+
+    return function
+
+
+def is_identifier(name):
+    """
+    Returns True if name can be used as attribute name in generated code
+    """
+    return (
+        isinstance(name, str)
+        and name.isidentifier()
+        and not keyword.iskeyword(name)
+    )
+
+
+def assign(target, name, expression):
+    """
+    Returns source of an attribute assignment
+    """
+    if is_identifier(name):
+        return f'{target}.{name} = {expression}'
+
+    return f'setattr({target}, {name!r}, {expression})'
+
+
+def literal(value, namespace, alias):
+    """
+    Returns source expression for value, binding it in namespace when
+    it can not be written as a literal
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return repr(value)
+
+    namespace[alias] = value
+    return alias
+
+
+class FieldPlan:
+    """
+    Construction details of a single field decided at class creation.
+    """
+    def __init__(self, name, field, nested=False, resolver=None):
+        self.name = name
+        self.field = field
+        self.param = getattr(field, 'param', None)
+        self.nested = nested
+        # nested fields without param resolve with the whole parameters dict
+        self.whole_parameters = nested and not self.param
+        self.resolver = resolver
+        self.is_async = inspect.iscoroutinefunction(
+            getattr(resolver, '__func__', resolver)
+        )
+        # key used in `to_dict` output
+        self.key = getattr(field, 'verbose_name', None) or name
+        # fields resolving to lists of values
+        self.many = getattr(field, 'many', False)
+        # fields and parameters declared with `depends`, None when the
+        # resolver does not declare them and may use anything
+        depends_on = getattr(
+            resolver, 'depends_on',
+            getattr(getattr(resolver, '__func__', None), 'depends_on', None)
+        )
+        self.depends_fields, self.depends_parameters = depends_on or (
+            None, None
+        )
+
+    def __repr__(self):
+        return (
+            f'FieldPlan(name={self.name!r}, param={self.param!r}, '
+            f'nested={self.nested}, resolver={bool(self.resolver)})'
+        )
+
+
+class ConstructionPlan:
+    """
+    Per-class construction plan.
+
+    Holds fields in declaration order along with their parameter bindings,
+    nested detection and resolvers, and a generated `init(self, parameters,
+    initial=None)` function that sets field values on an instance without
+    inspecting the class again.
+
+    Plans of updatable classes keep parameters on instances, so they can
+    be updated later.
+    """
+    def __init__(self, fields, qualname=None, lazy=False, updatable=False):
+        self.fields = tuple(fields)
+        self.lazy = lazy
+        self.updatable = updatable
+        self.qualname = qualname
+        self.pending = self.sort_pending()
+        # async resolvers, including ones of nested classes, can only
+        # run when the instance is created asynchronously
+        self.is_async = any(
+            plan.is_async
+            or plan.nested and plan.field.type_class._plan.is_async
+            for plan in self.fields
+        )
+        if lazy:
+            self.init = self.compile_lazy_init()
+        else:
+            self.init = self.compile_init()
+
+        self.column_inits = {}
+        self.updates = {}
+        # statistics of instrumented classes, see paramap.instrumentation
+        self.stats = None
+        self.serializers = {}
+        self.json_encoders = {}
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def sort_pending(self):
+        """Orders fields with resolvers, so resolvers run after resolvers
+        of fields they depend on
+
+        Resolvers keep declaration order unless declared dependencies
+        require otherwise.
+
+        Returns:
+            tuple: field plans with resolvers
+        """
+        names = {plan.name for plan in self.fields}
+        remaining = [plan for plan in self.fields if plan.resolver]
+        pending = []
+
+        for plan in remaining:
+            unknown = set(plan.depends_fields or ()) - names
+
+            if unknown:
+                raise TypeError(
+                    f'{self.qualname}: resolver of {plan.name!r} depends on '
+                    f'unknown fields {sorted(unknown)}.'
+                )
+
+        while remaining:
+            waiting = {plan.name for plan in remaining}
+
+            for plan in remaining:
+                if not waiting.intersection(
+                    dep for dep in plan.depends_fields or ()
+                    if dep != plan.name
+                ):
+                    break
+            else:
+                raise TypeError(
+                    f'{self.qualname}: circular resolver dependencies '
+                    f'between fields {sorted(waiting)}.'
+                )
+
+            pending.append(plan)
+            remaining.remove(plan)
+
+        return tuple(pending)
+
+    def affected(self, changed):
+        """Returns fields that have to be resolved again when parameters
+        change
+
+        Fields bound to changed parameters are affected, along with
+        resolvers depending on changed parameters or affected fields.
+        Resolvers without declared dependencies and nested fields taking
+        the whole parameters dictionary are always affected.
+
+        Args:
+            changed (iterable): names of changed parameters
+
+        Returns:
+            tuple: field plans, fields without resolvers first, followed
+                   by fields with resolvers in resolution order
+        """
+        changed = set(changed)
+        affected = [
+            plan for plan in self.fields
+            if not plan.resolver
+            and (plan.whole_parameters or plan.param in changed)
+        ]
+        names = {plan.name for plan in affected}
+
+        for plan in self.pending:
+            if (
+                plan.depends_fields is None
+                or plan.whole_parameters
+                or plan.param in changed
+                or changed.intersection(plan.depends_parameters)
+                or names.intersection(plan.depends_fields)
+            ):
+                affected.append(plan)
+                names.add(plan.name)
+
+        return tuple(affected)
+
+    def consumed_parameters(self):
+        """Returns names of parameters used to resolve fields
+
+        Includes parameters of nested objects and parameters declared
+        by resolvers.
+
+        Returns:
+            frozenset or None: parameter names, None if any resolver does
+                               not declare its parameters
+        """
+        names = set()
+
+        for plan in self.fields:
+            if plan.resolver and plan.depends_parameters is None:
+                return None
+
+            names.update(plan.depends_parameters or ())
+
+            if plan.whole_parameters:
+                nested = plan.field.type_class._plan.consumed_parameters()
+
+                if nested is None:
+                    return None
+
+                names.update(nested)
+            elif plan.param is not None:
+                names.add(plan.param)
+
+        return frozenset(names)
+
+    def async_guard(self, namespace):
+        """
+        Returns source lines rejecting synchronous construction of classes
+        with async resolvers
+        """
+        if not self.is_async:
+            return []
+
+        namespace['async_error'] = (
+            f'{self.qualname} has async resolvers, create it '
+            'with `await acreate(...)` instead.'
+        )
+
+        return ['    raise TypeError(async_error)']
+
+    def keep_parameters(self):
+        """
+        Returns source lines keeping parameters on instances of
+        updatable classes
+        """
+        if not self.updatable:
+            return []
+
+        return ['    self._parameters = parameters']
+
+    def resolver_call(self, index, plan, namespace):
+        """
+        Returns source expression calling field resolver
+        """
+        resolver = plan.resolver
+        value = f'value_{index}'
+
+        if isinstance(resolver, types.FunctionType):
+            namespace[f'resolver_{index}'] = resolver
+            return f'resolver_{index}(self, {value}, parameters)'
+
+        # staticmethods, classmethods and other callables are bound
+        # through regular attribute access
+        resolver_name = 'resolve_' + plan.name
+
+        if is_identifier(resolver_name):
+            return f'self.{resolver_name}({value}, parameters)'
+
+        return f'getattr(self, {resolver_name!r})({value}, parameters)'
+
+    def compile_init(self):
+        """Generates field initialization function
+
+        Values of fields without resolvers are set first, in declaration
+        order. Resolvers are called afterwards, from top to bottom unless
+        declared dependencies require otherwise, so they can access other
+        field values. Fields passed through `initial` skip
+        both parameter lookup and their resolvers.
+
+        Returns:
+            function: init(self, parameters, initial=None)
+        """
+        namespace = {'MISSING': MISSING}
+        fast = []
+        fast_pending = {}
+        slow = []
+        slow_pending = {}
+
+        for index, plan in enumerate(self.fields):
+            resolve = f'resolve_{index}'
+            namespace[resolve] = plan.field.get_converter()
+
+            if plan.whole_parameters:
+                source = 'parameters'
+            else:
+                source = 'get({})'.format(
+                    literal(plan.param, namespace, f'param_{index}')
+                )
+
+            name = literal(plan.name, namespace, f'name_{index}')
+
+            slow.append(f'value = iget({name})')
+            slow.append('if value:')
+            slow.append(
+                '    ' + assign('self', plan.name, f'{resolve}(value)')
+            )
+
+            if plan.resolver:
+                call = self.resolver_call(index, plan, namespace)
+                fast.append(f'value_{index} = {resolve}({source})')
+                fast_pending[plan.name] = [assign('self', plan.name, call)]
+
+                slow.append(f'    value_{index} = MISSING')
+                slow.append('else:')
+                slow.append(f'    value_{index} = {resolve}({source})')
+                slow_pending[plan.name] = [
+                    f'if value_{index} is not MISSING:',
+                    '    ' + assign('self', plan.name, call),
+                ]
+            else:
+                fast.append(
+                    assign('self', plan.name, f'{resolve}({source})')
+                )
+
+                slow.append('else:')
+                slow.append(
+                    '    ' + assign('self', plan.name, f'{resolve}({source})')
+                )
+
+        for plan in self.pending:
+            fast.extend(fast_pending[plan.name])
+            slow.extend(slow_pending[plan.name])
+
+        lines = [
+            'def init(self, parameters, initial=None):',
+            *self.async_guard(namespace),
+            *self.keep_parameters(),
+            '    get = parameters.get',
+            '    if not initial:',
+        ]
+        lines.extend('        ' + line for line in fast)
+        lines.append('        return')
+        lines.append('    iget = initial.get')
+        lines.extend('    ' + line for line in slow)
+
+        return compile_function('init', lines, namespace, self.qualname)
+
+    def compile_lazy_init(self):
+        """Generates initialization function of lazy classes
+
+        Field values are not resolved here, parameters and initial values
+        are kept on the instance for `LazyField` descriptors instead.
+
+        Returns:
+            function: init(self, parameters, initial=None)
+        """
+        namespace = {}
+        lines = [
+            'def init(self, parameters, initial=None):',
+            *self.async_guard(namespace),
+            '    self._lazy_state = (parameters, initial)',
+        ]
+
+        return compile_function('init', lines, namespace, self.qualname)
+
+    def descriptors(self):
+        """
+        Returns {name: LazyField} descriptors for fields of lazy classes
+        """
+        return {plan.name: LazyField(plan) for plan in self.fields}
+
+    def instrument(self, function, name):
+        """
+        Returns function recording its calls in statistics of the plan,
+        or the function itself when the plan is not instrumented
+        """
+        if self.stats is None:
+            return function
+
+        stats = self.stats.calls(name)
+
+        def instrumented(obj):
+            return stats.call(function, obj)
+
+        return instrumented
+
+    def instrumented_init(self, stats=None):
+        """Returns field initialization function recording statistics
+
+        Works the same way as the generated init of eager classes, but
+        calls every field converter and resolver through statistics.
+
+        Args:
+            stats (SchemaStats, optional): recorded statistics, defaults
+                                           to statistics of the plan
+
+        Returns:
+            function: init(self, parameters, initial=None)
+        """
+        stats = stats or self.stats
+        fields = [
+            (plan, plan.field.get_converter(), stats.field(plan.name))
+            for plan in self.fields
+        ]
+        pending = [
+            (plan.name, bind_resolver(plan), stats.resolver(plan.name))
+            for plan in self.pending
+        ]
+        namespace = {}
+        guard = self.async_guard(namespace)
+        updatable = self.updatable
+
+        def init(obj, parameters, initial=None):
+            if guard:
+                raise TypeError(namespace['async_error'])
+
+            if updatable:
+                obj._parameters = parameters
+
+            values = {}
+
+            for plan, convert, field_stats in fields:
+                value = initial.get(plan.name) if initial else None
+
+                if value:
+                    setattr(obj, plan.name, field_stats.call(convert, value))
+                    continue
+
+                if plan.whole_parameters:
+                    value = parameters
+                else:
+                    value = parameters.get(plan.param)
+
+                    if value is None and plan.param is not None:
+                        field_stats.defaults += 1
+
+                value = field_stats.call(convert, value)
+
+                if plan.resolver:
+                    values[plan.name] = value
+                else:
+                    setattr(obj, plan.name, value)
+
+            for name, resolver, resolver_stats in pending:
+                if name in values:
+                    setattr(obj, name, resolver_stats.call(
+                        resolver, obj, values[name], parameters
+                    ))
+
+        return init
+
+    def column_init(self, columns):
+        """Returns field initialization function for pre-resolved columns
+
+        Args:
+            columns (tuple): names of fields resolved up front
+
+        Returns:
+            function: init(self, parameters, values), where values are
+                      resolved field values in the order of columns
+        """
+        columns = tuple(columns)
+
+        if columns not in self.column_inits:
+            self.column_inits[columns] = self.compile_column_init(columns)
+
+        return self.column_inits[columns]
+
+    def update(self, changed):
+        """Returns function resolving fields affected by changed parameters
+
+        Args:
+            changed (iterable): names of changed parameters
+
+        Returns:
+            function: update(self, parameters), where parameters are
+                      the updated parameters
+        """
+        known = self.parameter_names
+        changed = frozenset(name for name in changed if name in known)
+
+        if changed not in self.updates:
+            self.updates[changed] = self.compile_update(changed)
+
+        return self.updates[changed]
+
+    @property
+    def parameter_names(self):
+        """
+        Returns names of parameters fields and resolvers depend on
+        """
+        names = self.__dict__.get('_parameter_names')
+
+        if names is None:
+            names = set()
+
+            for plan in self.fields:
+                names.add(plan.param)
+                names.update(plan.depends_parameters or ())
+
+            names = self._parameter_names = frozenset(names)
+
+        return names
+
+    def compile_update(self, changed):
+        """
+        Generates function resolving fields affected by changed parameters
+        """
+        namespace = {}
+        lines = [
+            'def update(self, parameters):',
+            *self.async_guard(namespace),
+            '    self._parameters = parameters',
+            '    get = parameters.get',
+        ]
+
+        for plan in self.affected(changed):
+            index = self.fields.index(plan)
+            resolve = f'resolve_{index}'
+            namespace[resolve] = plan.field.get_converter()
+
+            if plan.whole_parameters:
+                value = f'{resolve}(parameters)'
+            else:
+                value = '{}(get({}))'.format(
+                    resolve, literal(plan.param, namespace, f'param_{index}')
+                )
+
+            if plan.resolver:
+                lines.append(f'    value_{index} = {value}')
+                value = self.resolver_call(index, plan, namespace)
+
+            lines.append('    ' + assign('self', plan.name, value))
+
+        return compile_function('update', lines, namespace, self.qualname)
+
+    def serializer(self, skip_none, convert):
+        """Returns function casting instances to dictionaries
+
+        Args:
+            skip_none (bool): skip fields with None values
+            convert (callable): convert(value, skip_none) casting
+                                non-scalar values
+
+        Returns:
+            function: to_dict(obj)
+        """
+        skip_none = bool(skip_none)
+
+        if skip_none not in self.serializers:
+            self.serializers[skip_none] = self.instrument(
+                self.compile_serializer(skip_none, convert), 'to_dict'
+            )
+
+        return self.serializers[skip_none]
+
+    def compile_serializer(self, skip_none, convert):
+        """Generates function casting instances to dictionaries
+
+        Output keys are computed up front, scalar values are copied
+        without calling convert.
+        """
+        namespace = {
+            'convert': convert,
+            'SCALARS': SCALARS,
+        }
+        lines = [
+            'def to_dict(obj):',
+            '    result = {}',
+        ]
+
+        for index, plan in enumerate(self.fields):
+            key = literal(plan.key, namespace, f'key_{index}')
+
+            if is_identifier(plan.name):
+                lines.extend([
+                    '    try:',
+                    f'        value = obj.{plan.name}',
+                    '    except AttributeError:',
+                    '        value = None',
+                ])
+            else:
+                name = literal(plan.name, namespace, f'name_{index}')
+                lines.append(f'    value = getattr(obj, {name}, None)')
+
+            if plan.nested and not plan.many:
+                value = f'convert(value, {skip_none})'
+            elif plan.many:
+                value = (
+                    '[item if type(item) in SCALARS '
+                    f'else convert(item, {skip_none}) for item in value] '
+                    f'if type(value) is list else convert(value, {skip_none})'
+                )
+            else:
+                value = (
+                    'value if type(value) in SCALARS '
+                    f'else convert(value, {skip_none})'
+                )
+
+            if skip_none:
+                lines.append('    if value is not None:')
+                lines.append(f'        result[{key}] = {value}')
+            else:
+                lines.append(f'    result[{key}] = {value}')
+
+        lines.append('    return result')
+
+        return compile_function(
+            'to_dict', lines, namespace, self.qualname
+        )
+
+    def json_encoder(self, skip_none, encode):
+        """Returns function encoding instances to JSON text
+
+        Args:
+            skip_none (bool): skip fields with None values
+            encode (callable): encode(value, skip_none) encoding
+                               values other than strings and integers
+
+        Returns:
+            function: to_json(obj)
+        """
+        skip_none = bool(skip_none)
+
+        if skip_none not in self.json_encoders:
+            self.json_encoders[skip_none] = self.instrument(
+                self.compile_json_encoder(skip_none, encode), 'to_json'
+            )
+
+        return self.json_encoders[skip_none]
+
+    def compile_json_encoder(self, skip_none, encode):
+        """Generates function encoding instances to JSON text
+
+        Output is the same as compact `json.dumps` of `to_dict` output,
+        but is built straight from field values with key fragments
+        encoded up front.
+        """
+        namespace = {
+            'encode': encode,
+            'encode_string': json.encoder.encode_basestring_ascii,
+            'encode_int': int.__repr__,
+        }
+        keys = [plan.key for plan in self.fields]
+        # repeated keys keep position of the first and value of the last
+        # field, just like a dictionary would
+        unique = len(set(keys)) == len(keys)
+
+        lines = [
+            'def to_json(obj):',
+            '    items = []' if unique else '    items = {}',
+        ]
+
+        for index, plan in enumerate(self.fields):
+            fragment = json.dumps({plan.key: None}, separators=(',', ':'))
+            fragment = literal(fragment[1:-5], namespace, f'key_{index}')
+
+            if is_identifier(plan.name):
+                lines.extend([
+                    '    try:',
+                    f'        value = obj.{plan.name}',
+                    '    except AttributeError:',
+                    '        value = None',
+                ])
+            else:
+                name = literal(plan.name, namespace, f'name_{index}')
+                lines.append(f'    value = getattr(obj, {name}, None)')
+
+            value = (
+                f'{fragment} + (encode_string(value) if type(value) is str '
+                'else encode_int(value) if type(value) is int '
+                f'else encode(value, {skip_none}))'
+            )
+
+            if unique:
+                statement = f'items.append({value})'
+            else:
+                key = literal(plan.key, namespace, f'output_key_{index}')
+                statement = f'items[{key}] = {value}'
+
+            if skip_none:
+                lines.append('    if value is not None:')
+                lines.append(f'        {statement}')
+            else:
+                lines.append(f'    {statement}')
+
+        if unique:
+            lines.append("    return '{' + ','.join(items) + '}'")
+        else:
+            lines.append("    return '{' + ','.join(items.values()) + '}'")
+
+        return compile_function(
+            'to_json', lines, namespace, self.qualname
+        )
+
+    def compile_column_init(self, columns):
+        """
+        Generates field initialization function for pre-resolved columns
+        """
+        namespace = {}
+        lines = [
+            'def column_init(self, parameters, values):',
+            *self.async_guard(namespace),
+            *self.keep_parameters(),
+            '    get = parameters.get',
+        ]
+        pending = {}
+
+        for index, plan in enumerate(self.fields):
+            if plan.name in columns:
+                value = f'values[{columns.index(plan.name)}]'
+            elif plan.whole_parameters:
+                namespace[f'resolve_{index}'] = plan.field.get_converter()
+                value = f'resolve_{index}(parameters)'
+            else:
+                namespace[f'resolve_{index}'] = plan.field.get_converter()
+                value = 'resolve_{}(get({}))'.format(
+                    index, literal(plan.param, namespace, f'param_{index}')
+                )
+
+            if plan.resolver:
+                lines.append(f'    value_{index} = {value}')
+                pending[plan.name] = '    ' + assign(
+                    'self', plan.name,
+                    self.resolver_call(index, plan, namespace),
+                )
+            else:
+                lines.append('    ' + assign('self', plan.name, value))
+
+        lines.extend(pending[plan.name] for plan in self.pending)
+
+        return compile_function(
+            'column_init', lines, namespace, self.qualname
+        )
+
+
+class LazyField:
+    """
+    Non-data descriptor resolving field value on first access.
+
+    Resolved value is stored in the instance `__dict__`, which takes
+    precedence over the descriptor, so following reads are plain
+    attribute lookups. Resolvers can access other fields, those are
+    resolved on demand as well.
+    """
+    def __init__(self, plan):
+        self.plan = plan
+        self.name = plan.name
+        self.convert = plan.field.get_converter()
+        self.resolver = bind_resolver(plan)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        try:
+            parameters, initial = instance._lazy_state
+        except AttributeError:
+            raise AttributeError(
+                f'{type(instance).__name__!r} object has no '
+                f'attribute {self.name!r}'
+            ) from None
+
+        plan = self.plan
+        value = initial.get(self.name) if initial else None
+
+        if value:
+            value = self.convert(value)
+        else:
+            if plan.whole_parameters:
+                value = self.convert(parameters)
+            else:
+                value = self.convert(parameters.get(plan.param))
+
+            if self.resolver is not None:
+                value = self.resolver(instance, value, parameters)
+
+        instance.__dict__[self.name] = value
+
+        return value
+
+    def __repr__(self):
+        return f'LazyField({self.name!r})'
+
+
+def bind_resolver(plan):
+    """Returns function calling resolver of a field, or None
+
+    Args:
+        plan (FieldPlan): field with resolver
+
+    Returns:
+        callable: resolver(obj, value, parameters)
+    """
+    if not plan.resolver:
+        return None
+
+    if isinstance(plan.resolver, types.FunctionType):
+        return plan.resolver
+
+    # staticmethods, classmethods and other callables are bound
+    # through regular attribute access
+    name = 'resolve_' + plan.name
+
+    def resolver(obj, value, parameters):
+        return getattr(obj, name)(value, parameters)
+
+    return resolver
+
+
+def depends(*fields, parameters=()):
+    """Declares fields and parameters a resolver depends on
+
+    Resolvers run after resolvers of fields they depend on, and
+    `MapObject.update` re-runs them only when one of their dependencies
+    changes. Resolvers without declared dependencies run on every update.
+
+    Example:
+        ::
+
+            class Person(MapObject):
+                first_name = String(param='FIRST_NAME')
+                last_name = String(param='LAST_NAME')
+                full_name = String()
+
+                @depends('first_name', 'last_name')
+                def resolve_full_name(self, value, parameters):
+                    return self.first_name + ' ' + self.last_name
+
+    Args:
+        fields (str): names of fields used by the resolver
+        parameters (iterable, optional): names of parameters used by
+                                         the resolver
+
+    Returns:
+        callable: decorator
+    """
+    def decorator(resolver):
+        resolver.depends_on = (tuple(fields), tuple(parameters))
+        return resolver
+
+    return decorator
+
+
+def find_resolver(cls, name):
+    """
+    Returns resolver defined for field `name` on class, or None
+    """
+    try:
+        resolver = inspect.getattr_static(cls, 'resolve_' + name)
+    except AttributeError:
+        return None
+
+    return resolver or None
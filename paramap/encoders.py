@@ -0,0 +1,153 @@
+import array
+import io
+import json
+import math
+
+from .base import DeclarativeFieldsMetaclass
+
+
+encode_string = json.encoder.encode_basestring_ascii
+
+dumps = json.JSONEncoder(separators=(',', ':')).encode
+
+
+def encode_float(value):
+    """
+    Encodes float the same way json module does
+    """
+    if value != value:
+        return 'NaN'
+
+    if value == math.inf:
+        return 'Infinity'
+
+    if value == -math.inf:
+        return '-Infinity'
+
+    return float.__repr__(value)
+
+
+def encode(value, skip_none=True):
+    """Encodes value to compact JSON text
+
+    MapObject instances are encoded with JSON encoders compiled for their
+    class, lists and tuples are encoded item by item, other values are
+    encoded by the json module.
+
+    Args:
+        value (any): value to encode
+        skip_none (bool, optional): skip fields with None values.
+                                    Defaults to True.
+
+    Returns:
+        str: JSON text
+    """
+    value_type = type(value)
+
+    if value_type is str:
+        return encode_string(value)
+
+    if value is None:
+        return 'null'
+
+    if value is True:
+        return 'true'
+
+    if value is False:
+        return 'false'
+
+    if value_type is int:
+        return int.__repr__(value)
+
+    if value_type is float:
+        return encode_float(value)
+
+    if isinstance(value, (list, tuple)):
+        try:
+            # lists of plain values are encoded by json module at once
+            return dumps(value)
+        except TypeError:
+            pass
+
+        return '[' + ','.join([
+            encode(item, skip_none) for item in value
+        ]) + ']'
+
+    if isinstance(value_type, DeclarativeFieldsMetaclass):
+        return value._plan.json_encoder(skip_none, encode)(value)
+
+    if isinstance(value, array.array) or (
+        value_type.__module__ == 'numpy' and value_type.__name__ == 'ndarray'
+    ):
+        # compact lists
+        return dumps(value.tolist())
+
+    return dumps(value)
+
+
+def is_binary(fileobj):
+    """
+    Returns True if file object expects bytes
+    """
+    if isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+
+    if isinstance(fileobj, io.TextIOBase):
+        return False
+
+    return 'b' in getattr(fileobj, 'mode', '')
+
+
+def dump_jsonl(objects, fileobj, skip_none=True, buffer_size=1 << 16):
+    """Writes objects to file as JSON Lines
+
+    Objects are encoded straight from field values, without building
+    intermediate dictionaries, and written in blocks of about buffer_size
+    characters.
+
+    Example:
+        ::
+
+            with open('people.jsonl', 'w') as fileobj:
+                dump_jsonl(Person.map_many(rows), fileobj)
+
+    Args:
+        objects (iterable): MapObject instances or other JSON
+                            serializable values
+        fileobj (file): text or binary file object
+        skip_none (bool, optional): skip fields with None values.
+                                    Defaults to True.
+        buffer_size (int, optional): size of written blocks.
+                                     Defaults to 64KiB.
+
+    Returns:
+        int: number of written objects
+    """
+    binary = is_binary(fileobj)
+    buffer = []
+    buffered = 0
+    count = 0
+
+    def flush():
+        block = ''.join(buffer)
+
+        if binary:
+            block = block.encode('ascii')
+
+        fileobj.write(block)
+        buffer.clear()
+
+    for obj in objects:
+        line = encode(obj, skip_none) + '\n'
+        buffer.append(line)
+        buffered += len(line)
+        count += 1
+
+        if buffered >= buffer_size:
+            flush()
+            buffered = 0
+
+    if buffer:
+        flush()
+
+    return count
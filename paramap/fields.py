@@ -1,7 +1,39 @@
-from .base import BaseField
+import array
+import asyncio
+import datetime
+import functools
+
+from .base import BaseField, BaseType, make_converter
+from .compiler import MISSING, SCALARS
 from paramap import types
 
 
+def is_nested_instance(type_class, value):
+    """Checks value a nested field resolves with
+
+    Args:
+        type_class (MapObject): class of the nested field
+        value (any): value to check
+
+    Returns:
+        bool: True if value is already an instance of type_class,
+              False if it is a dictionary of parameters
+
+    Raises:
+        TypeError: if value is neither
+    """
+    if isinstance(value, type_class):
+        return True
+
+    if not isinstance(value, dict):
+        raise TypeError(
+            'Nested fields can only resolve with '
+            '`dict` or `MapObject` values.'
+        )
+
+    return False
+
+
 class Field(BaseField):
     """
     Basic field
@@ -29,17 +61,101 @@ class Field(BaseField):
         if not issubclass(self.type_class, types.MapObject):
             return super(Field, self).resolve(value)
 
-        if isinstance(value, self.type_class):
+        if is_nested_instance(self.type_class, value):
             return value
 
-        if not isinstance(value, dict):
-            raise TypeError(
-                'Nested fields can only resolve with '
-                '`dict` or `MapObject` values.'
-            )
-
         return self.type_class(parameters=value)
 
+    def build_converter(self):
+        """
+        Builds converter for the field, see `BaseField.get_converter`
+        """
+        type_class = self.type_class
+
+        if not self.uses_default_resolution(Field):
+            return self.resolve
+
+        if not issubclass(type_class, types.MapObject):
+            return make_converter(self.type_instance, self.default)
+
+        create = type_class._mapper()
+
+        def converter(value):
+            if is_nested_instance(type_class, value):
+                return value
+
+            return create(value)
+
+        return converter
+
+    async def aresolve(self, value):
+        """Resolves field value asynchronously
+
+        Nested objects with async resolvers are created with
+        `await type_class.acreate(...)`, other values resolve the
+        same way as with `resolve`.
+        """
+        type_class = self.type_class
+
+        if (
+            type(self).resolve is not Field.resolve
+            or not issubclass(type_class, types.MapObject)
+            or not type_class._plan.is_async
+        ):
+            return self.resolve(value)
+
+        return await self._acreate_nested(value)
+
+    async def _acreate_nested(self, value):
+        """
+        Creates nested object asynchronously, see `resolve`
+        """
+        if is_nested_instance(self.type_class, value):
+            return value
+
+        return await self.type_class.acreate(parameters=value)
+
+    def resolve_column(self, values):
+        """Resolves a column of parameter values at once
+
+        Fields with scalar type classes clean the whole column with
+        `clean_column` of their type, other fields resolve values
+        one by one.
+
+        Args:
+            values (iterable): parameter values
+
+        Returns:
+            list: resolved values
+        """
+        type_class = self.type_class
+
+        if (
+            not self.uses_default_resolution(Field)
+            or issubclass(type_class, types.MapObject)
+            or type_class.resolve is not BaseType.resolve
+            or type_class.clean_column is BaseType.clean_column
+        ):
+            return super(Field, self).resolve_column(values)
+
+        if not hasattr(values, '__len__'):
+            values = list(values)
+
+        cleaned, errors = self.type_instance.clean_column(values)
+
+        if errors is not None:
+            for value, error in zip(values, errors):
+                if error and value is not None:
+                    # raise the same error resolving the value would
+                    self.resolve(value)
+
+        default = self.default
+
+        return [
+            default if value is None or result is None else result
+            for value, result in zip(values, cleaned)
+        ]
+
     @property
     def parameter(self):
         """
@@ -117,11 +233,118 @@ class Bool(Field):
         super(Bool, self).__init__(types.BoolType, **kwargs)
 
 
+# array typecodes of compact lists and buffer formats they can copy
+COMPACT_TYPECODES = {
+    types.IntegerType: ('q', frozenset(('q', '@q', 'l', '@l', 'n', '@n'))),
+    types.FloatType: ('d', frozenset(('d', '@d'))),
+}
+
+
+def copy_buffer(value, typecode, formats):
+    """
+    Returns array.array copied from a buffer with one of formats,
+    or None when value is not such buffer
+    """
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return None
+
+    if (
+        view.ndim != 1
+        or view.format not in formats
+        or view.itemsize != array.array(typecode).itemsize
+        or not view.c_contiguous
+    ):
+        return None
+
+    result = array.array(typecode)
+    result.frombytes(view.cast('B'))
+
+    return result
+
+
+def compact_converter(type_class, clean, default=None, compact=True):
+    """Builds converter resolving values to compact arrays
+
+    Args:
+        type_class (type): IntegerType or FloatType subclass
+        clean (callable): function cleaning a single item
+        default (any, optional): value used instead of None
+        compact (bool or str, optional): 'numpy' for NumPy arrays,
+                                         array.array otherwise
+
+    Returns:
+        callable: converter(value)
+    """
+    typecode, formats = next(
+        COMPACT_TYPECODES[base] for base in type_class.__mro__
+        if base in COMPACT_TYPECODES
+    )
+
+    if compact == 'numpy':
+        numpy = types.numpy
+        dtype = numpy.dtype(typecode)
+
+        def converter(value):
+            if value is None:
+                return default
+
+            if isinstance(value, (str, bytes, int, float)):
+                value = (value,)
+
+            if not hasattr(value, '__len__'):
+                return numpy.fromiter(map(clean, value), dtype)
+
+            result = numpy.asarray(value)
+
+            # other arrays are cleaned item by item, so values out of
+            # range raise instead of wrapping around
+            if result.ndim == 1 and numpy.can_cast(
+                result.dtype, dtype, 'safe'
+            ):
+                return result.astype(dtype, copy=False)
+
+            return numpy.fromiter(map(clean, value), dtype, len(value))
+
+        return converter
+
+    def converter(value):
+        if value is None:
+            return default
+
+        if isinstance(value, (str, bytes, int, float)):
+            value = (value,)
+
+        result = copy_buffer(value, typecode, formats)
+
+        if result is not None:
+            return result
+
+        if isinstance(value, (list, tuple)):
+            try:
+                # items that already have the right type
+                return array.array(typecode, value)
+            except TypeError:
+                pass
+
+        return array.array(typecode, map(clean, value))
+
+    return converter
+
+
 class List(Field):
     """
     Represents a collection of objects
+
+    Lists of IntegerType and FloatType values can be stored compactly,
+    with `compact=True` they resolve to `array.array`, with
+    `compact='numpy'` to NumPy arrays. Compact lists accept any iterable
+    or buffer of values, but can't contain None items.
     """
-    def __init__(self, *args, **kwargs):
+    many = True
+
+    def __init__(self, *args, compact=False, **kwargs):
         super(List, self).__init__(*args, **kwargs)
 
         if self.default is not None and not isinstance(self.default, list):
@@ -129,6 +352,40 @@ class List(Field):
                 'List field default value has to be a list or None.'
             )
 
+        self.compact = compact
+        self._compact_converter = None
+
+        if not compact:
+            return
+
+        if not any(
+            issubclass(self.type_class, type_class)
+            for type_class in COMPACT_TYPECODES
+        ):
+            raise TypeError(
+                'Only lists of `IntegerType` or `FloatType` values '
+                'can be compact.'
+            )
+
+        if compact == 'numpy' and types.numpy is None:
+            raise TypeError('Compact NumPy lists require NumPy.')
+
+        self._compact_converter = compact_converter(
+            self.type_class,
+            self.type_instance.clean,
+            default=self.default,
+            compact=compact,
+        )
+
+    def build_converter(self):
+        """
+        Builds converter for the field, see `BaseField.get_converter`
+        """
+        if self.compact and self.uses_default_resolution(List):
+            return self._compact_converter
+
+        return super(List, self).build_converter()
+
     def resolve(self, value):
         """Resolves list field value
 
@@ -144,6 +401,9 @@ class List(Field):
         Returns:
             list or None
         """
+        if self.compact:
+            return self._compact_converter(value)
+
         if value is None:
             return super(List, self).resolve(value)
 
@@ -155,36 +415,347 @@ class List(Field):
             for item in value
         ]
 
+    async def aresolve(self, value):
+        """
+        Resolves list field value asynchronously, nested objects with
+        async resolvers are created concurrently
+        """
+        type_class = self.type_class
+
+        if (
+            type(self).resolve is not List.resolve
+            or not issubclass(type_class, types.MapObject)
+            or not type_class._plan.is_async
+            or value is None
+        ):
+            return self.resolve(value)
+
+        if not isinstance(value, list):
+            return [await self._acreate_nested(value)]
+
+        return list(await asyncio.gather(*[
+            self._acreate_nested(item)
+            for item in value
+        ]))
+
 
 class Map(Field):
     """
     Resolves values with a map
+
+    Mapped values can be callables, which are called with the value.
+
+    Args:
+        map (dict, optional): { value: mapped value or callable } map
+        frozen (bool, optional): freeze the map returned by `get_map`
+                                 into a lookup table the first time the
+                                 field is used, values of the table are
+                                 resolved up front. Defaults to False.
+        cache_size (int, optional): cache up to cache_size results of
+                                    callable mappings. Defaults to None,
+                                    results are not cached.
     """
     def __init__(self, *args, **kwargs):
         self.map = kwargs.pop('map', {})
+        self.frozen = kwargs.pop('frozen', False)
+        self.cache_size = kwargs.pop('cache_size', None)
 
         super(Map, self).__init__(*args, **kwargs)
 
+        if self.cache_size:
+            self.call_mapping = functools.lru_cache(self.cache_size)(
+                self.call_mapping
+            )
+
     def get_map(self):
         return self.map
 
+    def call_mapping(self, mapping, value):
+        """
+        Returns result of callable mapping for value, cached
+        when the field has cache_size set
+        """
+        return mapping(value)
+
+    def map_value(self, mapping, value):
+        """
+        Returns value mapped with a callable mapping
+        """
+        if not self.cache_size:
+            return mapping(value)
+
+        try:
+            return self.call_mapping(mapping, value)
+        except TypeError:
+            try:
+                hash((mapping, value))
+            except TypeError:
+                # unhashable values are not cached
+                return mapping(value)
+
+            raise
+
     def resolve(self, value):
+        if self.frozen:
+            return self.get_frozen_converter()(value)
+
         mapping = self.get_map().get(value)
 
         if mapping:
-            value = mapping(value) if callable(mapping) else mapping
+            value = (
+                self.map_value(mapping, value) if callable(mapping)
+                else mapping
+            )
 
         return super(Map, self).resolve(value)
 
+    def freeze(self):
+        """Freezes current map into lookup tables
+
+        Returns:
+            tuple(dict, dict): resolved values of the map, and mapped
+                               values that have to be resolved on lookup,
+                               like callables or mutable values
+        """
+        resolve = super(Map, self).resolve
+        resolved = {}
+        deferred = {}
+
+        for key, mapping in self.get_map().items():
+            if not mapping:
+                # falsy mapped values leave values as they are
+                continue
+
+            if callable(mapping):
+                deferred[key] = mapping
+                continue
+
+            try:
+                value = resolve(mapping)
+            except (ValueError, TypeError):
+                # invalid mapped values raise on lookup, like unfrozen map
+                value = None
+
+            if type(value) in SCALARS and value is not None:
+                resolved[key] = value
+            else:
+                deferred[key] = mapping
+
+        return resolved, deferred
+
+    def build_converter(self):
+        """
+        Builds converter for the field, frozen maps resolve values
+        with lookup tables built by `freeze`
+        """
+        if not self.frozen or not self.uses_default_resolution(Map):
+            return self.resolve
+
+        return self.get_frozen_converter()
+
+    def get_frozen_converter(self):
+        """
+        Returns cached converter resolving values with lookup tables
+        built by `freeze`
+        """
+        converter = self.__dict__.get('_frozen_converter')
+
+        if converter is None:
+            converter = self.build_frozen_converter()
+            self._frozen_converter = converter
+
+        return converter
+
+    def build_frozen_converter(self):
+        """
+        Builds converter resolving values with lookup tables, see
+        `get_frozen_converter`
+        """
+        resolved, deferred = self.freeze()
+        resolve = super(Map, self).resolve
+        map_value = self.map_value
+        lookup = resolved.get
+        deferred_lookup = deferred.get
+
+        def converter(value):
+            result = lookup(value, MISSING)
+
+            if result is not MISSING:
+                return result
+
+            mapping = deferred_lookup(value)
+
+            if mapping is None:
+                return resolve(value)
+
+            if callable(mapping):
+                return resolve(map_value(mapping, value))
+
+            return resolve(mapping)
+
+        return converter
+
+    def resolve_column(self, values):
+        """Maps a column of values at once
+
+        Args:
+            values (iterable): values to map
+
+        Returns:
+            list: resolved values
+        """
+        return list(map(self.get_converter(), values))
+
+
+def iso_date(value):
+    """
+    Formats date with '%Y-%m-%d' format
+    """
+    return value.isoformat()[:10]
+
+
+def iso_datetime(separator):
+    """
+    Returns function formatting dates with '%Y-%m-%d<separator>%H:%M:%S'
+    """
+    def format_value(value):
+        if not isinstance(value, datetime.datetime):
+            return value.isoformat() + separator + '00:00:00'
+
+        return value.isoformat(separator, 'seconds')[:19]
+
+    return format_value
+
+
+# formats that can be written without strftime
+ISO_FORMATS = {
+    '%Y-%m-%d': iso_date,
+    '%Y-%m-%dT%H:%M:%S': iso_datetime('T'),
+    '%Y-%m-%d %H:%M:%S': iso_datetime(' '),
+}
+
 
 class Date(Field):
     """
     Resolves to string that represents a date
+
+    Accepts date and datetime objects, strings that are already
+    formatted, which are left as they are, and epoch timestamps in
+    seconds, which are formatted as UTC datetimes.
+
+    Args:
+        format (str, optional): strftime format. Defaults to '%Y-%m-%d'.
+        cache_size (int, optional): cache up to cache_size formatted
+                                    dates. Defaults to 1024, 0 disables
+                                    the cache.
     """
-    def __init__(self, format='%Y-%m-%d', **kwargs):
+    def __init__(self, format='%Y-%m-%d', cache_size=1024, **kwargs):
         self.format = format
+        self.cache_size = cache_size
         super(Date, self).__init__(types.DateStringType, **kwargs)
 
     def resolve(self, value):
-        date_string = value.strftime(self.format)
-        return super(Date, self).resolve(date_string)
+        return self.get_formatter()(value)
+
+    def get_formatter(self):
+        """
+        Returns cached function formatting values, see `build_formatter`
+        """
+        formatter = self.__dict__.get('_formatter')
+
+        if formatter is None:
+            formatter = self.build_formatter()
+            self._formatter = formatter
+
+        return formatter
+
+    def build_formatter(self):
+        """Builds function formatting values
+
+        Formats listed in ISO_FORMATS are written without strftime,
+        formatted dates are cached by value and timezone.
+
+        Returns:
+            callable: formatter(value)
+        """
+        date_format = self.format
+        iso_format = ISO_FORMATS.get(date_format)
+
+        def format_date(value, tzinfo=None):
+            if (
+                iso_format is not None
+                and isinstance(value, datetime.date)
+                and value.year >= 1000
+            ):
+                return iso_format(value)
+
+            return value.strftime(date_format)
+
+        if self.cache_size:
+            format_date = functools.lru_cache(self.cache_size)(format_date)
+
+        default = self.default
+        fromtimestamp = datetime.datetime.fromtimestamp
+        utc = datetime.timezone.utc
+        resolve = super(Date, self).resolve
+
+        def formatter(value):
+            if value is None:
+                return default
+
+            kind = type(value)
+
+            if kind is str:
+                return value
+
+            if kind is int or kind is float:
+                value = fromtimestamp(value, utc)
+
+            # equal datetimes in different timezones format differently
+            return format_date(value, getattr(value, 'tzinfo', None))
+
+        if type(self).clean is BaseField.clean:
+            return formatter
+
+        def clean_formatter(value):
+            return resolve(formatter(value))
+
+        return clean_formatter
+
+    def build_converter(self):
+        """
+        Builds converter for the field, see `BaseField.get_converter`
+        """
+        if not self.uses_default_resolution(Date):
+            return self.resolve
+
+        return self.get_formatter()
+
+    def resolve_column(self, values):
+        """Formats a column of values at once
+
+        NumPy datetime64 arrays are formatted in a single vectorized
+        operation for '%Y-%m-%d' format.
+
+        Args:
+            values (iterable): values to format
+
+        Returns:
+            list: formatted values
+        """
+        if (
+            types.numpy is not None
+            and isinstance(values, types.numpy.ndarray)
+            and values.dtype.kind == 'M'
+            and self.format == '%Y-%m-%d'
+            and self.uses_default_resolution(Date)
+        ):
+            default = self.default
+            strings = types.numpy.datetime_as_string(values, unit='D')
+
+            return [
+                default if string == 'NaT' else string
+                for string in strings.tolist()
+            ]
+
+        return list(map(self.get_converter(), values))
@@ -0,0 +1,310 @@
+"""
+Human readable construction plans of MapObject classes.
+
+`explain` prints how a class is constructed: fields with their
+parameter bindings, nested and list expansion, resolver execution order
+and fields inherited from or removed in base classes. `profile` maps
+sample parameters with the class and prints the same plan annotated
+with measured cost of every field.
+"""
+import sys
+import time
+
+from paramap.base import DeclarativeFieldsMetaclass
+from paramap.instrumentation import SchemaStats
+
+
+def field_origins(schema):
+    """Finds classes that declared fields of schema
+
+    Args:
+        schema (MapObject): inspected class
+
+    Returns:
+        dict: {field name: class declaring the field}
+    """
+    origins = {}
+
+    for name, field in schema.base_fields.items():
+        for klass in reversed(schema.__mro__):
+            if getattr(klass, 'base_fields', {}).get(name) is field:
+                origins[name] = klass
+                break
+
+    return origins
+
+
+def removed_fields(schema):
+    """Finds fields of base classes removed by setting them to None
+
+    Args:
+        schema (MapObject): inspected class
+
+    Returns:
+        dict: {field name: (class declaring the field,
+                            class removing the field)}
+    """
+    removed = {}
+
+    for klass in schema.__mro__:
+        for attr, value in vars(klass).items():
+            if (
+                value is not None
+                or attr in schema.base_fields
+                or attr in removed
+            ):
+                continue
+
+            for base in klass.__mro__[1:]:
+                if attr in getattr(base, 'base_fields', {}):
+                    removed[attr] = (field_origins(base)[attr], klass)
+                    break
+
+    return removed
+
+
+def field_kind(field):
+    """
+    Returns field class name, along with its type when it is not
+    implied by the name, eg. `String` or `List(IntegerType)`
+    """
+    kind = type(field).__name__
+    type_name = getattr(field.type_class, '__name__', repr(field.type_class))
+
+    if type_name in (kind + 'Type', 'AnyType'):
+        return kind
+
+    return f'{kind}({type_name})'
+
+
+def binding(field_plan):
+    """
+    Returns description of parameters used by a field
+    """
+    if field_plan.whole_parameters:
+        source = 'whole parameters'
+    elif field_plan.param:
+        source = field_plan.param
+    else:
+        source = '-'
+
+    notes = []
+
+    if getattr(field_plan.field, 'required', False):
+        notes.append('required')
+
+    default = getattr(field_plan.field, 'default', None)
+
+    if default is not None:
+        notes.append(f'default={default!r}')
+
+    if field_plan.resolver:
+        notes.append(f'resolver resolve_{field_plan.name}')
+
+    if notes:
+        source += f' ({", ".join(notes)})'
+
+    return source
+
+
+def dependencies(field_plan):
+    """
+    Returns description of fields and parameters used by a resolver
+    """
+    if field_plan.depends_fields is None:
+        return 'undeclared dependencies'
+
+    return 'fields: {}; parameters: {}'.format(
+        ', '.join(field_plan.depends_fields) or '-',
+        ', '.join(field_plan.depends_parameters) or '-',
+    )
+
+
+def cost(call_stats, total):
+    """
+    Returns description of measured cost of a field or resolver
+    """
+    per_call = call_stats.time / call_stats.calls if call_stats.calls else 0
+    share = call_stats.time / total if total else 0
+
+    text = (
+        f'{call_stats.time * 1e3:9.3f} ms {share:6.1%} '
+        f'{per_call * 1e6:9.2f} us/call'
+    )
+
+    if call_stats.defaults:
+        text += f', {call_stats.default_rate:.0%} default'
+
+    if call_stats.errors:
+        text += f', {call_stats.errors} errors'
+
+    return text
+
+
+def plan_lines(schema, stats=None, indent='', seen=()):
+    """Describes construction plan of schema
+
+    Args:
+        schema (MapObject): described class
+        stats (SchemaStats, optional): measured cost of fields
+        indent (str, optional): prefix of every line, used for nested
+                                classes
+        seen (tuple, optional): classes being described, which are not
+                                expanded again
+
+    Returns:
+        list: lines of the description
+    """
+    plan = schema._plan
+    seen = seen + (schema,)
+    options = ', '.join(
+        f'{key}={value!r}' for key, value in schema._options.items()
+    )
+    lines = [
+        f'{indent}{schema.__module__}.{schema.__qualname__}'
+        + (f' ({options})' if options else '')
+    ]
+
+    if not plan.fields:
+        lines.append(f'{indent}  no fields')
+        return lines
+
+    width = max(len(field_plan.name) for field_plan in plan.fields)
+    lines.append(f'{indent}  fields, in resolution order:')
+
+    for field_plan in plan.fields:
+        line = (
+            f'{indent}    {field_plan.name:{width}}  '
+            f'{field_kind(field_plan.field)} <- {binding(field_plan)}'
+        )
+
+        if stats is not None:
+            line += '\n{}      cost: {}'.format(
+                indent, cost(stats.field(field_plan.name), stats.time)
+            )
+
+        lines.append(line)
+
+        if not field_plan.nested:
+            continue
+
+        nested = field_plan.field.type_class
+        expansion = 'list of' if field_plan.many else 'nested'
+
+        if nested in seen:
+            lines.append(
+                f'{indent}      {expansion} {nested.__qualname__}, '
+                'see above'
+            )
+            continue
+
+        lines.append(f'{indent}      {expansion}:')
+        lines.extend(plan_lines(nested, indent=indent + '        ', seen=seen))
+
+    if plan.pending:
+        lines.append(f'{indent}  resolvers, in execution order:')
+
+        for position, field_plan in enumerate(plan.pending, 1):
+            line = (
+                f'{indent}    {position}. {field_plan.name:{width}}  '
+                f'resolve_{field_plan.name}'
+                f'{" (async)" if field_plan.is_async else ""}, '
+                f'{dependencies(field_plan)}'
+            )
+
+            if stats is not None:
+                line += '\n{}      cost: {}'.format(
+                    indent, cost(stats.resolver(field_plan.name), stats.time)
+                )
+
+            lines.append(line)
+
+    inherited = {
+        name: origin for name, origin in field_origins(schema).items()
+        if origin is not schema
+    }
+
+    if inherited:
+        lines.append(f'{indent}  inherited fields:')
+        lines.extend(
+            f'{indent}    {name:{width}}  from {origin.__qualname__}'
+            for name, origin in inherited.items()
+        )
+
+    removed = removed_fields(schema)
+
+    if removed:
+        lines.append(f'{indent}  removed fields:')
+        lines.extend(
+            f'{indent}    {name}  declared in {origin.__qualname__}, '
+            f'removed in {remover.__qualname__}'
+            for name, (origin, remover) in removed.items()
+        )
+
+    return lines
+
+
+def explain(schema, file=None):
+    """Prints construction plan of a MapObject class
+
+    Example:
+        ::
+
+            paramap.explain(Person)
+
+    Args:
+        schema (MapObject): explained class
+        file (file, optional): output file, defaults to sys.stdout
+    """
+    if not isinstance(schema, DeclarativeFieldsMetaclass):
+        raise TypeError(f'{schema!r} is not a MapObject class.')
+
+    print('\n'.join(plan_lines(schema)), file=file or sys.stdout)
+
+
+def profile(schema, samples, file=None):
+    """Maps samples and prints construction plan with measured cost
+
+    Samples are mapped with instrumented version of the class init, see
+    `paramap.instrumentation`, so the absolute times are higher than
+    in regular mapping, but show which fields and resolvers dominate.
+    Cost of nested fields includes construction of nested objects.
+    Construction cache, custom `__init__` and laziness of the class are
+    bypassed, all fields are resolved.
+
+    Example:
+        ::
+
+            paramap.profile(Person, rows[:1000])
+
+    Args:
+        schema (MapObject): profiled class
+        samples (iterable): parameter dictionaries
+        file (file, optional): output file, defaults to sys.stdout
+
+    Returns:
+        SchemaStats: measured statistics
+    """
+    if not isinstance(schema, DeclarativeFieldsMetaclass):
+        raise TypeError(f'{schema!r} is not a MapObject class.')
+
+    stats = SchemaStats(schema)
+    init = schema._plan.instrumented_init(stats)
+    new = object.__new__
+    count = 0
+    start = time.perf_counter()
+
+    for parameters in samples:
+        init(new(schema), parameters or {})
+        count += 1
+
+    elapsed = time.perf_counter() - start
+    lines = plan_lines(schema, stats)
+    lines.append(
+        f'  {count} samples in {elapsed * 1e3:.3f} ms, '
+        f'{stats.time * 1e3:.3f} ms in fields and resolvers'
+    )
+
+    print('\n'.join(lines), file=file or sys.stdout)
+
+    return stats
@@ -0,0 +1,232 @@
+"""
+Instrumentation of MapObject classes.
+
+When enabled, records call counts, cumulative time and exception counts
+of field converters, resolvers, `to_dict` and `to_json`, along with the
+number of fields falling back to their default, aggregated per class.
+
+Instrumented classes construct instances with a plain Python version of
+the generated init function, other classes are not affected at all.
+Instances created with `from_columns`, `acreate`, `Registry.map_all`,
+updated with `update`, and values of lazy fields are not instrumented.
+
+Example:
+    ::
+
+        from paramap import instrumentation
+
+        instrumentation.enable()
+        Person.map_many(rows)
+
+        for schema, stats in instrumentation.stats().items():
+            print(schema.__name__, stats.as_dict())
+
+        instrumentation.disable()
+"""
+import time
+
+# True when all classes, including ones created later, are instrumented
+enabled = False
+
+# instrumented class -> SchemaStats
+_instrumented = {}
+
+
+class CallStats:
+    """
+    Statistics of calls of a single function
+    """
+    __slots__ = ('calls', 'time', 'errors', 'defaults')
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.errors = 0
+        # number of calls made with None, which resolve to field default
+        self.defaults = 0
+
+    def call(self, function, *args):
+        """
+        Calls function with args and records the call
+        """
+        start = time.perf_counter()
+
+        try:
+            return function(*args)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.time += time.perf_counter() - start
+            self.calls += 1
+
+    @property
+    def default_rate(self):
+        """
+        Returns fraction of calls that fell back to the default
+        """
+        return self.defaults / self.calls if self.calls else 0.0
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'time': self.time,
+            'errors': self.errors,
+            'defaults': self.defaults,
+            'default_rate': self.default_rate,
+        }
+
+
+class SchemaStats:
+    """
+    Statistics of a single MapObject class
+    """
+    def __init__(self, schema):
+        self.schema = schema
+        self.fields = {}
+        self.resolvers = {}
+        self.methods = {}
+
+    def field(self, name):
+        """
+        Returns statistics of field converter
+        """
+        return self.fields.setdefault(name, CallStats())
+
+    def resolver(self, name):
+        """
+        Returns statistics of field resolver
+        """
+        return self.resolvers.setdefault(name, CallStats())
+
+    def calls(self, name):
+        """
+        Returns statistics of a method, like to_dict
+        """
+        return self.methods.setdefault(name, CallStats())
+
+    @property
+    def time(self):
+        """
+        Returns cumulative time of field converters and resolvers
+        """
+        return sum(
+            stats.time for stats in (
+                *self.fields.values(), *self.resolvers.values()
+            )
+        )
+
+    def reset(self):
+        for group in (self.fields, self.resolvers, self.methods):
+            for stats in group.values():
+                stats.__init__()
+
+    def as_dict(self):
+        return {
+            'fields': {
+                name: stats.as_dict() for name, stats in self.fields.items()
+            },
+            'resolvers': {
+                name: stats.as_dict()
+                for name, stats in self.resolvers.items()
+            },
+            'methods': {
+                name: stats.as_dict() for name, stats in self.methods.items()
+            },
+        }
+
+
+def instrument(schema):
+    """Starts recording statistics of a MapObject class
+
+    Args:
+        schema (MapObject): instrumented class
+
+    Returns:
+        SchemaStats: statistics of the class
+    """
+    plan = schema._plan
+
+    if plan.stats is None:
+        plan.stats = SchemaStats(schema)
+        plan.stats.init = plan.init
+
+        if not plan.lazy:
+            plan.init = plan.instrumented_init()
+
+        plan.serializers.clear()
+        plan.json_encoders.clear()
+        _instrumented[schema] = plan.stats
+
+    return plan.stats
+
+
+def uninstrument(schema):
+    """
+    Stops recording statistics of a MapObject class
+    """
+    plan = schema._plan
+
+    if plan.stats is None:
+        return
+
+    plan.init = plan.stats.init
+    plan.stats = None
+    plan.serializers.clear()
+    plan.json_encoders.clear()
+    _instrumented.pop(schema, None)
+
+
+def enable(registry=None):
+    """Enables instrumentation
+
+    Args:
+        registry (Registry, optional): instrument only schemas registered
+                                       in registry. By default all classes
+                                       are instrumented, including classes
+                                       created later.
+    """
+    global enabled
+
+    if registry is not None:
+        for schema in registry:
+            instrument(schema)
+
+        return
+
+    from .types import MapObject
+
+    enabled = True
+    classes = [MapObject]
+
+    while classes:
+        schema = classes.pop()
+        instrument(schema)
+        classes.extend(schema.__subclasses__())
+
+
+def disable():
+    """
+    Disables instrumentation of all classes
+    """
+    global enabled
+
+    enabled = False
+
+    for schema in list(_instrumented):
+        uninstrument(schema)
+
+
+def stats():
+    """
+    Returns { class: SchemaStats } of instrumented classes
+    """
+    return dict(_instrumented)
+
+
+def reset():
+    """
+    Resets statistics of all instrumented classes
+    """
+    for schema_stats in _instrumented.values():
+        schema_stats.reset()
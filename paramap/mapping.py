@@ -0,0 +1,339 @@
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from paramap import registry
+
+
+def chunked(iterable, chunk_size):
+    """Splits iterable into lists of chunk_size items
+
+    Args:
+        iterable (iterable): items to split
+        chunk_size (int): maximum number of items in a chunk
+
+    Yields:
+        list: chunk of items, the last one can be shorter
+    """
+    if chunk_size < 1:
+        raise ValueError('Chunk size has to be a positive integer.')
+
+    iterator = iter(iterable)
+
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def stream(schema, parameters_iterable, to_dict=False, skip_none=True,
+           chunk_size=None):
+    """Lazily maps an iterable of parameter dictionaries
+
+    Items are consumed from the iterable only when the result is requested,
+    so the iterable can be unbounded and memory usage does not depend on
+    its size.
+
+    Example:
+        ::
+
+            with open('people.jsonl') as lines:
+                for person in stream(Person, map(json.loads, lines)):
+                    print(person.first_name)
+
+    Args:
+        schema (MapObject): MapObject subclass to map parameters with
+        parameters_iterable (iterable): parameter dictionaries
+        to_dict (bool, optional): yield `.to_dict()` output instead of
+                                  instances. Defaults to False.
+        skip_none (bool, optional): passed to `.to_dict()`.
+                                    Defaults to True.
+        chunk_size (int, optional): yield lists of up to chunk_size
+                                    results instead of single results.
+                                    Defaults to None.
+
+    Yields:
+        Union[MapObject, dict, list]: mapped results or chunks of them
+    """
+    mapper = schema._mapper()
+
+    if to_dict:
+        create = mapper
+
+        def mapper(parameters):
+            return create(parameters).to_dict(skip_none=skip_none)
+
+    if chunk_size is None:
+        yield from map(mapper, parameters_iterable)
+        return
+
+    for chunk in chunked(parameters_iterable, chunk_size):
+        yield [mapper(parameters) for parameters in chunk]
+
+
+_loaded_schemas = {}
+
+
+def schema_reference(schema):
+    """Returns a reference that worker processes can load schema with
+
+    Schemas are referenced by their import path, eg. `package.module:Name`.
+    Schemas that can not be imported, like classes defined in functions,
+    are referenced by their name in the global registry.
+
+    Args:
+        schema (Union[MapObject, str]): MapObject subclass, import path
+                                        or global registry name
+
+    Returns:
+        str: schema reference
+    """
+    if isinstance(schema, str):
+        return schema
+
+    reference = f'{schema.__module__}:{schema.__qualname__}'
+
+    if '<locals>' not in schema.__qualname__:
+        return reference
+
+    global_registry = registry.get_global_registry()
+
+    if global_registry.get(schema.__name__) is schema:
+        return schema.__name__
+
+    raise ValueError(
+        f'Schema {reference} can not be imported by worker processes, '
+        'define it at module level or register it in the global registry.'
+    )
+
+
+def load_schema(reference):
+    """Loads schema class from reference
+
+    Args:
+        reference (str): import path in `package.module:Name` format,
+                         or global registry name
+
+    Returns:
+        MapObject: schema class
+    """
+    if ':' in reference:
+        return registry.import_schema(reference)
+
+    schema = registry.get_global_registry().get(reference)
+
+    if schema is None:
+        raise LookupError(
+            f'Schema {reference} is not registered in the '
+            'global registry.'
+        )
+
+    return schema
+
+
+def map_chunk(reference, chunk, to_dict=False, skip_none=True):
+    """Maps chunk of parameter dictionaries in a worker process
+
+    Args:
+        reference (str): schema reference
+        chunk (list): parameter dictionaries
+        to_dict (bool, optional): return `.to_dict()` output
+        skip_none (bool, optional): passed to `.to_dict()`
+
+    Returns:
+        tuple(list, float): mapped results and time spent mapping them
+    """
+    started = time.perf_counter()
+
+    if reference not in _loaded_schemas:
+        _loaded_schemas[reference] = load_schema(reference)
+
+    results = _loaded_schemas[reference].map_many(chunk)
+
+    if to_dict:
+        results = [result.to_dict(skip_none=skip_none) for result in results]
+
+    return results, time.perf_counter() - started
+
+
+def registry_context(executor=None):
+    """Returns multiprocessing context of workers that can load schemas
+    by global registry name
+
+    Workers only see the global registry of the parent process when
+    they are forked, workers started with spawn or forkserver methods
+    import modules from scratch.
+
+    Args:
+        executor (ProcessPoolExecutor, optional): checked executor
+
+    Returns:
+        multiprocessing.context.BaseContext: fork context
+    """
+    context = getattr(executor, '_mp_context', None)
+
+    if executor is None and 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+
+    if context is None or context.get_start_method() != 'fork':
+        raise ValueError(
+            'Schemas referenced by global registry name can only be mapped '
+            'by workers started with fork method, define the schema at '
+            'module level to map it with other start methods.'
+        )
+
+    return context
+
+
+class ChunkSizer:
+    """
+    Adapts chunk size to measured cost of mapping a single row, so every
+    chunk takes about `target_time` seconds in a worker.
+    """
+    def __init__(self, initial=64, target_time=0.05, minimum=1,
+                 maximum=10000):
+        self.size = initial
+        self.target_time = target_time
+        self.minimum = minimum
+        self.maximum = maximum
+        self.row_cost = None
+
+    def update(self, rows, elapsed):
+        """
+        Updates row cost estimate with measured chunk and returns
+        the new chunk size
+        """
+        if not rows:
+            return self.size
+
+        row_cost = elapsed / rows
+
+        if self.row_cost is None:
+            self.row_cost = row_cost
+        else:
+            # exponential moving average smooths out noisy chunks
+            self.row_cost = (self.row_cost + row_cost) / 2
+
+        if self.row_cost > 0:
+            size = int(self.target_time / self.row_cost)
+        else:
+            size = self.maximum
+
+        self.size = min(self.maximum, max(self.minimum, size))
+
+        return self.size
+
+
+def map_parallel(schema, parameters_iterable, workers=None, to_dict=False,
+                 skip_none=True, chunk_size=None, iterator=False,
+                 executor=None):
+    """Maps parameter dictionaries in a pool of worker processes
+
+    Schemas are shipped to workers by import path or global registry name,
+    see `schema_reference`. Schemas referenced by registry name need
+    workers started with fork method, and since they usually can't be
+    pickled, they have to be mapped with `to_dict=True`. Unless
+    chunk_size is given, chunk size adapts
+    to measured mapping cost, so cheap schemas are not dominated by
+    inter-process communication and expensive ones still balance well
+    between workers. Results keep the order of parameters.
+
+    Example:
+        ::
+
+            people = map_parallel(Person, rows, workers=4, to_dict=True)
+
+    Args:
+        schema (Union[MapObject, str]): MapObject subclass, import path
+                                        or global registry name
+        parameters_iterable (iterable): parameter dictionaries
+        workers (int, optional): number of worker processes.
+                                 Defaults to number of CPUs.
+        to_dict (bool, optional): return `.to_dict()` output instead of
+                                  instances. Defaults to False.
+        skip_none (bool, optional): passed to `.to_dict()`.
+                                    Defaults to True.
+        chunk_size (int, optional): fixed chunk size. Defaults to None.
+        iterator (bool, optional): return a lazy iterator instead of
+                                   a list. Defaults to False.
+        executor (ProcessPoolExecutor, optional): executor to reuse
+                                                  instead of creating
+                                                  a new one.
+
+    Returns:
+        Union[list, iterator]: mapped results
+    """
+    reference = schema_reference(schema)
+    # fail early when schema can't be loaded
+    load_schema(reference)
+    context = None
+
+    if ':' not in reference:
+        if not to_dict:
+            raise ValueError(
+                f'Instances of schema {reference} referenced by global '
+                'registry name can not be sent back from worker processes, '
+                'map it with `to_dict=True`.'
+            )
+
+        context = registry_context(executor)
+
+    results = _map_parallel(
+        reference, parameters_iterable, workers, to_dict, skip_none,
+        chunk_size, executor, context,
+    )
+
+    if iterator:
+        return results
+
+    return list(results)
+
+
+def _map_parallel(reference, parameters_iterable, workers, to_dict,
+                  skip_none, chunk_size, executor, context=None):
+    if executor is None:
+        options = {'mp_context': context} if context else {}
+
+        with ProcessPoolExecutor(max_workers=workers, **options) as executor:
+            yield from _map_parallel(
+                reference, parameters_iterable, workers, to_dict,
+                skip_none, chunk_size, executor,
+            )
+        return
+
+    sizer = ChunkSizer(initial=chunk_size or 64)
+    iterator = iter(parameters_iterable)
+    # bound number of chunks in flight to keep memory flat
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    pending = deque()
+
+    def submit():
+        chunk = list(islice(iterator, sizer.size))
+
+        if not chunk:
+            return False
+
+        pending.append(executor.submit(
+            map_chunk, reference, chunk, to_dict, skip_none
+        ))
+
+        return True
+
+    while len(pending) < max_pending and submit():
+        pass
+
+    while pending:
+        results, elapsed = pending.popleft().result()
+
+        if chunk_size is None:
+            sizer.update(len(results), elapsed)
+
+        submit()
+
+        yield from results
@@ -1,53 +1,478 @@
+import importlib
+from types import MappingProxyType
+
+from .base import BaseType
+from .compiler import MISSING
+from .fields import Field
+
+try:
+    from importlib import metadata
+except ImportError:  # pragma: no cover
+    try:
+        import importlib_metadata as metadata
+    except ImportError:
+        metadata = None
+
+
+def import_schema(reference):
+    """Imports schema class from its import path
+
+    Args:
+        reference (str): import path in `package.module:Name` format
+
+    Returns:
+        MapObject: schema class
+    """
+    module_name, qualname = reference.split(':', 1)
+    schema = importlib.import_module(module_name)
+
+    for name in qualname.split('.'):
+        schema = getattr(schema, name)
+
+    return schema
+
+
+def group_entry_points(group):
+    """
+    Returns entry points of installed packages in group, without
+    loading them
+    """
+    if metadata is None:  # pragma: no cover
+        raise ImportError(
+            'Entry point discovery requires Python 3.8 '
+            'or importlib_metadata package.'
+        )
+
+    entry_points = metadata.entry_points()
+
+    if hasattr(entry_points, 'select'):
+        return entry_points.select(group=group)
+
+    return entry_points.get(group, ())  # pragma: no cover
+
 
 class Registry:
+    """
+    Collection of MapObject classes, keeps an index of parameters
+    used by registered schemas up to date on every registration.
+
+    Schemas can also be registered by import path or discovered through
+    entry points, see `register_path` and `register_entry_points`.
+    Their modules are imported when the schema is looked up with `get`,
+    or when all schemas are needed, eg. by `schemas`, `match`, `map_all`,
+    parameter properties or iteration.
+    """
     def __init__(self):
-        self.schemas = {}
+        self._schemas = {}
+        # schema name -> (import path, function importing the schema),
+        # see `register_path`
+        self._pending = {}
+        self._parameters = {}
+        self._required_parameters = {}
+        self._optional_parameters = {}
+        # parameter name -> names of schemas requiring it
+        self._required_index = {}
+        # schema name -> (registration position, required parameters count)
+        self._schema_requirements = {}
+        # names of schemas without required parameters
+        self._unconditional = []
+        # fan-out function of registered schemas, see `map_all`
+        self._fan_out = None
 
     def __iter__(self):
         for schema in self.schemas.values():
             yield schema
 
-    def register(self, schema_class):
-        key = schema_class.__name__
+    @property
+    def schemas(self):
+        """
+        Returns { name: schema } of registered schemas, importing
+        schemas registered lazily
+        """
+        if self._pending:
+            self._load_pending()
+
+        return self._schemas
+
+    def get(self, name, default=None):
+        """Returns registered schema by name
+
+        Only the module of the requested schema is imported, when the
+        schema was registered lazily.
+
+        Args:
+            name (str): name of the schema
+            default (any, optional): returned when the schema
+                                     is not registered
+
+        Returns:
+            MapObject: schema class
+        """
+        if name in self._pending:
+            self._load(name)
+
+        return self._schemas.get(name, default)
+
+    def register(self, schema_class, name=None):
+        """Registers schema
 
-        if key in self.schemas.keys():
+        Args:
+            schema_class (MapObject): registered schema
+            name (str, optional): registry name, defaults to class name
+        """
+        key = name or schema_class.__name__
+        pending = self._pending.get(key)
+
+        if pending is not None and pending[0] == (
+            f'{schema_class.__module__}:{schema_class.__qualname__}'
+        ):
+            # lazily registered schema registering itself on import
+            del self._pending[key]
+        elif key in self._schemas or pending is not None:
             raise ValueError(
                 f'Schema with name {key} already '
                 'exists in the registry.'
             )
 
-        self.schemas[schema_class.__name__] = schema_class
+        self._schemas[key] = schema_class
+        self._index_parameters(schema_class)
+        self._index_requirements(key, schema_class)
+        self._fan_out = None
 
-    @property
-    def parameters(self):
-        all_parameters = {}
+    def register_path(self, reference, name=None):
+        """Registers schema by import path, without importing it
 
-        for schema in self.schemas.values():
-            schema_parameters = {
-                parameter.name: parameter for parameter
-                in schema().parameters.values()
-                if not all_parameters.get(parameter.name) or parameter.required
+        Args:
+            reference (str): import path in `package.module:Name` format
+            name (str, optional): registry name, defaults to the last
+                                  part of the path
+        """
+        if ':' not in reference:
+            raise ValueError(
+                f'Invalid schema path {reference}, '
+                'expected `package.module:Name` format.'
+            )
+
+        self._register_pending(
+            name or reference.split(':', 1)[1].rsplit('.', 1)[-1],
+            reference,
+            lambda: import_schema(reference),
+        )
+
+    def register_entry_points(self, group):
+        """Registers schemas of installed packages, without importing them
+
+        Schemas are discovered through entry points in group, named
+        after the schemas, eg. in `setup.py`:
+        ::
+
+            entry_points={
+                'myapp.schemas': ['Person = myapp.schemas:Person'],
             }
 
-            all_parameters.update(schema_parameters)
+        Args:
+            group (str): entry point group
+        """
+        for entry_point in group_entry_points(group):
+            self._register_pending(
+                entry_point.name, entry_point.value, entry_point.load
+            )
+
+    def _register_pending(self, key, reference, load):
+        if key in self._schemas or key in self._pending:
+            raise ValueError(
+                f'Schema with name {key} already '
+                'exists in the registry.'
+            )
+
+        # entry point values can have spaces around the colon
+        self._pending[key] = (reference.replace(' ', ''), load)
+
+    def _load(self, key):
+        """
+        Imports lazily registered schema and registers it
+        """
+        # removed up front, so schemas looked up while importing
+        # don't import the module again
+        pending = self._pending.pop(key)
+
+        try:
+            schema_class = pending[1]()
+        except BaseException:
+            self._pending[key] = pending
+            raise
+
+        # importing could have registered the schema already
+        if self._schemas.get(key) is not schema_class:
+            self.register(schema_class, key)
+
+    def _load_pending(self):
+        for key in list(self._pending):
+            if key in self._pending:
+                self._load(key)
+
+    def _index_parameters(self, schema_class):
+        """Merges schema parameters into the registry parameter index
+
+        Parameters already present in the index are only replaced
+        by required ones.
+
+        Args:
+            schema_class (MapObject): registered schema
+        """
+        catalog = schema_class.parameter_catalog()
+
+        for name, parameter in catalog.parameters.items():
+            if name in self._parameters and not parameter.required:
+                continue
+
+            self._parameters[name] = parameter
+
+            if parameter.required:
+                self._required_parameters[name] = parameter
+                self._optional_parameters.pop(name, None)
+            else:
+                self._optional_parameters[name] = parameter
+
+    def _index_requirements(self, key, schema_class):
+        """Adds schema to the inverted index of required parameters
 
-        return all_parameters
+        Args:
+            key (str): name of registered schema
+            schema_class (MapObject): registered schema
+        """
+        required = schema_class.parameter_catalog().required
+
+        self._schema_requirements[key] = (
+            len(self._schema_requirements), len(required)
+        )
+
+        if not required:
+            self._unconditional.append(key)
+
+        for name in required:
+            self._required_index.setdefault(name, []).append(key)
+
+    def match(self, parameters):
+        """Returns schemas whose required parameters are all present
+
+        Uses inverted index of required parameters, so the cost depends
+        on the number of passed parameters and not the number of
+        registered schemas. Schemas without required parameters always
+        match.
+
+        Args:
+            parameters (iterable): parameter dict or parameter names
+
+        Returns:
+            list: matching schemas in registration order
+        """
+        return [self._schemas[key] for key in self._match_keys(parameters)]
+
+    def _match_keys(self, parameters):
+        """
+        Returns names of schemas matching parameters, see `match`
+        """
+        if self._pending:
+            self._load_pending()
+
+        index = self._required_index
+        requirements = self._schema_requirements
+        counts = {}
+
+        if not isinstance(parameters, dict):
+            # repeated names would be counted more than once
+            parameters = set(parameters)
+
+        for name in parameters:
+            for key in index.get(name, ()):
+                counts[key] = counts.get(key, 0) + 1
+
+        matched = [
+            key for key, count in counts.items()
+            if count == requirements[key][1]
+        ]
+        matched.extend(self._unconditional)
+        matched.sort(key=lambda key: requirements[key][0])
+
+        return matched
+
+    def map_all(self, parameters, match=False):
+        """Creates an instance of every registered schema from parameters
+
+        Parameters used by many schemas are looked up and cast once,
+        for all fields that cast them the same way, and the cast values
+        are shared by all created instances.
+
+        Args:
+            parameters (dict): parameters of all instances
+            match (bool, optional): create only schemas returned by
+                                    `match`. Defaults to False.
+
+        Returns:
+            dict: { schema name: instance } in registration order
+        """
+        parameters = parameters or {}
+
+        if match:
+            keys = self._match_keys(parameters)
+        else:
+            keys = None
+
+        if self._pending:
+            self._load_pending()
+
+        if self._fan_out is None:
+            self._fan_out = self._build_fan_out()
+
+        return self._fan_out(parameters, keys)
+
+    def _build_fan_out(self):
+        """Builds function creating instances of schemas with shared casts
+
+        Targets and casts of all registered schemas are prepared once,
+        schemas to create are picked when the function is called.
+
+        Returns:
+            callable: fan_out(parameters, keys=None) returning
+                      { name: instance } for schemas named in keys,
+                      or all registered schemas
+        """
+        casts = {}
+        targets = {}
+
+        for key, schema in self._schemas.items():
+            if (
+                not schema._uses_plan()
+                or schema._plan.lazy
+                or schema.construction_cache() is not None
+            ):
+                targets[key] = (schema._mapper(), None, None)
+                continue
+
+            columns = []
+            indexes = []
+
+            for field_plan in schema._plan:
+                cast_key = shared_cast_key(field_plan)
+
+                if cast_key is None:
+                    continue
+
+                if cast_key not in casts:
+                    casts[cast_key] = (
+                        len(casts),
+                        field_plan.param,
+                        field_plan.field.get_converter(),
+                    )
+
+                columns.append(field_plan.name)
+                indexes.append(casts[cast_key][0])
+
+            targets[key] = (
+                schema, schema._plan.column_init(columns), indexes
+            )
+
+        casts = [cast[1:] for cast in sorted(casts.values())]
+        all_targets = tuple(targets.items())
+        new = object.__new__
+
+        def fan_out(parameters, keys=None):
+            get = parameters.get
+            result = {}
+
+            if keys is None:
+                selected = all_targets
+                values = [convert(get(param)) for param, convert in casts]
+            else:
+                selected = [(key, targets[key]) for key in keys]
+                # only casts used by selected schemas are done
+                values = [MISSING] * len(casts)
+
+                for _, (_, init, indexes) in selected:
+                    for index in indexes or ():
+                        if values[index] is MISSING:
+                            param, convert = casts[index]
+                            values[index] = convert(get(param))
+
+            for key, (schema, init, indexes) in selected:
+                if init is None:
+                    result[key] = schema(parameters)
+                    continue
+
+                instance = new(schema)
+                init(instance, parameters, [values[i] for i in indexes])
+                result[key] = instance
+
+            return result
+
+        return fan_out
+
+    @property
+    def parameters(self):
+        """
+        Returns read-only mapping of parameters used by registered schemas
+        """
+        if self._pending:
+            self._load_pending()
+
+        return MappingProxyType(self._parameters)
 
     @property
     def required_parameters(self):
-        return {
-            parameter.name: parameter
-            for parameter in self.parameters.values()
-            if parameter.required
-        }
+        """
+        Returns read-only mapping of required parameters
+        """
+        if self._pending:
+            self._load_pending()
+
+        return MappingProxyType(self._required_parameters)
 
     @property
     def optional_parameters(self):
-        return {
-            parameter.name: parameter
-            for parameter in self.parameters.values()
-            if not parameter.required
-        }
+        """
+        Returns read-only mapping of optional parameters
+        """
+        if self._pending:
+            self._load_pending()
+
+        return MappingProxyType(self._optional_parameters)
+
+
+def shared_cast_key(field_plan):
+    """Returns key of the cast done by a field, or None
+
+    Fields with equal keys resolve parameter values the same way, so
+    the cast values can be shared. Only plain scalar fields bound to
+    a parameter have keys.
+
+    Args:
+        field_plan (FieldPlan): field to get the key for
+
+    Returns:
+        tuple or None: (param, type class, default type, default)
+    """
+    field = field_plan.field
+
+    if (
+        field_plan.nested
+        or field_plan.param is None
+        or not isinstance(field, Field)
+        or not field.uses_default_resolution(Field)
+        or field.type_class.resolve is not BaseType.resolve
+    ):
+        return None
+
+    key = (
+        field_plan.param, field.type_class, type(field.default), field.default
+    )
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
 
 
 registry = None
@@ -1,7 +1,119 @@
-from functools import partial
-from collections import OrderedDict
+import array
+import asyncio
+from itertools import repeat
+from types import MappingProxyType
 
 from .base import BaseType, DeclarativeFieldsMetaclass
+from .cache import ConstructionCache, instance_copier
+from .compiler import SCALARS
+from .encoders import encode
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def cast_column(values, cast, numpy_cast=None):
+    """Casts a column of values with a cast function
+
+    Columns backed by arrays or buffers are cast by NumPy in a single
+    vectorized operation when it's installed and the array dtype allows it,
+    other columns are cast with a single `map` call. If any value fails to
+    cast, the column is cast value by value to build an error mask.
+
+    Args:
+        values (iterable): column of values
+        cast (callable): function casting a single value
+        numpy_cast (callable, optional): function casting a numpy array
+                                         to list, or returning None
+                                         when it can't cast it
+
+    Returns:
+        tuple(list, list): cast values and error mask, see
+                           `BaseType.clean_column`
+    """
+    if not hasattr(values, '__len__'):
+        values = list(values)
+
+    if (
+        numpy is not None
+        and numpy_cast is not None
+        and not isinstance(values, (list, tuple))
+    ):
+        array = numpy.asarray(values)
+
+        if array.ndim == 1:
+            cleaned = numpy_cast(array)
+
+            if cleaned is not None:
+                return cleaned, None
+
+    try:
+        return list(map(cast, values)), None
+    except (ValueError, TypeError):
+        pass
+
+    cleaned = []
+    errors = []
+
+    for value in values:
+        try:
+            cleaned.append(cast(value))
+            errors.append(False)
+        except (ValueError, TypeError):
+            cleaned.append(None)
+            errors.append(True)
+
+    return cleaned, errors
+
+
+def numpy_integers(array):
+    """
+    Casts numeric numpy array to list of integers
+    """
+    kind = array.dtype.kind
+
+    if kind in 'iu':
+        return array.tolist()
+
+    if kind == 'b':
+        return array.astype(numpy.int8).tolist()
+
+    if kind == 'f':
+        if not array.size:
+            return []
+
+        # int() raises for nan and inf, and has no upper bound
+        if not numpy.isfinite(array).all():
+            return None
+
+        if numpy.abs(array).max() >= 2 ** 63:
+            return None
+
+        return array.astype(numpy.int64).tolist()
+
+    return None
+
+
+def numpy_floats(array):
+    """
+    Casts numeric numpy array to list of floats
+    """
+    if array.dtype.kind in 'iubf':
+        return array.astype(numpy.float64).tolist()
+
+    return None
+
+
+def numpy_bools(array):
+    """
+    Casts numeric numpy array to list of bools
+    """
+    if array.dtype.kind in 'iubf':
+        return (array != 0).tolist()
+
+    return None
 
 
 class AnyType(BaseType):
@@ -15,17 +127,30 @@ class StringType(BaseType):
     """
     Resolves to string
     """
+    target_type = str
+
     def clean(self, value):
         """
         Casts value to string
         """
         return str(value)
 
+    def clean_column(self, values):
+        """
+        Casts column of values to strings
+        """
+        if type(self).clean is not StringType.clean:
+            return super(StringType, self).clean_column(values)
+
+        return cast_column(values, str)
+
 
 class IntegerType(BaseType):
     """
     Resolves to integer
     """
+    target_type = int
+
     def clean(self, value):
         """
         Casts value to integer
@@ -39,11 +164,22 @@ class IntegerType(BaseType):
 
         return value
 
+    def clean_column(self, values):
+        """
+        Casts column of values to integers
+        """
+        if type(self).clean is not IntegerType.clean:
+            return super(IntegerType, self).clean_column(values)
+
+        return cast_column(values, int, numpy_integers)
+
 
 class FloatType(BaseType):
     """
     Resolves to float
     """
+    target_type = float
+
     def clean(self, value):
         """
         Casts value to float
@@ -57,17 +193,37 @@ class FloatType(BaseType):
 
         return value
 
+    def clean_column(self, values):
+        """
+        Casts column of values to floats
+        """
+        if type(self).clean is not FloatType.clean:
+            return super(FloatType, self).clean_column(values)
+
+        return cast_column(values, float, numpy_floats)
+
 
 class BoolType(BaseType):
     """
     Resolves to bool
     """
+    target_type = bool
+
     def clean(self, value):
         """
         Casts value to bool
         """
         return bool(value)
 
+    def clean_column(self, values):
+        """
+        Casts column of values to bools
+        """
+        if type(self).clean is not BoolType.clean:
+            return super(BoolType, self).clean_column(values)
+
+        return cast_column(values, bool, numpy_bools)
+
 
 class DateStringType(StringType):
     """
@@ -98,6 +254,97 @@ class Parameter:
         return self.name == other.name
 
 
+def serialize(value, skip_none=True):
+    """Recursively casts value to its dictionary representation
+
+    Lists, tuples and arrays are cast to lists, MapObject instances are
+    cast to dictionaries with serializers compiled for their class.
+
+    Args:
+        value (any): value to cast
+        skip_none (bool, optional): skip fields with None values.
+                                    Defaults to True.
+
+    Returns:
+        any: cast value
+    """
+    if isinstance(value, (list, tuple)):
+        return [
+            item if type(item) in SCALARS else serialize(item, skip_none)
+            for item in value
+        ]
+
+    if isinstance(value, MapObject):
+        return value._plan.serializer(skip_none, serialize)(value)
+
+    if isinstance(value, array.array) or (
+        numpy is not None and isinstance(value, numpy.ndarray)
+    ):
+        # compact lists
+        return value.tolist()
+
+    return value
+
+
+class ParameterCatalog:
+    """
+    Read-only catalog of parameters used by MapObject class,
+    including parameters of nested objects.
+    """
+    def __init__(self, parameters):
+        self.parameters = MappingProxyType(dict(parameters))
+        self.required = MappingProxyType({
+            name: parameter for name, parameter in self.parameters.items()
+            if parameter.required
+        })
+        self.optional = MappingProxyType({
+            name: parameter for name, parameter in self.parameters.items()
+            if not parameter.required
+        })
+
+    def __iter__(self):
+        return iter(self.parameters)
+
+    def __len__(self):
+        return len(self.parameters)
+
+    def __contains__(self, name):
+        return name in self.parameters
+
+    @classmethod
+    def for_class(cls, map_class):
+        """Builds parameter catalog of MapObject class
+
+        Args:
+            map_class (MapObject): class to build the catalog for
+
+        Returns:
+            ParameterCatalog: new catalog
+        """
+        result = {}
+
+        for field in map_class.base_fields.values():
+
+            if issubclass(field.type_class, MapObject):
+                # reuse nested map objects catalog, required
+                # parameters take precedence over optional ones
+                nested_parameters = {
+                    parameter.name: parameter for parameter in
+                    field.type_class.parameter_catalog().parameters.values()
+                    if result.get(parameter.name) is None or parameter.required
+                }
+
+                result.update(nested_parameters)
+                continue
+
+            field_parameter = field.parameter
+
+            if field_parameter:
+                result[field_parameter.name] = field_parameter
+
+        return cls(result)
+
+
 class MapObject(metaclass=DeclarativeFieldsMetaclass):
     """
     Main map type class meant to be inherited by other classes
@@ -130,7 +377,8 @@ class MapObject(metaclass=DeclarativeFieldsMetaclass):
 
     Resolve methods will be called only after all fields without resolvers are
     set. After that, when there is more than one resolver in the class, each
-    of them will be called from top to bottom. Remember about it when
+    of them will be called from top to bottom, unless dependencies declared
+    with `paramap.depends` require otherwise. Remember about it when
     accessing other attributes.
 
     Each non nested field can have a default value set in type definition.
@@ -177,6 +425,8 @@ class MapObject(metaclass=DeclarativeFieldsMetaclass):
             }
 
     """
+    __slots__ = ()
+
     def __init__(self, parameters=None, **kwargs):
         """Initializes map type instance
 
@@ -199,78 +449,383 @@ class MapObject(metaclass=DeclarativeFieldsMetaclass):
             initial (dict, optional): initial values passed as kwargs.
 
         """
-        # Pending resolvers are used after all other values
-        # have been set, to make it possible to use them
-        # in the resolver function body
-        pending_resolvers = OrderedDict()
+        # Field order, parameter bindings and resolvers are compiled
+        # by DeclarativeFieldsMetaclass, pending resolvers are executed
+        # after all other values have been set, to make it possible
+        # to use them in the resolver function body
+        self._plan.init(self, parameters, initial)
+
+    @classmethod
+    async def acreate(cls, parameters=None, **kwargs):
+        """Creates class instance asynchronously
+
+        Supports `async def` resolvers. Fields and nested objects resolve
+        concurrently, after that pending resolvers run from top to bottom.
+        Consecutive async resolvers declaring their dependencies with
+        `paramap.depends` run concurrently with `asyncio.gather`, unless
+        they depend on each other. Other resolvers wait for all resolvers
+        above them to finish.
+
+        Instances created this way do not go through __init__.
+
+        Example:
+            ::
+
+                class Person(MapObject):
+                    id = Integer(param='PERSON_ID')
+                    name = String()
+                    avatar = String()
+
+                    @depends('id')
+                    async def resolve_name(self, value, parameters):
+                        return await fetch_name(self.id)
+
+                    @depends('id')
+                    async def resolve_avatar(self, value, parameters):
+                        return await fetch_avatar(self.id)
+
+                person = await Person.acreate({'PERSON_ID': 1})
+
+        Args:
+            parameters (dict, optional): a dictionary with { field: value }
+                                         pairs. Defaults to {}.
+            kwargs (dict): directly initialized fields
+
+        Returns:
+            MapObject: new instance
+        """
+        instance = cls.__new__(cls)
+        await instance._ainit_with_fields(parameters or {}, initial=kwargs)
+
+        return instance
+
+    async def _ainit_with_fields(self, parameters, initial=None):
+        """Initializes field values asynchronously
 
-        for key, field in self.base_fields.items():
-            # traverse base fields and initialize values
-            value = initial.get(key, None)
+        Args:
+            parameters (dict): a dictionary with { field: value } pairs.
+            initial (dict, optional): initial values passed as kwargs.
+        """
+        initial = initial or {}
+        fields = []
+
+        for field_plan in self._plan:
+            value = initial.get(field_plan.name)
 
             if value:
-                # if value is set through kwargs, simply set attribute
-                setattr(self, key, field.resolve(value))
+                fields.append((field_plan, value, False))
+            elif field_plan.whole_parameters:
+                fields.append((field_plan, parameters, True))
+            else:
+                fields.append(
+                    (field_plan, parameters.get(field_plan.param), True)
+                )
+
+        values = await asyncio.gather(*[
+            field_plan.field.aresolve(value)
+            for field_plan, value, _ in fields
+        ])
+
+        if self._plan.updatable:
+            self._parameters = parameters
+
+        pending = {}
+
+        for (field_plan, _, from_parameters), value in zip(fields, values):
+            if from_parameters and field_plan.resolver:
+                pending[field_plan.name] = value
                 continue
 
-            if issubclass(field.type_class, MapObject) and not field.param:
-                value = field.resolve(parameters)
-            else:
-                value = field.resolve(parameters.get(field.param))
+            setattr(self, field_plan.name, value)
 
-            resolver = getattr(self, 'resolve_' + key, None)
+        batch = []
 
-            if resolver:
-                # keep resolvers for later execution
-                pending_resolvers[key] = partial(resolver, value, parameters)
+        for field_plan in self._plan.pending:
+            if field_plan.name not in pending:
                 continue
 
-            setattr(self, key, value)
+            value = pending[field_plan.name]
+            resolver = getattr(self, 'resolve_' + field_plan.name)
 
-        # execute delayed resolvers
-        for attr, resolver in pending_resolvers.items():
-            # inject parameters argument to the resolver
-            resolved_value = resolver()
-            setattr(self, attr, resolved_value)
+            # only resolvers declaring their dependencies are known
+            # not to read values of resolvers running with them
+            independent = field_plan.is_async and (
+                field_plan.depends_fields is not None
+            )
 
-    def to_dict(self, skip_none=True):
-        """Deep casts current object to a dictionary
+            if independent and not any(
+                name in field_plan.depends_fields for name, _ in batch
+            ):
+                batch.append((field_plan.name, resolver(value, parameters)))
+                continue
+
+            await self._run_resolver_batch(batch)
+            batch = []
+
+            if independent:
+                batch.append((field_plan.name, resolver(value, parameters)))
+                continue
+
+            value = resolver(value, parameters)
+
+            if field_plan.is_async:
+                value = await value
+
+            setattr(self, field_plan.name, value)
+
+        await self._run_resolver_batch(batch)
+
+    async def _run_resolver_batch(self, batch):
+        """
+        Runs batch of async resolvers concurrently and sets their results
+        """
+        if not batch:
+            return
+
+        results = await asyncio.gather(*[
+            coroutine for _, coroutine in batch
+        ])
+
+        for (name, _), result in zip(batch, results):
+            setattr(self, name, result)
+
+    def update(self, changed_parameters):
+        """Updates fields affected by changed parameters
+
+        Only fields bound to changed parameters are resolved again, along
+        with resolvers depending on them (see `paramap.depends`), in
+        resolution order. Resolvers without declared dependencies run
+        on every update. Fields passed as keyword arguments on creation
+        are resolved from parameters when affected.
+
+        Only classes created with `updatable=True` option, which keep
+        parameters on instances, and lazy classes can be updated.
+
+        Example:
+            ::
+
+                class Person(MapObject, updatable=True):
+                    ...
+
+                person = Person({'FIRST_NAME': 'John', 'LAST_NAME': 'Doe'})
+                person.update({'LAST_NAME': 'Smith'})
+
+        Args:
+            changed_parameters (dict): changed { parameter: value } pairs
+        """
+        plan = self._plan
+
+        if plan.lazy:
+            # affected values are dropped and resolve again on access
+            parameters, initial = getattr(self, '_lazy_state', ({}, None))
+            names = {field.name for field in plan.affected(changed_parameters)}
+
+            if initial:
+                initial = {
+                    name: value for name, value in initial.items()
+                    if name not in names
+                }
+
+            self._lazy_state = ({**parameters, **changed_parameters}, initial)
+
+            for name in names:
+                self.__dict__.pop(name, None)
+
+            return
+
+        if not plan.updatable:
+            raise TypeError(
+                f'{type(self).__qualname__} does not keep its parameters, '
+                'create the class with `updatable=True` to update it.'
+            )
+
+        parameters = getattr(self, '_parameters', None) or {}
+        plan.update(changed_parameters)(
+            self, {**parameters, **changed_parameters}
+        )
+
+    @classmethod
+    def map_many(cls, parameters_iterable, iterator=False):
+        """Maps a batch of parameter dictionaries to class instances
+
+        Results are the same as calling the class with each parameter
+        dictionary, but construction goes straight through the compiled
+        plan instead of paying for __init__ dispatch on every item.
+
+        Args:
+            parameters_iterable (iterable): parameter dictionaries
+            iterator (bool, optional): return a lazy iterator instead
+                                       of a list. Defaults to False.
 
         Returns:
-            dict: dictionary with { field: value } pairs
+            Union[list, iterator]: MapObject instances
+        """
+        mapped = map(cls._mapper(), parameters_iterable)
+
+        if iterator:
+            return mapped
+
+        return list(mapped)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Maps columnar parameters to class instances
+
+        Scalar fields bound to a column resolve the whole column at once
+        with `resolve_column`, the remaining fields and resolvers are
+        handled row by row. Results are the same as mapping each row with
+        the constructor.
+
+        Example:
+            ::
+
+                people = Person.from_columns({
+                    'FIRST_NAME': ['John', 'Jane'],
+                    'AGE': ['32', '28'],
+                })
+
+        Args:
+            columns (dict): { parameter: sequence of values } pairs,
+                            all sequences have to be of the same length
+
+        Returns:
+            list: MapObject instances
         """
-        def recursive_to_dict(obj=None):
-            """Recursively casts object to a dictionary
+        columns = {
+            param: values if hasattr(values, '__len__') else list(values)
+            for param, values in columns.items()
+        }
 
-            Args:
-                obj (any): object to be casted. Defaults to None.
+        lengths = {len(values) for values in columns.values()}
 
-            Returns:
-                dict: dictionary with { field: value } pairs
-            """
-            result = {}
+        if len(lengths) > 1:
+            raise ValueError('All columns must have the same length.')
 
-            if isinstance(obj, list) or isinstance(obj, tuple):
-                # cast iterable members to dict
-                return [recursive_to_dict(obj=o) for o in obj]
+        length = lengths.pop() if lengths else 0
 
-            if not isinstance(obj, MapObject):
-                # if not a map type, return literal value
-                return obj
+        plan = cls._plan
 
-            for name, field in obj.base_fields.items():
-                # if map type, traverse all fields
-                value = getattr(obj, name, None)
+        if not cls._uses_plan():
+            return cls.map_many(
+                dict(zip(columns, values))
+                for values in zip(*columns.values())
+            )
 
-                if skip_none and value is None:
-                    continue
+        # rows are only needed when resolvers or nested fields
+        # use parameters other than their own column
+        if plan.pending or any(field.whole_parameters for field in plan):
+            rows = [
+                dict(zip(columns, values))
+                for values in zip(*columns.values())
+            ]
+        else:
+            rows = repeat({}, length)
+
+        resolved_fields = [
+            field for field in plan
+            if not field.whole_parameters and field.param in columns
+        ]
+
+        init = plan.column_init(field.name for field in resolved_fields)
+        resolved = [
+            field.field.resolve_column(columns[field.param])
+            for field in resolved_fields
+        ]
+
+        new = object.__new__
+        instances = []
+
+        for parameters, values in zip(rows, zip(*resolved) if resolved
+                                      else repeat((), length)):
+            instance = new(cls)
+            init(instance, parameters, values)
+            instances.append(instance)
+
+        return instances
+
+    @classmethod
+    def _uses_plan(cls):
+        """
+        Returns True if instances can be initialized directly with the
+        compiled construction plan, skipping __init__
+        """
+        return (
+            cls.__new__ is object.__new__
+            and cls.__init__ is MapObject.__init__
+            and cls._init_with_fields is MapObject._init_with_fields
+        )
+
+    @classmethod
+    def _mapper(cls):
+        """Returns a function that creates instance from parameters
 
-                key = field.verbose_name or name
-                result[key] = recursive_to_dict(obj=value)
+        Classes that customize instance creation or initialization
+        are always created through the constructor. Classes with
+        construction cache create instances through the cache.
+
+        Returns:
+            callable: function taking parameters dict
+        """
+        cache = cls.construction_cache()
 
-            return result
+        if cache is not None:
+            return cache.get
 
-        return recursive_to_dict(obj=self)
+        return cls._creator()
+
+    @classmethod
+    def _creator(cls):
+        """
+        Returns a function that creates new instance from parameters,
+        without going through construction cache
+        """
+        if cls._uses_plan():
+            new = object.__new__
+            # init is looked up on every call, instrumentation replaces it
+            plan = cls._plan
+
+            def mapper(parameters):
+                instance = new(cls)
+                plan.init(instance, parameters or {})
+                return instance
+
+            return mapper
+
+        def mapper(parameters):
+            # type.__call__ skips the construction cache of the metaclass
+            return type.__call__(cls, parameters=parameters)
+
+        return mapper
+
+    def to_dict(self, skip_none=True):
+        """Deep casts current object to a dictionary
+
+        Uses a serializer compiled for the class, with output keys
+        computed up front.
+
+        Args:
+            skip_none (bool, optional): skip fields with None values.
+                                        Defaults to True.
+
+        Returns:
+            dict: dictionary with { field: value } pairs
+        """
+        return self._plan.serializer(skip_none, serialize)(self)
+
+    def to_json(self, skip_none=True):
+        """Encodes current object to JSON text
+
+        Output is the same as compact `json.dumps` of `.to_dict()` output,
+        but it's encoded straight from field values.
+
+        Args:
+            skip_none (bool, optional): skip fields with None values.
+                                        Defaults to True.
+
+        Returns:
+            str: JSON text
+        """
+        return self._plan.json_encoder(skip_none, encode)(self)
 
     def resolve(self, value):
         """Returns a new class instance
@@ -298,64 +853,109 @@ class MapObject(metaclass=DeclarativeFieldsMetaclass):
         """
         return value
 
-    @property
-    def parameters(self):
-        """
-        Returns all parameters used in MapObject definition including
-        nested objects.
+    @classmethod
+    def parameter_catalog(cls):
+        """Returns catalog of parameters used by the class
+
+        Catalog is built once per class, the first time it's used,
+        and reuses catalogs of nested classes.
 
         Returns:
-            dict({ String: Parameter }): a dictionary containing
-                                         { parameter_name: Parameter }
-                                         key and value pairs.
+            ParameterCatalog: class parameter catalog
         """
-        result = {}
+        catalog = cls.__dict__.get('_parameter_catalog')
 
-        for field in self.base_fields.values():
+        if catalog is None:
+            catalog = ParameterCatalog.for_class(cls)
+            cls._parameter_catalog = catalog
 
-            if issubclass(field.type_class, MapObject):
-                # resolve nested map objects required parameters
-                # and update result
-                nested_parameters = {
-                    parameter.name: parameter for parameter in
-                    field.type_class().parameters.values()
-                    if result.get(parameter.name) is None or parameter.required
-                }
+        return catalog
 
-                result.update(nested_parameters)
-                continue
+    @classmethod
+    def construction_cache(cls):
+        """Returns construction cache of the class, or None
 
-            field_parameter = field.parameter
+        Classes created with `cache_size` class option cache instances
+        created from parameters only. Cache keys are built from values
+        of parameters the class consumes - the ones in its parameter
+        catalog and the ones declared by resolvers with `paramap.depends`.
+        If any resolver does not declare its parameters, the whole
+        parameters dictionary is used as the key.
 
-            if field_parameter:
-                result[field_parameter.name] = field_parameter
+        Example:
+            ::
+
+                class Person(MapObject, cache_size=1024, cache_ttl=60):
+                    first_name = String(param='FIRST_NAME')
+
+                Person({'FIRST_NAME': 'John'})
+                Person({'FIRST_NAME': 'John'})  # cache hit
+                Person.construction_cache().hits  # 1
+
+        Returns:
+            ConstructionCache: cache created on first use
+        """
+        cache = cls.__dict__.get('_construction_cache')
+
+        if cache is None:
+            options = cls._options
+
+            if not options.get('cache_size'):
+                return None
+
+            names = cls._plan.consumed_parameters()
+
+            if names is not None:
+                names = sorted(
+                    names | set(cls.parameter_catalog()),
+                    key=repr,
+                )
+
+            cache = ConstructionCache(
+                cls._creator(),
+                names=names,
+                maxsize=options['cache_size'],
+                ttl=options.get('cache_ttl'),
+                copy=(
+                    instance_copier(cls)
+                    if options.get('cache_copy', True) else None
+                ),
+            )
+            cls._construction_cache = cache
 
-        return result
+        return cache
+
+    @property
+    def parameters(self):
+        """
+        Returns all parameters used in MapObject definition including
+        nested objects.
+
+        Returns:
+            MappingProxyType({ String: Parameter }): a read-only mapping
+                                                     containing
+                                                     { parameter_name:
+                                                     Parameter }
+                                                     key and value pairs.
+        """
+        return self.parameter_catalog().parameters
 
     @property
     def required_parameters(self):
         """
-        Returns a set of required parameters
+        Returns required parameters
 
         Returns:
-            dict: required parameters
+            MappingProxyType: required parameters
         """
-        return {
-            parameter.name: parameter for parameter
-            in self.parameters.values()
-            if parameter.required
-        }
+        return self.parameter_catalog().required
 
     @property
     def optional_parameters(self):
         """
-        Returns a set of optional parameters
+        Returns optional parameters
 
         Returns:
-            dict: optional parameters
+            MappingProxyType: optional parameters
         """
-        return {
-            parameter.name: parameter for parameter
-            in self.parameters.values()
-            if not parameter.required
-        }
+        return self.parameter_catalog().optional
@@ -55,3 +55,77 @@ class DeclarativeFieldsMetaclassTest(unittest.TestCase):
         self.assertFalse('not_registered' in instance.base_fields)
         self.assertTrue('test_field_1' not in instance.base_fields)
         self.assertTrue('test_field_2' in instance.base_fields)
+
+    def test_construction_plan(self):
+        class NestedClass(metaclass=DeclarativeFieldsMetaclass):
+            pass
+
+        class TestClass(metaclass=DeclarativeFieldsMetaclass):
+            test_field_1 = BaseType()
+            test_field_2 = BaseType()
+            test_field_3 = BaseType()
+
+            def resolve_test_field_2(self, value, parameters):
+                return value
+
+        TestClass.base_fields['test_field_3'].type_class = NestedClass
+        plan = TestClass.build_plan()
+
+        self.assertEqual(
+            [field.name for field in plan],
+            ['test_field_1', 'test_field_2', 'test_field_3'],
+        )
+        self.assertEqual(
+            [field.name for field in plan.pending],
+            ['test_field_2'],
+        )
+        self.assertFalse(plan.fields[0].nested)
+        self.assertTrue(plan.fields[2].nested)
+        self.assertTrue(plan.fields[2].whole_parameters)
+        self.assertTrue(callable(plan.init))
+
+    def test_construction_plan_excludes_removed_fields(self):
+        class ParentClass(metaclass=DeclarativeFieldsMetaclass):
+            test_field_1 = BaseType()
+            test_field_2 = BaseType()
+
+        class ChildClass(ParentClass):
+            test_field_1 = None
+
+        self.assertEqual(
+            [field.name for field in ChildClass._plan],
+            ['test_field_2'],
+        )
+
+    def test_class_options_inheritance(self):
+        class ParentClass(metaclass=DeclarativeFieldsMetaclass, slots=True):
+            test_field_1 = BaseType()
+
+        class ChildClass(ParentClass):
+            test_field_2 = BaseType()
+
+        class NoSlotsClass(ParentClass, slots=False):
+            pass
+
+        self.assertEqual(ParentClass._options, {'slots': True})
+        self.assertEqual(ChildClass._options, {'slots': True})
+        self.assertEqual(NoSlotsClass._options, {'slots': False})
+
+    def test_slots(self):
+        class ParentClass(metaclass=DeclarativeFieldsMetaclass, slots=True):
+            test_field_1 = BaseType()
+            test_field_2 = BaseType()
+
+        class ChildClass(ParentClass):
+            test_field_2 = None
+            test_field_3 = BaseType()
+
+        self.assertEqual(ParentClass.__slots__,
+                         ('test_field_1', 'test_field_2'))
+        self.assertEqual(ChildClass.__slots__, ('test_field_3',))
+
+    def test_unknown_class_option(self):
+        with self.assertRaises(TypeError):
+            class TestClass(metaclass=DeclarativeFieldsMetaclass,
+                            unknown_option=True):
+                pass
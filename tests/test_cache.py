@@ -0,0 +1,140 @@
+import unittest
+from unittest.mock import patch
+from paramap.cache import ConstructionCache, instance_copier
+from paramap.compiler import depends
+from paramap.fields import Any, Integer, Nested
+from paramap.types import MapObject
+
+
+class CountingMap(MapObject, cache_size=2, updatable=True):
+    test_field_1 = Integer(param='test_param_1')
+    test_field_2 = Any()
+
+    @depends('test_field_1', parameters=['test_param_2'])
+    def resolve_test_field_2(self, value, parameters):
+        type(self).calls += 1
+        return parameters.get('test_param_2')
+
+
+CountingMap.calls = 0
+
+
+class ConstructionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        CountingMap.construction_cache().clear()
+        CountingMap.calls = 0
+
+    def test_cache_hits(self):
+        first = CountingMap({'test_param_1': '1', 'test_param_2': 2})
+        second = CountingMap({
+            'test_param_1': '1',
+            'test_param_2': 2,
+            'not_consumed': 3,
+        })
+
+        self.assertEqual(CountingMap.calls, 1)
+        self.assertEqual(second.test_field_1, 1)
+        self.assertEqual(second.test_field_2, 2)
+        # cached instances are copied by default
+        self.assertIsNot(first, second)
+
+        cache = CountingMap.construction_cache()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # values of different types are cached separately
+        CountingMap({'test_param_1': 1, 'test_param_2': 2})
+        self.assertEqual(CountingMap.calls, 2)
+
+    def test_cache_bypass(self):
+        CountingMap({'test_param_1': 1}, test_field_2='initial')
+        CountingMap({'test_param_1': 1}, test_field_2='initial')
+        CountingMap({'test_param_2': [1]})
+        CountingMap({'test_param_2': [1]})
+
+        self.assertEqual(CountingMap.calls, 2)
+        self.assertEqual(len(CountingMap.construction_cache()), 0)
+
+    def test_copies_are_independent(self):
+        first = CountingMap({'test_param_1': 1, 'test_param_2': 2})
+        first.update({'test_param_2': 3})
+
+        second = CountingMap({'test_param_1': 1, 'test_param_2': 2})
+
+        self.assertEqual(first.test_field_2, 3)
+        self.assertEqual(second.test_field_2, 2)
+
+    def test_lru_eviction(self):
+        for value in (1, 2, 1, 3, 1, 2):
+            CountingMap({'test_param_1': value})
+
+        cache = CountingMap.construction_cache()
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+        self.assertEqual(len(cache), 2)
+
+    def test_ttl(self):
+        created = []
+
+        def create(parameters):
+            created.append(parameters)
+            return object()
+
+        cache = ConstructionCache(create, names=['a'], ttl=10)
+
+        with patch('paramap.cache.time.monotonic', return_value=0):
+            cache.get({'a': 1})
+            cache.get({'a': 1})
+
+        with patch('paramap.cache.time.monotonic', return_value=10):
+            cache.get({'a': 1})
+
+        self.assertEqual(len(created), 2)
+
+    def test_undeclared_resolvers(self):
+        class TestMap(MapObject, cache_size=10, cache_copy=False):
+            test_field_1 = Any(param='test_param_1')
+            test_field_2 = Any()
+
+            def resolve_test_field_2(self, value, parameters):
+                return parameters.get('test_param_2')
+
+        first = TestMap({'test_param_1': 1, 'test_param_2': 2})
+
+        self.assertIs(TestMap({'test_param_1': 1, 'test_param_2': 2}), first)
+        self.assertEqual(
+            TestMap({'test_param_1': 1, 'test_param_2': 3}).test_field_2, 3
+        )
+        self.assertIsNone(TestMap.construction_cache().names)
+
+    def test_nested_and_inherited(self):
+        class NestedMap(MapObject, slots=True, cache_size=10):
+            test_field_1 = Any(param='test_param_1')
+
+        class TestMap(MapObject):
+            test_nested = Nested(NestedMap)
+
+        class ChildMap(NestedMap, cache_size=None):
+            pass
+
+        first = TestMap({'test_param_1': 1}).test_nested
+        second = TestMap.map_many([{'test_param_1': 1}])[0].test_nested
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.test_field_1, 1)
+        self.assertEqual(NestedMap.construction_cache().hits, 1)
+        self.assertEqual(
+            NestedMap.construction_cache().names, ('test_param_1',)
+        )
+        self.assertIsNone(ChildMap.construction_cache())
+        self.assertEqual(ChildMap({'test_param_1': 2}).test_field_1, 2)
+
+    def test_instance_copier(self):
+        class TestMap(MapObject, lazy=True):
+            test_field_1 = Any(param='test_param_1')
+
+        instance = TestMap({'test_param_1': 1})
+        copy = instance_copier(TestMap)(instance)
+
+        self.assertEqual(copy.test_field_1, 1)
+        self.assertIs(copy._lazy_state, instance._lazy_state)
+        self.assertNotIn('test_field_1', instance.__dict__)
@@ -0,0 +1,110 @@
+import io
+import json
+import math
+import unittest
+
+import paramap
+from paramap.encoders import dump_jsonl, encode
+from paramap.types import MapObject
+from paramap.fields import Any, Float, List, Nested, String
+
+
+class NestedMap(MapObject):
+    test_field_1 = String(param='test_param_1')
+
+
+class SampleMap(MapObject):
+    test_field_1 = String(param='test_param_1', verbose_name='verbose')
+    test_field_2 = Float(param='test_param_2')
+    test_field_3 = Any(param='test_param_3')
+    test_nested = Nested(NestedMap)
+    test_list = List(NestedMap, param='test_param_list')
+
+
+PARAMETERS = {
+    'test_param_1': 'zażółć "quoted"',
+    'test_param_2': 1.5,
+    'test_param_3': [1, True, None, (2.5, 'text'), {'key': 'value'}],
+    'test_param_list': [{'test_param_1': 'item'}, {}],
+}
+
+
+def dumps(value):
+    return json.dumps(value, separators=(',', ':'))
+
+
+class EncodeTest(unittest.TestCase):
+
+    def test_encode_scalars(self):
+        for value in [None, True, False, 0, -12, 1.5, 'text', '\n"',
+                      math.nan, math.inf, -math.inf, [1, [2]], (1, 2),
+                      {'key': [1]}]:
+            self.assertEqual(encode(value), dumps(value))
+
+    def test_to_json(self):
+        instance = SampleMap(PARAMETERS)
+
+        for skip_none in (True, False):
+            self.assertEqual(
+                instance.to_json(skip_none=skip_none),
+                dumps(instance.to_dict(skip_none=skip_none)),
+            )
+
+        self.assertEqual(
+            json.loads(instance.to_json())['test_nested'],
+            {'test_field_1': PARAMETERS['test_param_1']},
+        )
+
+    def test_to_json_repeated_keys(self):
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1', verbose_name='key')
+            test_field_2 = Any(param='test_param_2')
+            test_field_3 = Any(param='test_param_3', verbose_name='key')
+
+        for parameters in (
+            {'test_param_1': 1, 'test_param_2': 2, 'test_param_3': 3},
+            {'test_param_1': 1, 'test_param_2': 2},
+        ):
+            instance = TestMap(parameters)
+
+            for skip_none in (True, False):
+                self.assertEqual(
+                    instance.to_json(skip_none=skip_none),
+                    dumps(instance.to_dict(skip_none=skip_none)),
+                )
+
+
+class DumpJsonlTest(unittest.TestCase):
+
+    def test_package_export(self):
+        self.assertIs(paramap.dump_jsonl, dump_jsonl)
+
+    def test_dump_text(self):
+        rows = [PARAMETERS, {'test_param_list': []}] * 5
+        instances = SampleMap.map_many(rows)
+        fileobj = io.StringIO()
+
+        count = dump_jsonl(instances, fileobj, buffer_size=100)
+
+        self.assertEqual(count, 10)
+        self.assertEqual(
+            fileobj.getvalue().splitlines(),
+            [dumps(instance.to_dict()) for instance in instances],
+        )
+
+    def test_dump_binary(self):
+        instances = SampleMap.map_many([PARAMETERS])
+        fileobj = io.BytesIO()
+
+        dump_jsonl(iter(instances), fileobj, skip_none=False)
+
+        self.assertEqual(
+            fileobj.getvalue(),
+            dumps(instances[0].to_dict(skip_none=False)).encode() + b'\n',
+        )
+
+    def test_dump_empty(self):
+        fileobj = io.StringIO()
+
+        self.assertEqual(dump_jsonl([], fileobj), 0)
+        self.assertEqual(fileobj.getvalue(), '')
@@ -1,8 +1,18 @@
+import array
+import asyncio
 import unittest
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import patch
 
-from paramap.types import MapObject, StringType, Parameter
+from paramap import types
+from paramap.types import (
+    MapObject,
+    StringType,
+    IntegerType,
+    FloatType,
+    BoolType,
+    Parameter,
+)
 from paramap.fields import (
     Field,
     Any,
@@ -14,6 +24,7 @@ from paramap.fields import (
     List,
     Nested,
     Date,
+    ISO_FORMATS,
 )
 
 
@@ -70,6 +81,229 @@ class FieldTest(unittest.TestCase):
         self.assertFalse(field.required)
 
 
+class ColumnTest(unittest.TestCase):
+
+    def test_clean_column(self):
+        cleaned, errors = IntegerType().clean_column(['1', 2, 3.5])
+
+        self.assertEqual(cleaned, [1, 2, 3])
+        self.assertIsNone(errors)
+
+        cleaned, errors = FloatType().clean_column(['1.5', 2])
+
+        self.assertEqual(cleaned, [1.5, 2.0])
+        self.assertIsNone(errors)
+
+        cleaned, errors = BoolType().clean_column([0, 1, ''])
+
+        self.assertEqual(cleaned, [False, True, False])
+        self.assertIsNone(errors)
+
+        cleaned, errors = StringType().clean_column([1, 'a'])
+
+        self.assertEqual(cleaned, ['1', 'a'])
+        self.assertIsNone(errors)
+
+    def test_clean_column_error_mask(self):
+        cleaned, errors = IntegerType().clean_column(
+            value for value in ['1', 'invalid', None, '4']
+        )
+
+        self.assertEqual(cleaned, [1, None, None, 4])
+        self.assertEqual(errors, [False, True, True, False])
+
+    def test_clean_column_custom_clean(self):
+        class CustomType(IntegerType):
+            def clean(self, value):
+                return super().clean(value) * 2
+
+        cleaned, errors = CustomType().clean_column(['1', 'invalid'])
+
+        self.assertEqual(cleaned, [2, None])
+        self.assertEqual(errors, [False, True])
+
+    @unittest.skipUnless(types.numpy, 'numpy is not installed')
+    def test_clean_numpy_column(self):
+        numpy = types.numpy
+
+        cleaned, errors = IntegerType().clean_column(
+            numpy.array([1.7, -2.2, 3])
+        )
+        self.assertEqual(cleaned, [1, -2, 3])
+        self.assertIsInstance(cleaned[0], int)
+        self.assertIsNone(errors)
+
+        cleaned, errors = IntegerType().clean_column(
+            numpy.array([1.0, numpy.nan])
+        )
+        self.assertEqual(cleaned, [1, None])
+        self.assertEqual(errors, [False, True])
+
+        cleaned, errors = FloatType().clean_column(numpy.array([1, 2]))
+        self.assertEqual(cleaned, [1.0, 2.0])
+        self.assertIsInstance(cleaned[0], float)
+
+        cleaned, errors = BoolType().clean_column(numpy.array([0.0, 2.5]))
+        self.assertEqual(cleaned, [False, True])
+
+    @patch('paramap.types.numpy', None)
+    def test_clean_buffer_column_without_numpy(self):
+        from array import array
+
+        cleaned, errors = IntegerType().clean_column(array('d', [1.5, 2]))
+
+        self.assertEqual(cleaned, [1, 2])
+        self.assertIsNone(errors)
+
+    def test_field_resolve_column(self):
+        field = Integer(default=0)
+
+        self.assertEqual(
+            field.resolve_column(['1', None, 3]),
+            [1, 0, 3],
+        )
+
+        with self.assertRaises(ValueError):
+            field.resolve_column(['1', 'invalid'])
+
+        field = String(default='test_default')
+
+        self.assertEqual(
+            field.resolve_column([1, None]),
+            ['1', 'test_default'],
+        )
+
+    def test_complex_field_resolve_column(self):
+        field = Map(Any, map={'a': 'A'})
+
+        self.assertEqual(field.resolve_column(['a', 'b']), ['A', 'b'])
+
+        field = List(Integer)
+
+        self.assertEqual(
+            field.resolve_column([['1', '2'], None]),
+            [[1, 2], None],
+        )
+
+
+class ConverterTest(unittest.TestCase):
+
+    def test_converter_matches_resolve(self):
+        values = [None, 0, 1, True, False, '5', 5.5, '', 'test_value']
+
+        for field in (
+            Any(default='default'),
+            String(default='default'),
+            Bool(default=True),
+            Integer(default=1),
+            Float(default=1.5),
+        ):
+            converter = field.get_converter()
+
+            for value in values:
+                try:
+                    expected = field.resolve(value)
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        converter(value)
+                    continue
+
+                result = converter(value)
+                self.assertEqual(expected, result)
+                self.assertIs(type(expected), type(result))
+
+    def test_converter_is_cached(self):
+        field = Integer()
+
+        self.assertIs(field.get_converter(), field.get_converter())
+        self.assertIs(field.type_instance, field.type_instance)
+
+    def test_converter_fast_path(self):
+        class CountingType(IntegerType):
+            calls = 0
+
+            def clean(self, value):
+                CountingType.calls += 1
+                return super().clean(value)
+
+        class FastCountingType(CountingType):
+            target_type = int
+
+            def clean(self, value):
+                return super().clean(value)
+
+        # values of the target type skip cleaning
+        converter = Field(FastCountingType).get_converter()
+
+        self.assertEqual(converter(5), 5)
+        self.assertEqual(CountingType.calls, 0)
+        self.assertEqual(converter('5'), 5)
+        self.assertEqual(CountingType.calls, 1)
+
+        # subclasses overriding clean without target type
+        # are always cleaned, but only once
+        CountingType.calls = 0
+        field = Field(CountingType)
+
+        self.assertEqual(field.get_converter()(5), 5)
+        self.assertEqual(field.resolve(5), 5)
+        self.assertEqual(CountingType.calls, 2)
+
+    def test_custom_field_converter(self):
+        class Fahrenheit(Float):
+            def resolve(self, celsius):
+                return super().resolve(celsius * 9 / 5 + 32)
+
+        field = Fahrenheit()
+
+        self.assertEqual(field.get_converter(), field.resolve)
+        self.assertEqual(field.get_converter()(100), 212.0)
+
+    def test_nested_converter(self):
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+        converter = Nested(TestMap).get_converter()
+        instance = TestMap()
+
+        self.assertIs(converter(instance), instance)
+        self.assertEqual(converter({'test_param_1': 1}).test_field_1, 1)
+
+        with self.assertRaises(TypeError):
+            converter('test_value')
+
+    def test_uses_default_resolution(self):
+        class CleanMap(Map):
+            def clean(self, value):
+                return value
+
+        class ResolveDate(Date):
+            def resolve(self, value):
+                return value
+
+        self.assertTrue(String().uses_default_resolution(Field))
+        self.assertTrue(Map({}).uses_default_resolution(Map))
+        self.assertFalse(Map({}).uses_default_resolution(Field))
+        self.assertFalse(CleanMap({}).uses_default_resolution(Map))
+        self.assertFalse(ResolveDate().uses_default_resolution(Date))
+
+    def test_nested_errors(self):
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+        field = Nested(TestMap)
+        message = 'Nested fields can only resolve with'
+
+        with self.assertRaisesRegex(TypeError, message):
+            field.resolve('test_value')
+
+        with self.assertRaisesRegex(TypeError, message):
+            field.get_converter()('test_value')
+
+        with self.assertRaisesRegex(TypeError, message):
+            asyncio.run(field._acreate_nested('test_value'))
+
+
 class AnyFieldTest(unittest.TestCase):
 
     def test_attrs(self):
@@ -257,6 +491,93 @@ class MapFieldTest(unittest.TestCase):
         self.assertEqual('value_1', field.resolve('0'))
         self.assertEqual('value_2', field.resolve('1'))
 
+    def test_frozen_map(self):
+        calls = []
+
+        def mapping(value):
+            calls.append(value)
+            return value * 2
+
+        class TestClass(Map, String):
+            def get_map(self):
+                calls.append('get_map')
+                return {
+                    1: 'one',
+                    2: mapping,
+                    3: '',
+                    4: ['four'],
+                }
+
+        field = TestClass(frozen=True, default='default')
+
+        self.assertEqual(field.resolve(1), 'one')
+        self.assertEqual(field.resolve(2), '4')
+        self.assertEqual(field.resolve(2), '4')
+        self.assertEqual(field.resolve(3), '3')
+        self.assertEqual(field.resolve(4), "['four']")
+        self.assertEqual(field.resolve(None), 'default')
+        self.assertEqual(calls, ['get_map', 2, 2])
+
+        with self.assertRaises(ValueError):
+            Map(Integer, map={1: 'one'}, frozen=True).resolve(1)
+
+    def test_frozen_map_subclass_resolve(self):
+        class UpperMap(Map):
+            def resolve(self, value):
+                return super().resolve(value).upper()
+
+        class TestMap(MapObject):
+            test_field = UpperMap(StringType, param='test_param',
+                                  map={'a': 'x'}, frozen=True)
+
+        for frozen in (False, True):
+            field = UpperMap(StringType, map={'a': 'x'}, frozen=frozen)
+
+            self.assertEqual(field.resolve('a'), 'X')
+            self.assertEqual(field.resolve_column(['a', 'b']), ['X', 'B'])
+
+        self.assertEqual(TestMap({'test_param': 'a'}).test_field, 'X')
+
+    def test_callable_mapping_cache(self):
+        calls = []
+
+        def mapping(value):
+            calls.append(value)
+            return len(value)
+
+        for frozen in (False, True):
+            del calls[:]
+            field = Map(Any, map={'a': mapping, ('a',): mapping},
+                        cache_size=1, frozen=frozen)
+
+            self.assertEqual(
+                [field.resolve(value) for value in ('a', 'a', ('a',), 'a')],
+                [1, 1, 1, 1],
+            )
+            self.assertEqual(calls, ['a', ('a',), 'a'])
+
+    def test_resolve_column(self):
+        for frozen in (False, True):
+            field = Map(Integer, map={'a': 1, 'b': lambda value: '2'},
+                        frozen=frozen)
+
+            self.assertEqual(
+                field.resolve_column(['a', 'b', '3', None]),
+                [1, 2, 3, None],
+            )
+
+        class TestMap(MapObject):
+            test_field = Map(Integer, param='test_param', map={'a': 1},
+                             frozen=True)
+
+        self.assertEqual(
+            [
+                instance.test_field for instance in
+                TestMap.from_columns({'test_param': ['a', '2']})
+            ],
+            [1, 2],
+        )
+
 
 class NestedFieldTest(unittest.TestCase):
 
@@ -297,6 +618,75 @@ class ListFieldTest(unittest.TestCase):
         field = List(Any, default=[])
         self.assertEqual(field.resolve(None), [])
 
+    def test_compact(self):
+        integers = List(IntegerType, compact=True)
+        floats = List(FloatType, compact=True, default=[])
+
+        for value in (
+            [1, 2, 3],
+            (1, '2', 3.5),
+            (item for item in (1, 2, 3)),
+            array.array('q', [1, 2, 3]),
+            array.array('b', [1, 2, 3]),
+            memoryview(array.array('l', [1, 2, 3])),
+        ):
+            result = integers.resolve(value)
+
+            self.assertIsInstance(result, array.array)
+            self.assertEqual(result.tolist()[:2], [1, 2])
+
+        self.assertEqual(integers.resolve(5), array.array('q', [5]))
+        self.assertIsNone(integers.resolve(None))
+        self.assertEqual(floats.resolve(None), [])
+        self.assertEqual(
+            floats.resolve([1, '2.5']), array.array('d', [1, 2.5])
+        )
+
+        with self.assertRaises(ValueError):
+            integers.resolve(['invalid'])
+
+        with self.assertRaises(TypeError):
+            List(StringType, compact=True)
+
+    def test_compact_numpy(self):
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            return
+
+        field = List(IntegerType, compact='numpy')
+
+        for value in (
+            [1, 2],
+            ('1', 2.5),
+            (item for item in (1, 2)),
+            numpy.array([1, 2], dtype=numpy.int32),
+            array.array('q', [1, 2]),
+        ):
+            result = field.resolve(value)
+
+            self.assertEqual(result.dtype, numpy.int64)
+            self.assertEqual(result.tolist(), [1, 2])
+
+        self.assertEqual(
+            field.resolve(numpy.array([2 ** 63 - 1], numpy.uint64)).tolist(),
+            [2 ** 63 - 1],
+        )
+
+        # unsigned values out of range raise, like compact=True lists
+        with self.assertRaises(OverflowError):
+            field.resolve(numpy.array([2 ** 64 - 1], numpy.uint64))
+
+    def test_compact_serialization(self):
+        class TestMap(MapObject):
+            test_field = List(FloatType, param='test_param', compact=True)
+
+        instance = TestMap({'test_param': (1, 2)})
+
+        self.assertIsInstance(instance.test_field, array.array)
+        self.assertEqual(instance.to_dict(), {'test_field': [1.0, 2.0]})
+        self.assertEqual(instance.to_json(), '{"test_field":[1.0,2.0]}')
+
     def resolve_with_non_iterable(self):
         field = List(Any)
         resolved_with = field.resolve(5)
@@ -409,3 +799,56 @@ class DateFieldTest(unittest.TestCase):
 
         date_string = field.resolve(date)
         self.assertEqual(date_string, '02-02-2020')
+
+    def test_iso_formats(self):
+        values = [
+            datetime(2020, 2, 2, 10, 20, 30, 400),
+            datetime(2020, 2, 2, 10, 20, 30, tzinfo=timezone.utc),
+            date(2020, 2, 2),
+            datetime(999, 1, 1),
+        ]
+
+        for date_format in ISO_FORMATS:
+            for cache_size in (0, 16):
+                field = Date(format=date_format, cache_size=cache_size)
+
+                for value in values:
+                    self.assertEqual(
+                        field.resolve(value), value.strftime(date_format)
+                    )
+
+    def test_resolve_other_values(self):
+        field = Date(format='%Y-%m-%d %H:%M', default='default')
+
+        self.assertEqual(field.resolve('2020-02-02'), '2020-02-02')
+        self.assertEqual(field.resolve(0), '1970-01-01 00:00')
+        self.assertEqual(field.resolve(90.5), '1970-01-01 00:01')
+        self.assertEqual(field.resolve(None), 'default')
+
+    def test_cache_respects_timezone(self):
+        field = Date(format='%H:%M %Z')
+        value = datetime(2020, 2, 2, 10, tzinfo=timezone.utc)
+        other = value.astimezone(timezone(timedelta(hours=1), 'UTC+1'))
+
+        self.assertEqual(field.resolve(value), '10:00 UTC')
+        self.assertEqual(field.resolve(other), '11:00 UTC+1')
+
+    def test_resolve_column(self):
+        field = Date(default='default')
+
+        self.assertEqual(
+            field.resolve_column([date(2020, 2, 2), None, '2020-02-03']),
+            ['2020-02-02', 'default', '2020-02-03'],
+        )
+
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            return
+
+        values = numpy.array(['2020-02-02T10:00', 'NaT'],
+                             dtype='datetime64[m]')
+
+        self.assertEqual(
+            field.resolve_column(values), ['2020-02-02', 'default']
+        )
@@ -0,0 +1,104 @@
+import io
+import unittest
+
+from paramap import depends, explain, fields, profile
+from paramap.inspection import field_origins, removed_fields
+from paramap.types import IntegerType, MapObject
+
+
+class AddressMap(MapObject):
+    city = fields.String(param='CITY')
+
+
+class BaseMap(MapObject):
+    id = fields.Integer(param='ID', required=True)
+    legacy = fields.String(param='LEGACY')
+
+
+class PersonMap(BaseMap, slots=True):
+    legacy = None
+    name = fields.String(param='NAME', default='unknown')
+    greeting = fields.String()
+    address = fields.Nested(AddressMap)
+    scores = fields.List(IntegerType, param='SCORES')
+    addresses = fields.List(AddressMap, param='ADDRESSES')
+
+    @depends('name', parameters=['ID'])
+    def resolve_greeting(self, value, parameters):
+        return f'Hello {self.name}'
+
+
+class InspectionTest(unittest.TestCase):
+
+    def test_field_origins(self):
+        origins = field_origins(PersonMap)
+
+        self.assertIs(origins['id'], BaseMap)
+        self.assertIs(origins['name'], PersonMap)
+        self.assertNotIn('legacy', origins)
+
+    def test_removed_fields(self):
+        self.assertEqual(
+            removed_fields(PersonMap), {'legacy': (BaseMap, PersonMap)}
+        )
+        self.assertEqual(removed_fields(BaseMap), {})
+
+    def test_explain(self):
+        output = io.StringIO()
+        explain(PersonMap, file=output)
+        lines = output.getvalue().splitlines()
+
+        self.assertEqual(
+            lines[0], f'{__name__}.PersonMap (slots=True)'
+        )
+        self.assertIn('    id         Integer <- ID (required)', lines)
+        self.assertIn(
+            '    greeting   String <- - (resolver resolve_greeting)', lines
+        )
+        self.assertIn('    address    Nested(AddressMap) <- whole parameters',
+                      lines)
+        self.assertIn('    scores     List(IntegerType) <- SCORES', lines)
+        self.assertIn('      list of:', lines)
+        self.assertIn(
+            '    1. greeting   resolve_greeting, fields: name; parameters: ID',
+            lines
+        )
+        self.assertIn('    id         from BaseMap', lines)
+        self.assertIn(
+            '    legacy  declared in BaseMap, removed in PersonMap', lines
+        )
+
+    def test_explain_static_resolvers(self):
+        class TestMap(MapObject):
+            test_field = fields.Any()
+
+            @staticmethod
+            def resolve_test_field(value, parameters):
+                return 1
+
+        output = io.StringIO()
+        explain(TestMap, file=output)
+
+        self.assertIn('1. test_field  resolve_test_field', output.getvalue())
+
+    def test_explain_requires_map_object(self):
+        with self.assertRaises(TypeError):
+            explain(dict)
+
+    def test_profile(self):
+        samples = [
+            {'ID': '1', 'NAME': 'John', 'SCORES': ['1'], 'ADDRESSES': []},
+            {'ID': '2', 'ADDRESSES': []},
+        ]
+        output = io.StringIO()
+
+        stats = profile(PersonMap, samples, file=output)
+
+        self.assertEqual(stats.fields['name'].calls, 2)
+        self.assertEqual(stats.fields['name'].defaults, 1)
+        self.assertEqual(stats.fields['greeting'].defaults, 0)
+        self.assertEqual(stats.resolvers['greeting'].calls, 2)
+        self.assertIn('50% default', output.getvalue())
+        self.assertIn('2 samples in', output.getvalue())
+        # class init is not instrumented by profiling
+        self.assertIsNone(PersonMap._plan.stats)
@@ -0,0 +1,91 @@
+import unittest
+
+from paramap import fields, instrumentation, registry
+from paramap.types import MapObject
+
+
+class InstrumentedMap(MapObject):
+    test_field_1 = fields.Integer(param='test_param_1', default=0)
+    test_field_2 = fields.Any()
+
+    def resolve_test_field_2(self, value, parameters):
+        if parameters.get('fail'):
+            raise ValueError('fail')
+
+        return self.test_field_1 * 2
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(InstrumentedMap._plan.stats)
+        self.assertNotIn(InstrumentedMap, instrumentation.stats())
+
+    def test_field_and_resolver_stats(self):
+        instrumentation.enable()
+
+        InstrumentedMap.map_many([{'test_param_1': '1'}, {}])
+        instance = InstrumentedMap({'test_param_1': 2})
+
+        with self.assertRaises(ValueError):
+            InstrumentedMap({'fail': True})
+
+        self.assertEqual(instance.test_field_2, 4)
+
+        stats = instrumentation.stats()[InstrumentedMap]
+        field = stats.fields['test_field_1']
+        resolver = stats.resolvers['test_field_2']
+
+        self.assertEqual(
+            (field.calls, field.defaults, field.errors), (4, 2, 0)
+        )
+        self.assertEqual(field.default_rate, 0.5)
+        self.assertEqual((resolver.calls, resolver.errors), (4, 1))
+        self.assertGreater(stats.time, 0)
+
+        instance.to_dict()
+        instance.to_json()
+        self.assertEqual(stats.methods['to_dict'].calls, 1)
+        self.assertEqual(stats.methods['to_json'].calls, 1)
+
+        instrumentation.reset()
+        self.assertEqual(stats.as_dict()['fields']['test_field_1']['calls'], 0)
+
+    def test_classes_created_while_enabled(self):
+        instrumentation.enable()
+
+        class TestMap(MapObject):
+            test_field = fields.String(param='test_param')
+
+        class ParentMap(MapObject):
+            test_nested = fields.Nested(TestMap)
+
+        ParentMap({'test_param': 1})
+
+        self.assertEqual(
+            instrumentation.stats()[TestMap].fields['test_field'].calls, 1
+        )
+
+    def test_disable_restores_init(self):
+        init = InstrumentedMap._plan.init
+
+        instrumentation.enable()
+        self.assertIsNot(InstrumentedMap._plan.init, init)
+
+        instrumentation.disable()
+        self.assertIs(InstrumentedMap._plan.init, init)
+        self.assertIsNone(InstrumentedMap._plan.stats)
+        self.assertEqual(instrumentation.stats(), {})
+        self.assertEqual(InstrumentedMap({'test_param_1': 1}).test_field_2, 2)
+
+    def test_registry(self):
+        local_registry = registry.Registry()
+        local_registry.register(InstrumentedMap)
+
+        instrumentation.enable(local_registry)
+
+        self.assertFalse(instrumentation.enabled)
+        self.assertEqual(list(instrumentation.stats()), [InstrumentedMap])
@@ -1,7 +1,18 @@
+import asyncio
 import unittest
 from unittest.mock import patch
+from paramap.compiler import depends
 from paramap.types import MapObject
-from paramap.fields import Field, Any, List, Nested
+from paramap.fields import Field, Any, List, Nested, Integer, Float, Bool
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
 
 
 class MapObjectTest(unittest.TestCase):
@@ -274,6 +285,51 @@ class MapObjectTest(unittest.TestCase):
         self.assertIn('test_field_2', dictionary.keys())
         self.assertEqual(dictionary.get('test_field_2'), 'not_none')
 
+    def test_to_dict_values(self):
+        class NestedMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1', verbose_name='verbose')
+            test_field_2 = Any()
+            test_field_3 = List(NestedMap, param='test_param_list')
+            test_field_4 = List(Any, param='test_param_4')
+
+            def resolve_test_field_2(self, value, parameters):
+                # any field value can hold nested objects
+                return (NestedMap(parameters), [NestedMap(parameters)])
+
+        instance = TestMap({
+            'test_param_1': 1,
+            'test_param_list': [{'test_param_1': 2}, {}],
+            'test_param_4': [1, (2, 3), NestedMap(parameters={})],
+        })
+
+        self.assertEqual(instance.to_dict(), {
+            'verbose': 1,
+            'test_field_2': [{'test_field_1': 1}, [{'test_field_1': 1}]],
+            'test_field_3': [{'test_field_1': 2}, {}],
+            'test_field_4': [1, [2, 3], {}],
+        })
+        self.assertEqual(
+            instance.to_dict(skip_none=False)['test_field_3'],
+            [{'test_field_1': 2}, {'test_field_1': None}],
+        )
+
+    def test_to_dict_serializer_cache(self):
+        class TestMap(MapObject):
+            test_field_1 = Any()
+
+        instance = TestMap()
+        instance.to_dict()
+        instance.to_dict(skip_none=False)
+
+        self.assertEqual(set(TestMap._plan.serializers), {True, False})
+
+        del instance.test_field_1
+        self.assertEqual(instance.to_dict(skip_none=False),
+                         {'test_field_1': None})
+
     def test_required_fields(self):
         class DoubleNested(MapObject):
             test_field_1 = Any(default='test_default_1')
@@ -351,6 +407,157 @@ class MapObjectTest(unittest.TestCase):
         self.assertEqual(required_parameters.union(optional_parameters),
                          all_parameters)
 
+    def test_parameter_catalog(self):
+        created = []
+
+        class NestedMap(MapObject):
+            test_field_1 = Any(param='test_param_1', required=True)
+            test_field_2 = Any(param='test_param_2')
+
+            def __init__(self, *args, **kwargs):
+                created.append(self)
+                super().__init__(*args, **kwargs)
+
+        class TestMap(MapObject):
+            test_nested = Nested(NestedMap)
+            test_field_2 = Any(param='test_param_2')
+            test_field_3 = Any(param='test_param_3', required=True)
+
+        catalog = TestMap.parameter_catalog()
+
+        self.assertIs(catalog, TestMap.parameter_catalog())
+        self.assertIs(
+            NestedMap.parameter_catalog().parameters['test_param_1'],
+            catalog.parameters['test_param_1'],
+        )
+        self.assertEqual(created, [])
+
+        self.assertEqual(
+            set(catalog),
+            {'test_param_1', 'test_param_2', 'test_param_3'},
+        )
+        self.assertEqual(
+            set(catalog.required),
+            {'test_param_1', 'test_param_3'},
+        )
+        self.assertEqual(set(catalog.optional), {'test_param_2'})
+        self.assertIn('test_param_3', catalog)
+
+        self.assertIs(TestMap().parameters, catalog.parameters)
+        self.assertIs(TestMap().required_parameters, catalog.required)
+        self.assertIs(TestMap().optional_parameters, catalog.optional)
+
+        with self.assertRaises(TypeError):
+            catalog.parameters['test_param_4'] = None
+
+    def test_parameter_catalog_inheritance(self):
+        class ParentMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+        class ChildMap(ParentMap):
+            test_field_2 = Any(param='test_param_2')
+
+        self.assertEqual(set(ParentMap.parameter_catalog()), {'test_param_1'})
+        self.assertEqual(
+            set(ChildMap.parameter_catalog()),
+            {'test_param_1', 'test_param_2'},
+        )
+
+    def test_slots(self):
+        class NestedMap(MapObject, slots=True):
+            test_field_1 = Any(param='test_param_1')
+
+        class TestMap(MapObject, slots=True):
+            test_field_1 = Any(param='test_param_1')
+            test_field_2 = Any(default='default')
+            test_nested = Nested(NestedMap)
+
+            def resolve_test_field_2(self, value, parameters):
+                return self.test_field_1
+
+        class ChildMap(TestMap):
+            test_field_3 = Any(param='test_param_3')
+
+        for instance in (
+            TestMap({'test_param_1': 'value_1'}),
+            ChildMap({'test_param_1': 'value_1', 'test_param_3': 3}),
+            TestMap.map_many([{'test_param_1': 'value_1'}])[0],
+        ):
+            self.assertFalse(hasattr(instance, '__dict__'))
+            self.assertEqual(instance.test_field_2, 'value_1')
+            self.assertEqual(
+                instance.to_dict()['test_nested'],
+                {'test_field_1': 'value_1'},
+            )
+
+            with self.assertRaises(AttributeError):
+                instance.not_a_field = True
+
+        self.assertEqual(ChildMap({'test_param_3': 3}).test_field_3, 3)
+
+    def test_lazy(self):
+        calls = []
+
+        class NestedMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+        class TestMap(MapObject, lazy=True):
+            test_field_1 = Integer(param='test_param_1')
+            test_field_2 = Any(default='default')
+            test_field_3 = Any(param='test_param_3')
+            test_nested = Nested(NestedMap)
+
+            def resolve_test_field_2(self, value, parameters):
+                calls.append('test_field_2')
+                return self.test_field_1 + 1
+
+            def resolve_test_field_3(self, value, parameters):
+                calls.append('test_field_3')
+                return value
+
+        class ChildMap(TestMap):
+            test_field_4 = Any(param='test_param_4')
+
+        instance = TestMap({'test_param_1': '1', 'test_param_3': 3})
+
+        self.assertEqual(calls, [])
+        self.assertEqual(instance.test_field_2, 2)
+        self.assertEqual(instance.test_field_2, 2)
+        self.assertEqual(calls, ['test_field_2'])
+        self.assertEqual(instance.test_field_1, 1)
+        self.assertEqual(
+            instance.to_dict(),
+            {
+                'test_field_1': 1,
+                'test_field_2': 2,
+                'test_field_3': 3,
+                'test_nested': {'test_field_1': '1'},
+            },
+        )
+        self.assertEqual(calls, ['test_field_2', 'test_field_3'])
+
+        self.assertEqual(TestMap(test_field_2='initial').test_field_2,
+                         'initial')
+        self.assertEqual(
+            ChildMap({'test_param_1': 1, 'test_param_4': 4}).to_dict(),
+            {
+                'test_field_1': 1,
+                'test_field_2': 2,
+                'test_field_4': 4,
+                'test_nested': {'test_field_1': 1},
+            },
+        )
+        self.assertEqual(
+            TestMap.map_many([{'test_param_1': 5}])[0].test_field_2, 6
+        )
+
+        instance.test_field_1 = 10
+        self.assertEqual(instance.test_field_1, 10)
+
+        with self.assertRaises(TypeError):
+            class SlotsMap(MapObject, lazy=True, slots=True):
+                test_field_1 = Any()
+
     def test_define_common_field_outside_of_mapobject(self):
         common_field = Any(default='test')
 
@@ -390,3 +597,496 @@ class MapObjectTest(unittest.TestCase):
 
         self.assertEqual(test_one.common, 'test')
         self.assertNotEqual(test_one.common, test_two.common)
+
+    def test_resolvers_skipped_for_kwargs(self):
+        calls = []
+
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+            test_field_2 = Any(param='test_param_2')
+
+            def resolve_test_field_1(self, value, parameters):
+                calls.append(1)
+                return 'resolved'
+
+            def resolve_test_field_2(self, value, parameters):
+                calls.append(2)
+                return self.test_field_1
+
+        instance = TestMap(
+            parameters={'test_param_1': 'value_1'},
+            test_field_1='kwarg_value',
+        )
+
+        self.assertEqual(calls, [2])
+        self.assertEqual(instance.test_field_1, 'kwarg_value')
+        self.assertEqual(instance.test_field_2, 'kwarg_value')
+
+    def test_static_and_class_method_resolvers(self):
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+            test_field_2 = Any(param='test_param_2')
+
+            @staticmethod
+            def resolve_test_field_1(value, parameters):
+                return value + '_static'
+
+            @classmethod
+            def resolve_test_field_2(cls, value, parameters):
+                return cls.__name__
+
+        instance = TestMap({'test_param_1': 'value'})
+
+        self.assertEqual(instance.test_field_1, 'value_static')
+        self.assertEqual(instance.test_field_2, 'TestMap')
+
+    def test_inherited_resolvers(self):
+        class ParentMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+            def resolve_test_field_1(self, value, parameters):
+                return 'parent'
+
+        class ChildMap(ParentMap):
+            test_field_2 = Any(param='test_param_2')
+
+        class NoResolverMap(ParentMap):
+            resolve_test_field_1 = None
+
+        self.assertEqual(ChildMap().test_field_1, 'parent')
+        self.assertEqual(NoResolverMap({'test_param_1': 1}).test_field_1, 1)
+
+    def test_init_with_fields_override(self):
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+            def _init_with_fields(self, parameters, initial={}):
+                parameters = dict(parameters, test_param_1='overridden')
+                super()._init_with_fields(parameters, initial)
+
+        self.assertEqual(TestMap().test_field_1, 'overridden')
+
+    def test_map_many(self):
+        class NestedMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1', default='default')
+            test_field_2 = Any(param='test_param_2')
+            test_nested = Nested(NestedMap)
+
+            def resolve_test_field_2(self, value, parameters):
+                return self.test_field_1
+
+        rows = [
+            {'test_param_1': 'value_1'},
+            {'test_param_1': 'value_2', 'test_param_2': 'ignored'},
+            {},
+            None,
+        ]
+
+        instances = TestMap.map_many(rows)
+
+        self.assertIsInstance(instances, list)
+        self.assertEqual(len(instances), len(rows))
+
+        for instance, parameters in zip(instances, rows):
+            self.assertIsInstance(instance, TestMap)
+            self.assertEqual(
+                instance.to_dict(skip_none=False),
+                TestMap(parameters).to_dict(skip_none=False),
+            )
+
+    def test_map_many_iterator(self):
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+        rows = ({'test_param_1': index} for index in range(3))
+        instances = TestMap.map_many(rows, iterator=True)
+
+        self.assertNotIsInstance(instances, list)
+        self.assertEqual(
+            [instance.test_field_1 for instance in instances],
+            [0, 1, 2],
+        )
+
+    def test_map_many_custom_init(self):
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.initialized = True
+
+        instances = TestMap.map_many([{'test_param_1': 1}])
+
+        self.assertTrue(instances[0].initialized)
+        self.assertEqual(instances[0].test_field_1, 1)
+
+    def test_from_columns(self):
+        class NestedMap(MapObject):
+            test_field_1 = Integer(param='test_param_1')
+
+        class TestMap(MapObject):
+            test_field_1 = Integer(param='test_param_1', default=0)
+            test_field_2 = Float(param='test_param_2')
+            test_field_3 = Any(param='test_param_3', default='default')
+            test_field_4 = Any()
+            test_nested = Nested(NestedMap)
+
+            def resolve_test_field_4(self, value, parameters):
+                return parameters.get('test_param_3')
+
+        columns = {
+            'test_param_1': ['1', None, 3],
+            'test_param_2': ['1.5', 2, None],
+            'test_param_3': ('a', None, 'c'),
+        }
+
+        instances = TestMap.from_columns(columns)
+        rows = [
+            dict(zip(columns, values))
+            for values in zip(*columns.values())
+        ]
+
+        self.assertEqual(len(instances), 3)
+        self.assertEqual(
+            [instance.to_dict(skip_none=False) for instance in instances],
+            [TestMap(row).to_dict(skip_none=False) for row in rows],
+        )
+
+    def test_from_columns_without_resolvers(self):
+        class TestMap(MapObject):
+            test_field_1 = Integer(param='test_param_1')
+            test_field_2 = Bool(param='test_param_2', default=True)
+
+        instances = TestMap.from_columns({
+            'test_param_1': (str(index) for index in range(3)),
+        })
+
+        self.assertEqual(
+            [instance.test_field_1 for instance in instances],
+            [0, 1, 2],
+        )
+        self.assertEqual(
+            [instance.test_field_2 for instance in instances],
+            [True, True, True],
+        )
+
+    def test_from_columns_errors(self):
+        class TestMap(MapObject):
+            test_field_1 = Integer(param='test_param_1')
+
+        with self.assertRaises(ValueError):
+            TestMap.from_columns({
+                'test_param_1': ['1', '2'],
+                'test_param_2': ['1'],
+            })
+
+        with self.assertRaises(ValueError):
+            TestMap.from_columns({'test_param_1': ['1', 'invalid']})
+
+        self.assertEqual(TestMap.from_columns({}), [])
+
+    def test_declared_dependencies_order(self):
+        order = []
+
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+            test_field_2 = Any()
+            test_field_3 = Any()
+
+            @depends('test_field_3')
+            def resolve_test_field_2(self, value, parameters):
+                order.append(2)
+                return self.test_field_3 + 1
+
+            def resolve_test_field_3(self, value, parameters):
+                order.append(3)
+                return self.test_field_1 + 1
+
+        self.assertEqual(TestMap({'test_param_1': 1}).test_field_2, 3)
+        self.assertEqual(
+            TestMap.from_columns({'test_param_1': [1]})[0].test_field_2, 3
+        )
+        self.assertEqual(order, [3, 2, 3, 2])
+
+        with self.assertRaises(TypeError):
+            class CircularMap(MapObject):
+                test_field_1 = Any()
+                test_field_2 = Any()
+
+                @depends('test_field_2')
+                def resolve_test_field_1(self, value, parameters):
+                    pass
+
+                @depends('test_field_1')
+                def resolve_test_field_2(self, value, parameters):
+                    pass
+
+        with self.assertRaises(TypeError):
+            class UnknownMap(MapObject):
+                test_field_1 = Any()
+
+                @depends('not_a_field')
+                def resolve_test_field_1(self, value, parameters):
+                    pass
+
+    def test_update(self):
+        calls = []
+
+        class TestMap(MapObject, updatable=True):
+            test_field_1 = Integer(param='test_param_1')
+            test_field_2 = Integer(param='test_param_2')
+            test_field_3 = Any()
+            test_field_4 = Any()
+            test_field_5 = Any(param='test_param_5')
+
+            @depends('test_field_1')
+            def resolve_test_field_3(self, value, parameters):
+                calls.append(3)
+                return self.test_field_1 * 10
+
+            @depends('test_field_3', parameters=['test_param_4'])
+            def resolve_test_field_4(self, value, parameters):
+                calls.append(4)
+                return self.test_field_3 + parameters.get('test_param_4', 0)
+
+        instance = TestMap({'test_param_1': '1', 'test_param_2': '2'})
+        self.assertEqual(instance.test_field_4, 10)
+        del calls[:]
+
+        instance.update({'test_param_2': '3'})
+        self.assertEqual(instance.test_field_2, 3)
+        self.assertEqual(calls, [])
+
+        instance.update({'test_param_4': 5})
+        self.assertEqual(instance.test_field_4, 15)
+        self.assertEqual(calls, [4])
+
+        instance.update({'test_param_1': '2', 'not_a_param': 1})
+        self.assertEqual(calls, [4, 3, 4])
+        self.assertEqual(
+            instance.to_dict(),
+            {
+                'test_field_1': 2,
+                'test_field_2': 3,
+                'test_field_3': 20,
+                'test_field_4': 25,
+            },
+        )
+
+    def test_update_requires_updatable(self):
+        class TestMap(MapObject, slots=True):
+            test_field = Integer(param='test_param')
+
+        instance = TestMap({'test_param': 1})
+
+        # plain instances don't keep their parameters
+        self.assertFalse(hasattr(instance, '_parameters'))
+
+        with self.assertRaises(TypeError):
+            instance.update({'test_param': 2})
+
+    def test_update_undeclared_resolvers(self):
+        calls = []
+
+        class NestedMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+        class TestMap(MapObject, slots=True, updatable=True):
+            test_field_1 = Any(param='test_param_1')
+            test_field_2 = Any()
+            test_nested = Nested(NestedMap)
+
+            def resolve_test_field_2(self, value, parameters):
+                calls.append(2)
+                return parameters.get('test_param_2')
+
+        instance = TestMap({'test_param_1': 1})
+        instance.update({'test_param_2': 2})
+
+        self.assertEqual(calls, [2, 2])
+        self.assertEqual(instance.test_field_2, 2)
+        self.assertEqual(instance.test_nested.test_field_1, 1)
+
+        instance.update({'test_param_1': 3})
+        self.assertEqual(instance.test_nested.test_field_1, 3)
+
+    def test_update_lazy(self):
+        calls = []
+
+        class TestMap(MapObject, lazy=True):
+            test_field_1 = Integer(param='test_param_1')
+            test_field_2 = Any()
+            test_field_3 = Any(param='test_param_3')
+
+            @depends('test_field_1')
+            def resolve_test_field_2(self, value, parameters):
+                calls.append(2)
+                return self.test_field_1 + 1
+
+        instance = TestMap({'test_param_1': 1, 'test_param_3': 3})
+        self.assertEqual(instance.test_field_2, 2)
+
+        instance.update({'test_param_3': 4})
+        self.assertEqual(instance.test_field_2, 2)
+        self.assertEqual(instance.test_field_3, 4)
+
+        instance.update({'test_param_1': 5})
+        self.assertEqual(instance.test_field_2, 6)
+        self.assertEqual(calls, [2, 2])
+
+
+class AsyncMapObjectTest(unittest.TestCase):
+
+    def test_acreate(self):
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+            test_field_2 = Any(param='test_param_2')
+            test_field_3 = Any(param='test_param_3', default='default')
+
+            async def resolve_test_field_2(self, value, parameters):
+                await asyncio.sleep(0)
+                return self.test_field_1 + value
+
+        instance = run(TestMap.acreate({
+            'test_param_1': 'value_1',
+            'test_param_2': '_value_2',
+        }))
+
+        self.assertIsInstance(instance, TestMap)
+        self.assertEqual(instance.test_field_1, 'value_1')
+        self.assertEqual(instance.test_field_2, 'value_1_value_2')
+        self.assertEqual(instance.test_field_3, 'default')
+
+        instance = run(TestMap.acreate(test_field_2='kwarg_value'))
+
+        self.assertEqual(instance.test_field_2, 'kwarg_value')
+
+    def test_sync_create_with_async_resolvers(self):
+        class TestMap(MapObject):
+            test_field_1 = Any()
+
+            async def resolve_test_field_1(self, value, parameters):
+                return value
+
+        class ParentMap(MapObject):
+            test_nested = Nested(TestMap)
+
+        with self.assertRaises(TypeError):
+            TestMap()
+
+        with self.assertRaises(TypeError):
+            ParentMap()
+
+    def test_async_resolvers_run_concurrently(self):
+        class TestMap(MapObject):
+            test_field_1 = Any()
+            test_field_2 = Any()
+
+            @depends(parameters=['event'])
+            async def resolve_test_field_1(self, value, parameters):
+                # waits for the other resolver, would time out
+                # if resolvers ran one after another
+                await asyncio.wait_for(parameters['event'].wait(), 1)
+                return 1
+
+            @depends(parameters=['event'])
+            async def resolve_test_field_2(self, value, parameters):
+                parameters['event'].set()
+                return 2
+
+        async def create():
+            return await TestMap.acreate({'event': asyncio.Event()})
+
+        instance = run(create())
+
+        self.assertEqual(instance.test_field_1, 1)
+        self.assertEqual(instance.test_field_2, 2)
+
+    def test_sync_resolvers_wait_for_async_resolvers(self):
+        order = []
+
+        class TestMap(MapObject):
+            test_field_1 = Any()
+            test_field_2 = Any()
+            test_field_3 = Any()
+
+            async def resolve_test_field_1(self, value, parameters):
+                await asyncio.sleep(0.01)
+                order.append(1)
+                return 1
+
+            def resolve_test_field_2(self, value, parameters):
+                order.append(2)
+                return self.test_field_1 + 1
+
+            async def resolve_test_field_3(self, value, parameters):
+                order.append(3)
+                return self.test_field_2 + 1
+
+        instance = run(TestMap.acreate())
+
+        self.assertEqual(order, [1, 2, 3])
+        self.assertEqual(instance.test_field_3, 3)
+
+    def test_undeclared_async_resolvers_run_in_order(self):
+        class TestMap(MapObject):
+            test_field_1 = Any()
+            test_field_2 = Any()
+
+            async def resolve_test_field_1(self, value, parameters):
+                await asyncio.sleep(0)
+                return 1
+
+            async def resolve_test_field_2(self, value, parameters):
+                return self.test_field_1 + 1
+
+        instance = run(TestMap.acreate())
+
+        self.assertEqual(instance.test_field_2, 2)
+
+    def test_async_resolvers_wait_for_dependencies(self):
+        class TestMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+            test_field_2 = Any()
+            test_field_3 = Any()
+
+            async def resolve_test_field_2(self, value, parameters):
+                await asyncio.sleep(0)
+                return self.test_field_1 + 1
+
+            @depends('test_field_2')
+            async def resolve_test_field_3(self, value, parameters):
+                return self.test_field_2 + 1
+
+        instance = run(TestMap.acreate({'test_param_1': 1}))
+
+        self.assertEqual(instance.test_field_3, 3)
+
+    def test_async_nested_resolvers(self):
+        class NestedMap(MapObject):
+            test_field_1 = Any(param='test_param_1')
+
+            async def resolve_test_field_1(self, value, parameters):
+                return value * 2
+
+        class TestMap(MapObject):
+            test_nested = Nested(NestedMap)
+            test_list = List(NestedMap, param='test_param_list')
+
+        instance = run(TestMap.acreate({
+            'test_param_1': 1,
+            'test_param_list': [{'test_param_1': 2}, {'test_param_1': 3}],
+        }))
+
+        self.assertEqual(instance.test_nested.test_field_1, 2)
+        self.assertEqual(
+            [item.test_field_1 for item in instance.test_list],
+            [4, 6],
+        )
+        self.assertEqual(instance.to_dict(), {
+            'test_nested': {'test_field_1': 2},
+            'test_list': [{'test_field_1': 4}, {'test_field_1': 6}],
+        })
@@ -0,0 +1,169 @@
+import multiprocessing
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count
+
+import paramap
+from paramap import registry
+from paramap.mapping import (
+    ChunkSizer,
+    chunked,
+    load_schema,
+    map_parallel,
+    schema_reference,
+    stream,
+)
+from paramap.types import MapObject
+from paramap.fields import Any, Integer
+
+
+class SampleMap(MapObject):
+    test_field_1 = Integer(param='test_param_1')
+    test_field_2 = Any(param='test_param_2')
+
+
+class ChunkedTest(unittest.TestCase):
+
+    def test_chunked(self):
+        self.assertEqual(
+            list(chunked(range(5), 2)),
+            [[0, 1], [2, 3], [4]],
+        )
+        self.assertEqual(list(chunked([], 2)), [])
+
+        with self.assertRaises(ValueError):
+            list(chunked(range(5), 0))
+
+
+class StreamTest(unittest.TestCase):
+
+    def test_package_export(self):
+        self.assertIs(paramap.stream, stream)
+
+    def test_stream(self):
+        rows = [{'test_param_1': str(index)} for index in range(3)]
+        results = stream(SampleMap, rows)
+
+        self.assertNotIsInstance(results, list)
+        results = list(results)
+
+        self.assertTrue(all(isinstance(r, SampleMap) for r in results))
+        self.assertEqual([r.test_field_1 for r in results], [0, 1, 2])
+
+    def test_stream_is_lazy(self):
+        rows = ({'test_param_1': index} for index in count())
+        results = stream(SampleMap, rows)
+
+        self.assertEqual(next(results).test_field_1, 0)
+        self.assertEqual(next(results).test_field_1, 1)
+
+    def test_stream_to_dict(self):
+        rows = [{'test_param_1': 1}, {'test_param_2': 'value'}]
+
+        self.assertEqual(
+            list(stream(SampleMap, rows, to_dict=True)),
+            [{'test_field_1': 1}, {'test_field_2': 'value'}],
+        )
+        self.assertEqual(
+            list(stream(SampleMap, rows, to_dict=True, skip_none=False)),
+            [
+                {'test_field_1': 1, 'test_field_2': None},
+                {'test_field_1': None, 'test_field_2': 'value'},
+            ],
+        )
+
+    def test_stream_chunks(self):
+        rows = ({'test_param_1': index} for index in range(5))
+        chunks = list(stream(SampleMap, rows, to_dict=True, chunk_size=2))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(chunks[2], [{'test_field_1': 4}])
+
+
+@registry.register()
+class RegisteredSampleMap(MapObject):
+    test_field_1 = Integer(param='test_param_1')
+
+
+class SchemaReferenceTest(unittest.TestCase):
+
+    def test_module_level_schema(self):
+        reference = schema_reference(SampleMap)
+
+        self.assertEqual(reference, 'tests.test_mapping:SampleMap')
+        self.assertIs(load_schema(reference), SampleMap)
+
+    def test_registered_schema(self):
+        self.assertIs(
+            load_schema('RegisteredSampleMap'),
+            RegisteredSampleMap,
+        )
+
+        with self.assertRaises(LookupError):
+            load_schema('NotRegisteredSampleMap')
+
+    def test_local_schema(self):
+        class LocalMap(MapObject):
+            pass
+
+        with self.assertRaises(ValueError):
+            schema_reference(LocalMap)
+
+
+class ChunkSizerTest(unittest.TestCase):
+
+    def test_adapts_to_row_cost(self):
+        sizer = ChunkSizer(initial=10, target_time=1.0, maximum=1000)
+
+        self.assertEqual(sizer.update(10, 0.1), 100)
+        # expensive rows shrink the chunk
+        self.assertLess(sizer.update(10, 10.0), 100)
+
+        sizer = ChunkSizer(initial=10, target_time=1.0, maximum=1000)
+
+        # cheap rows are capped by maximum
+        self.assertEqual(sizer.update(10, 0.0), 1000)
+        self.assertEqual(sizer.update(0, 1.0), 1000)
+
+
+class MapParallelTest(unittest.TestCase):
+
+    def test_package_export(self):
+        self.assertIs(paramap.map_parallel, map_parallel)
+
+    def test_map_parallel(self):
+        rows = [{'test_param_1': str(index)} for index in range(500)]
+        results = map_parallel(SampleMap, rows, workers=2)
+
+        self.assertEqual(len(results), 500)
+        self.assertTrue(all(isinstance(r, SampleMap) for r in results))
+        self.assertEqual(
+            [result.test_field_1 for result in results],
+            list(range(500)),
+        )
+
+    def test_map_parallel_to_dict(self):
+        rows = ({'test_param_1': index} for index in range(50))
+        results = map_parallel(
+            'RegisteredSampleMap', rows, workers=2, to_dict=True,
+            chunk_size=7, iterator=True,
+        )
+
+        self.assertNotIsInstance(results, list)
+        self.assertEqual(
+            list(results),
+            [{'test_field_1': index} for index in range(50)],
+        )
+
+    def test_map_parallel_registry_name(self):
+        with self.assertRaises(ValueError):
+            map_parallel('RegisteredSampleMap', [{}], workers=1)
+
+        spawn = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context('spawn')
+        )
+
+        with spawn, self.assertRaises(ValueError):
+            map_parallel(
+                'RegisteredSampleMap', [{}], to_dict=True, executor=spawn
+            )
@@ -1,8 +1,12 @@
+import importlib
+import pathlib
+import sys
+import tempfile
 import unittest
 from unittest.mock import patch
 
 from paramap import registry, fields
-from paramap.types import MapObject, Parameter
+from paramap.types import IntegerType, MapObject, Parameter
 
 
 class RegistryTest(unittest.TestCase):
@@ -102,3 +106,330 @@ class RegistryTest(unittest.TestCase):
         self.assertTrue({
             'TEST_THREE_PARAMETER',
         } == set(optional_parameters))
+
+    def test_registry_parameters_index(self):
+        local_registry = registry.Registry()
+
+        class TestOne(MapObject):
+            test_field = fields.String(param='TEST_PARAMETER')
+
+        class TestTwo(MapObject):
+            test_field = fields.String(param='TEST_PARAMETER',
+                                       required=True)
+            test_field_2 = fields.String(param='TEST_TWO_PARAMETER')
+
+        class TestThree(MapObject):
+            test_field = fields.String(param='TEST_PARAMETER')
+
+        local_registry.register(TestOne)
+
+        self.assertEqual(set(local_registry.optional_parameters),
+                         {'TEST_PARAMETER'})
+
+        with patch.object(TestOne, 'parameter_catalog') as catalog:
+            local_registry.register(TestTwo)
+            local_registry.register(TestThree)
+
+        # previously registered schemas are not scanned again
+        catalog.assert_not_called()
+
+        self.assertEqual(set(local_registry.parameters),
+                         {'TEST_PARAMETER', 'TEST_TWO_PARAMETER'})
+        self.assertEqual(set(local_registry.required_parameters),
+                         {'TEST_PARAMETER'})
+        self.assertEqual(set(local_registry.optional_parameters),
+                         {'TEST_TWO_PARAMETER'})
+        self.assertIs(
+            local_registry.parameters['TEST_PARAMETER'],
+            TestTwo.base_fields['test_field'].parameter,
+        )
+
+        with self.assertRaises(TypeError):
+            local_registry.parameters['TEST_PARAMETER'] = None
+
+    def test_match(self):
+        local_registry = registry.Registry()
+
+        @registry.register(local_registry)
+        class TestOne(MapObject):
+            test_field_1 = fields.String(param='TEST_ONE', required=True)
+            test_field_2 = fields.String(param='TEST_TWO', required=True)
+
+        @registry.register(local_registry)
+        class TestOptional(MapObject):
+            test_field = fields.String(param='TEST_ONE')
+
+        class NestedMap(MapObject):
+            test_field = fields.String(param='TEST_THREE', required=True)
+
+        @registry.register(local_registry)
+        class TestNested(MapObject):
+            test_field = fields.String(param='TEST_ONE', required=True)
+            test_nested = fields.Nested(NestedMap)
+
+        self.assertEqual(local_registry.match({}), [TestOptional])
+        self.assertEqual(
+            local_registry.match({'TEST_ONE': 1, 'OTHER': 2}),
+            [TestOptional],
+        )
+        self.assertEqual(
+            local_registry.match({'TEST_TWO': 1, 'TEST_ONE': 1}),
+            [TestOne, TestOptional],
+        )
+        self.assertEqual(
+            local_registry.match(['TEST_THREE', 'TEST_ONE', 'TEST_TWO']),
+            [TestOne, TestOptional, TestNested],
+        )
+        self.assertEqual(
+            local_registry.match(['TEST_ONE', 'TEST_ONE', 'TEST_TWO']),
+            [TestOne, TestOptional],
+        )
+
+    def test_map_all(self):
+        local_registry = registry.Registry()
+        calls = []
+
+        class CountingType(IntegerType):
+            def clean(self, value):
+                calls.append(value)
+                return super(CountingType, self).clean(value)
+
+        @registry.register(local_registry)
+        class TestOne(MapObject, updatable=True):
+            test_field_1 = fields.Field(CountingType, param='TEST_ONE',
+                                        required=True)
+            test_field_2 = fields.String(param='TEST_TWO')
+
+            def resolve_test_field_2(self, value, parameters):
+                return f'{self.test_field_1}-{value}'
+
+        @registry.register(local_registry)
+        class TestTwo(MapObject):
+            test_field = fields.Field(CountingType, param='TEST_ONE')
+            test_other = fields.Field(CountingType, param='TEST_ONE',
+                                      default=0)
+
+        @registry.register(local_registry)
+        class TestThree(MapObject, cache_size=10):
+            test_field = fields.Field(CountingType, param='TEST_THREE',
+                                      required=True)
+
+        result = local_registry.map_all({'TEST_ONE': '1', 'TEST_TWO': 2})
+
+        self.assertEqual(list(result), ['TestOne', 'TestTwo', 'TestThree'])
+        self.assertEqual(
+            result['TestOne'].to_dict(),
+            {'test_field_1': 1, 'test_field_2': '1-2'},
+        )
+        self.assertEqual(
+            result['TestTwo'].to_dict(),
+            {'test_field': 1, 'test_other': 1},
+        )
+        self.assertEqual(result['TestThree'].to_dict(), {})
+        # fields with different defaults cast separately
+        self.assertEqual(calls, ['1', '1'])
+
+        result = local_registry.map_all({'TEST_THREE': 3}, match=True)
+
+        self.assertEqual(list(result), ['TestTwo', 'TestThree'])
+        self.assertEqual(result['TestTwo'].test_other, 0)
+        self.assertEqual(result['TestThree'].test_field, 3)
+
+        for instances in (
+            local_registry.map_all({'TEST_ONE': '3'}).values(),
+            [TestOne({'TEST_ONE': '3'}), TestTwo({'TEST_ONE': '3'})],
+        ):
+            instances = list(instances)
+            instances[0].update({'TEST_TWO': 'updated'})
+            self.assertEqual(instances[0].test_field_2, '3-updated')
+
+    def test_map_all_fan_out_is_shared(self):
+        local_registry = registry.Registry()
+
+        for index in range(3):
+            local_registry.register(type(f'TestMap{index}', (MapObject,), {
+                'test_field': fields.Integer(
+                    param=f'TEST_{index}', required=True
+                ),
+                'test_shared': fields.Integer(param='TEST_SHARED'),
+            }))
+
+        local_registry.map_all({})
+        fan_out = local_registry._fan_out
+
+        shapes = ({'TEST_0': 1}, {'TEST_1': 1}, {'TEST_0': 1, 'TEST_2': 2})
+
+        for shape in shapes:
+            result = local_registry.map_all(
+                {**shape, 'TEST_SHARED': '5'}, match=True
+            )
+            self.assertEqual(
+                [instance.test_shared for instance in result.values()],
+                [5] * len(shape),
+            )
+
+        # payload shapes don't build fan-outs of their own
+        self.assertIs(local_registry._fan_out, fan_out)
+
+        local_registry.register(type('TestMap3', (MapObject,), {}))
+        self.assertEqual(len(local_registry.map_all({})), 4)
+
+
+LAZY_SCHEMAS = '''
+from paramap import fields, registry
+from paramap.types import MapObject
+
+
+class LazyPerson(MapObject):
+    name = fields.String(param='NAME', required=True)
+
+
+class LazyAddress(MapObject):
+    city = fields.String(param='CITY')
+
+
+@registry.register()
+class RegisteredPerson(MapObject):
+    name = fields.String(param='NAME')
+
+
+@registry.register()
+class RegisteredAddress(MapObject):
+    city = fields.String(param='CITY')
+'''
+
+
+class LazyRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.module = f'lazy_schemas_{self.id().rsplit(".", 1)[-1]}'
+
+        path = pathlib.Path(directory.name)
+        (path / f'{self.module}.py').write_text(LAZY_SCHEMAS)
+        dist_info = path / 'lazy_schemas-1.0.dist-info'
+        dist_info.mkdir()
+        (dist_info / 'METADATA').write_text(
+            'Metadata-Version: 2.1\nName: lazy-schemas\nVersion: 1.0\n'
+        )
+        (dist_info / 'entry_points.txt').write_text(
+            '[paramap.test_schemas]\n'
+            f'Person = {self.module}:LazyPerson\n'
+            f'LazyAddress = {self.module}:LazyAddress\n'
+        )
+
+        # schema modules register their schemas in the global registry
+        global_registry = patch.object(registry, 'registry', None)
+        global_registry.start()
+        self.addCleanup(global_registry.stop)
+
+        sys.path.insert(0, directory.name)
+        self.addCleanup(sys.path.remove, directory.name)
+        self.addCleanup(sys.modules.pop, self.module, None)
+
+    def test_register_path(self):
+        local_registry = registry.Registry()
+        local_registry.register_path(f'{self.module}:LazyPerson')
+        local_registry.register_path(
+            f'{self.module}:LazyAddress', name='Address'
+        )
+
+        self.assertNotIn(self.module, sys.modules)
+
+        schema = local_registry.get('LazyPerson')
+
+        self.assertIn(self.module, sys.modules)
+        self.assertIs(schema, sys.modules[self.module].LazyPerson)
+        self.assertEqual(
+            [schema.__name__ for schema in local_registry.match({})],
+            ['LazyAddress'],
+        )
+        self.assertEqual(
+            list(local_registry.map_all({'NAME': 'John'}, match=True)),
+            ['LazyPerson', 'Address'],
+        )
+        self.assertIsNone(local_registry.get('Missing'))
+
+    def test_register_entry_points(self):
+        local_registry = registry.Registry()
+        local_registry.register_entry_points('paramap.test_schemas')
+
+        self.assertNotIn(self.module, sys.modules)
+        self.assertEqual(
+            set(local_registry.required_parameters), {'NAME'}
+        )
+        self.assertEqual(
+            set(local_registry.schemas), {'Person', 'LazyAddress'}
+        )
+
+    def test_duplicates_and_errors(self):
+        local_registry = registry.Registry()
+        local_registry.register_path(f'{self.module}:LazyPerson')
+
+        with self.assertRaises(ValueError):
+            local_registry.register_path(f'{self.module}:LazyPerson')
+
+        with self.assertRaises(ValueError):
+            local_registry.register_path('no_colon')
+
+        local_registry.register_path('missing_module_name:Schema')
+
+        with self.assertRaises(ImportError):
+            local_registry.get('Schema')
+
+        # failed imports are retried on the next lookup
+        with self.assertRaises(ImportError):
+            list(local_registry)
+
+    def test_schema_registering_itself(self):
+        local_registry = registry.Registry()
+        local_registry.register_path(f'{self.module}:RegisteredPerson')
+
+        with self.assertRaises(ValueError):
+            local_registry.register(
+                type('RegisteredPerson', (MapObject,), {})
+            )
+
+        with patch.object(registry, 'registry', local_registry):
+            schema = local_registry.get('RegisteredPerson')
+
+        self.assertIs(
+            schema, sys.modules[self.module].RegisteredPerson
+        )
+        # other schemas of the module register themselves eagerly
+        self.assertEqual(
+            list(local_registry.schemas),
+            ['RegisteredPerson', 'RegisteredAddress'],
+        )
+
+    def test_direct_import_of_lazily_registered_schema(self):
+        local_registry = registry.Registry()
+        local_registry.register_path(f'{self.module}:RegisteredPerson')
+
+        with patch.object(registry, 'registry', local_registry):
+            module = importlib.import_module(self.module)
+
+        self.assertIs(
+            local_registry.get('RegisteredPerson'), module.RegisteredPerson
+        )
+        self.assertEqual(
+            list(local_registry.schemas),
+            ['RegisteredPerson', 'RegisteredAddress'],
+        )
+
+    def test_module_with_many_lazily_registered_schemas(self):
+        local_registry = registry.Registry()
+        local_registry.register_path(f'{self.module}:RegisteredPerson')
+        local_registry.register_path(f'{self.module}:RegisteredAddress')
+
+        with patch.object(registry, 'registry', local_registry):
+            person = local_registry.get('RegisteredPerson')
+
+        module = sys.modules[self.module]
+
+        self.assertIs(person, module.RegisteredPerson)
+        self.assertIs(
+            local_registry.get('RegisteredAddress'), module.RegisteredAddress
+        )
+        self.assertEqual(len(local_registry.schemas), 2)